@@ -0,0 +1,139 @@
+import os
+import shutil
+import subprocess
+import threading
+from lxc_tui.core import log_debug
+from lxc_tui import clock
+
+SESSION_NAME = "lxc-tui"
+WINDOW_PREFIX = "lxc-"
+
+
+detached_sessions = False
+
+
+def set_detached_sessions(enabled):
+    global detached_sessions
+    detached_sessions = enabled
+
+
+def detect_multiplexer(environ=None, which=shutil.which, detached=None):
+    """Multiplexer to open attach windows in, or None to attach in the foreground.
+
+    Outside tmux or screen a detached "lxc-tui" tmux session is only used when
+    asked for (--tmux-detached), since the user would not see it otherwise.
+    """
+    environ = os.environ if environ is None else environ
+    detached = detached_sessions if detached is None else detached
+    if environ.get("TMUX") and which("tmux"):
+        return "tmux"
+    if environ.get("STY") and which("screen"):
+        return "screen"
+    if detached and which("tmux"):
+        return "tmux-detached"
+    return None
+
+
+def _run(command, timeout=5):
+    return subprocess.run(
+        command,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        timeout=timeout,
+        start_new_session=True,
+    )
+
+
+class AttachManager:
+    """Opens lxc-attach sessions in tmux or screen windows and tracks which are open.
+
+    Inside tmux or screen a new window is opened in the current session. With
+    --tmux-detached and tmux installed but not running, windows go to a detached
+    "lxc-tui" session that can be joined with `tmux attach -t lxc-tui`. Without a
+    multiplexer, attach() returns False and the caller falls back to suspending
+    the TUI. sessions() never blocks: listing windows runs on a background thread.
+    """
+
+    def __init__(self, multiplexer=None, run=_run, ttl=2.0):
+        self.multiplexer = detect_multiplexer() if multiplexer is None else multiplexer
+        self.run = run
+        self.ttl = ttl
+        self.lock = threading.Lock()
+        self.cached_sessions = frozenset()
+        self.cached_at = None
+        self.refresher = None
+
+    @property
+    def available(self):
+        return bool(self.multiplexer)
+
+    def window_name(self, lxc_id):
+        return f"{WINDOW_PREFIX}{lxc_id}"
+
+    def attach_command(self, lxc_id):
+        attach = ["lxc-attach", "-n", lxc_id]
+        name = self.window_name(lxc_id)
+        if self.multiplexer == "tmux":
+            return ["tmux", "new-window", "-n", name] + attach
+        if self.multiplexer == "screen":
+            return ["screen", "-X", "screen", "-t", name] + attach
+        if self.multiplexer == "tmux-detached":
+            if self.run(["tmux", "has-session", "-t", SESSION_NAME]).returncode == 0:
+                return ["tmux", "new-window", "-d", "-t", SESSION_NAME, "-n", name] + attach
+            return ["tmux", "new-session", "-d", "-s", SESSION_NAME, "-n", name] + attach
+        return None
+
+    def attach(self, lxc_id):
+        try:
+            command = self.attach_command(lxc_id)
+            if command is None:
+                return False
+            log_debug(f"Opening attach session: {' '.join(command)}")
+            ok = self.run(command).returncode == 0
+        except (OSError, subprocess.SubprocessError) as e:
+            log_debug(f"Failed to open attach session for {lxc_id}: {e}")
+            return False
+        with self.lock:
+            self.cached_at = None
+        return ok
+
+    def list_windows(self):
+        if self.multiplexer in ("tmux", "tmux-detached"):
+            result = self.run(["tmux", "list-windows", "-a", "-F", "#{window_name}"])
+            return result.stdout.split() if result.returncode == 0 else []
+        if self.multiplexer == "screen":
+            result = self.run(["screen", "-Q", "windows"])
+            return result.stdout.split() if result.returncode == 0 else []
+        return []
+
+    def refresh(self, now=None):
+        now = clock.now() if now is None else now
+        try:
+            names = self.list_windows()
+        except (OSError, subprocess.SubprocessError) as e:
+            log_debug(f"Failed to list attach sessions: {e}")
+            names = []
+        sessions = frozenset(
+            name[len(WINDOW_PREFIX):]
+            for name in names
+            if name.startswith(WINDOW_PREFIX) and name != SESSION_NAME
+        )
+        with self.lock:
+            self.cached_sessions = sessions
+            self.cached_at = now
+        return sessions
+
+    def sessions(self, now=None):
+        """Last known open sessions; starts a background refresh once they are stale."""
+        if not self.available:
+            return frozenset()
+        now = clock.now() if now is None else now
+        with self.lock:
+            stale = self.cached_at is None or now - self.cached_at >= self.ttl
+            if stale and (self.refresher is None or not self.refresher.is_alive()):
+                self.refresher = threading.Thread(
+                    target=self.refresh, args=(now,), name="attach-sessions", daemon=True
+                )
+                self.refresher.start()
+            return self.cached_sessions
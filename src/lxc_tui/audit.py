@@ -0,0 +1,142 @@
+import getpass
+import json
+import os
+import threading
+import time
+from lxc_tui.core import log_debug
+from lxc_tui import clock
+from lxc_tui.panes import tail_file
+
+
+def default_audit_path():
+    base = os.environ.get("XDG_STATE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".local", "state"
+    )
+    return os.path.join(base, "lxc-tui", "audit.ndjson")
+
+
+def current_user():
+    try:
+        user = getpass.getuser()
+    except (KeyError, OSError):
+        user = str(os.getuid())
+    sudo_user = os.environ.get("SUDO_USER")
+    return f"{sudo_user} (as {user})" if sudo_user and sudo_user != user else user
+
+
+def command_target(command):
+    if "-n" in command[:-1]:
+        return command[command.index("-n") + 1]
+    if command and command[0] == "pct" and len(command) > 2:
+        return command[2]
+    return None
+
+
+class AuditLog:
+    """Append-only NDJSON audit trail written by a background thread.
+
+    record() only queues the entry. The writer wakes when entries arrive,
+    writes everything queued in one go and fsyncs at most once per
+    flush_interval, so a burst of bulk actions costs one fsync per batch.
+    """
+
+    def __init__(self, path, flush_interval=1.0):
+        self.path = path
+        self.flush_interval = flush_interval
+        self.user = current_user()
+        self.condition = threading.Condition()
+        self.pending = []
+        self.closed = False
+        self.closing = threading.Event()
+        self.written = 0
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        self.file = open(path, "a", encoding="utf-8")
+        self.thread = threading.Thread(target=self._writer, name="audit-writer", daemon=True)
+        self.thread.start()
+
+    def record(self, command, returncode, started, duration, lxc_id=None, action=None, error=None):
+        entry = {
+            "t": round(started, 3),
+            "user": self.user,
+            "id": lxc_id or command_target(command),
+            "action": action or command[0],
+            "cmd": list(command),
+            "rc": returncode,
+            "dur": round(duration, 3),
+        }
+        if error is not None:
+            entry["error"] = error
+        with self.condition:
+            if self.closed:
+                return
+            self.pending.append(entry)
+            self.condition.notify()
+
+    def _writer(self):
+        last_sync = 0.0
+        while True:
+            with self.condition:
+                while not self.pending and not self.closed:
+                    self.condition.wait()
+            wait = self.flush_interval - (clock.now() - last_sync)
+            if wait > 0:
+                clock.wait(self.closing, wait)
+            with self.condition:
+                batch, self.pending = self.pending, []
+                closed = self.closed
+            if batch:
+                try:
+                    self.file.write("".join(json.dumps(e, separators=(",", ":")) + "\n" for e in batch))
+                    self.file.flush()
+                    os.fsync(self.file.fileno())
+                    self.written += len(batch)
+                except (OSError, ValueError) as e:
+                    log_debug(f"Error writing audit log {self.path}: {e}")
+                last_sync = clock.now()
+            if closed:
+                return
+
+    def close(self):
+        with self.condition:
+            self.closed = True
+            self.condition.notify()
+        self.closing.set()
+        self.thread.join(timeout=5)
+        self.file.close()
+
+
+def read_audit(path, max_entries=500):
+    entries = []
+    for line in tail_file(path, max_entries):
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue
+    return entries
+
+
+def format_entry(entry):
+    stamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry.get("t", 0)))
+    if entry.get("error"):
+        rc = "error"
+    else:
+        rc = "timeout" if entry.get("rc") is None else f"rc={entry['rc']}"
+    error = f" {entry['error']}" if entry.get("error") else ""
+    return (
+        f"{stamp} {entry.get('user', '?'):<10} {entry.get('action', ''):<8} "
+        f"{entry.get('id') or '-':<6} {rc:<8} {entry.get('dur', 0):.2f}s{error}"
+    )
+
+
+audit_log = None
+
+
+def set_audit_log(log):
+    global audit_log
+    audit_log = log
+
+
+def record(command, returncode, started, duration, lxc_id=None, action=None, error=None):
+    """Audit one lifecycle command; returncode None with error set means it never started."""
+    if audit_log is not None:
+        audit_log.record(command, returncode, started, duration, lxc_id, action, error)
@@ -0,0 +1,144 @@
+import subprocess
+import threading
+from lxc_tui.core import log_debug
+from lxc_tui import lxc_utils
+
+
+class SubprocessBackend:
+    """Queries and commands through the lxc-* command line tools."""
+
+    name = "subprocess"
+
+    def get_lxc_info(self, include_stopped=False):
+        return lxc_utils.query_lxc_info(include_stopped)
+
+    def get_ips(self, lxc_id):
+        return lxc_utils.get_lxc_ips(lxc_id)
+
+    def get_state(self, lxc_id):
+        return lxc_utils.get_lxc_state(lxc_id)
+
+    def read_config(self, lxc_id):
+        return lxc_utils.read_config_file(lxc_id)
+
+    def spawn(self, command, output=False):
+        """Start command; with output=True its stdout and stderr are readable as text."""
+        if output:
+            return subprocess.Popen(
+                command,
+                start_new_session=True,
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                text=True,
+            )
+        return subprocess.Popen(
+            command,
+            start_new_session=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+
+
+class CallHandle:
+    """Popen-like handle for a backend call running on a worker thread."""
+
+    def __init__(self, command, func):
+        self.args = command
+        self.returncode = None
+        self._thread = threading.Thread(target=self._run, args=(func,), daemon=True)
+        self._thread.start()
+
+    def _run(self, func):
+        try:
+            self.returncode = 0 if func() else 1
+        except Exception as e:
+            log_debug(f"Backend call {' '.join(self.args)} failed: {e}")
+            self.returncode = 1
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self, timeout=None):
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        return self.returncode
+
+    def kill(self):
+        log_debug(f"Cannot kill in-process call {' '.join(self.args)}, abandoning it")
+
+
+class LiblxcBackend(SubprocessBackend):
+    """In-process backend built on the python3-lxc bindings.
+
+    Commands without a binding equivalent fall back to the command line tools.
+    """
+
+    name = "liblxc"
+    actions = {"lxc-start": "start", "lxc-stop": "stop"}
+
+    def __init__(self, lxc_module):
+        self.lxc = lxc_module
+
+    def get_ips(self, lxc_id):
+        return self.container_ips(self.lxc.Container(lxc_id))
+
+    def get_state(self, lxc_id):
+        return self.lxc.Container(lxc_id).state
+
+    def container_ips(self, container):
+        ipv4 = list(container.get_ips(family="inet") or [])
+        ipv6 = list(container.get_ips(family="inet6") or [])
+        return ", ".join(filter(None, ipv4 + ipv6))
+
+    def get_lxc_info(self, include_stopped=False):
+        lxc_info = []
+        try:
+            for lxc_id in self.lxc.list_containers():
+                container = self.lxc.Container(lxc_id)
+                status = container.state
+                if not include_stopped and status == "STOPPED":
+                    continue
+                if lxc_utils.ip_resolver is not None:
+                    ip_addresses = lxc_utils.resolve_ips(lxc_id, status)
+                elif status == "RUNNING":
+                    ip_addresses = self.container_ips(container)
+                else:
+                    ip_addresses = ""
+                unprivileged = (
+                    "true" if container.get_config_item("lxc.idmap") else "false"
+                )
+                lxc_info.append(
+                    (
+                        lxc_id,
+                        lxc_utils.read_hostname(lxc_id),
+                        status,
+                        ip_addresses,
+                        unprivileged,
+                    )
+                )
+        except Exception as e:
+            log_debug(f"Error getting LXC info from bindings: {e}")
+            return []
+        return lxc_info
+
+    def spawn(self, command, output=False):
+        action = self.actions.get(command[0])
+        if action is None or "-n" not in command[:-1]:
+            return super().spawn(command, output)
+        lxc_id = command[command.index("-n") + 1]
+        container = self.lxc.Container(lxc_id)
+        return CallHandle(command, getattr(container, action))
+
+
+def select_backend(preference="auto"):
+    if preference == "subprocess":
+        return SubprocessBackend()
+    try:
+        import lxc
+    except ImportError:
+        if preference == "liblxc":
+            log_debug("python3-lxc requested but not importable, using subprocess")
+        return SubprocessBackend()
+    return LiblxcBackend(lxc)
@@ -0,0 +1,76 @@
+import json
+import os
+from lxc_tui.core import log_debug
+from lxc_tui import clock
+from lxc_tui.ip_discovery import settled_ips
+
+CACHE_VERSION = 1
+
+
+def default_cache_path():
+    base = os.environ.get("XDG_CACHE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".cache"
+    )
+    return os.path.join(base, "lxc-tui", "inventory.json")
+
+
+def save_snapshot(path, lxc_info, include_stopped, saved_at=None):
+    if not lxc_info:
+        return False
+    payload = {
+        "version": CACHE_VERSION,
+        "saved_at": clock.now() if saved_at is None else saved_at,
+        "include_stopped": include_stopped,
+        "containers": [list(container) for container in lxc_info],
+    }
+    tmp_path = f"{path}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w") as cache_file:
+            json.dump(payload, cache_file, separators=(",", ":"))
+        os.replace(tmp_path, path)
+        return True
+    except OSError as e:
+        log_debug(f"Error writing inventory cache {path}: {e}")
+        return False
+
+
+def load_snapshot(path, include_stopped):
+    """Return (lxc_info, saved_at) from the cache, or ([], None) if unusable."""
+    try:
+        with open(path) as cache_file:
+            payload = json.load(cache_file)
+        if payload.get("version") != CACHE_VERSION:
+            return [], None
+        lxc_info = [tuple(container) for container in payload["containers"]]
+        if not include_stopped:
+            lxc_info = [c for c in lxc_info if c[2] != "STOPPED"]
+        return lxc_info, payload["saved_at"]
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        log_debug(f"Inventory cache unavailable: {e}")
+        return [], None
+
+
+class InventoryCache:
+    """Writes the inventory snapshot to disk after each refresh that changed it.
+
+    Running containers whose IPs are still being looked up are saved with
+    their last known addresses rather than a placeholder.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.ips = {}
+
+    def load(self, include_stopped):
+        lxc_info, saved_at = load_snapshot(self.path, include_stopped)
+        self.ips.update((container[0], container[3]) for container in lxc_info)
+        return lxc_info, saved_at
+
+    def listener(self, lxc_info, include_stopped):
+        containers = []
+        for container in lxc_info:
+            ip_addresses = settled_ips(container[2], container[3], self.ips.get(container[0], ""))
+            self.ips[container[0]] = ip_addresses
+            containers.append(tuple(container[:3]) + (ip_addresses,) + tuple(container[4:]))
+        save_snapshot(self.path, containers, include_stopped)
@@ -0,0 +1,111 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class SystemClock:
+    """Wall-clock time and real sleeps."""
+
+    def time(self):
+        return time.time()
+
+    def sleep(self, seconds):
+        time.sleep(seconds)
+
+    def wait(self, event, timeout=None):
+        return event.wait(timeout)
+
+
+class FakeClock:
+    """Virtual time for tests.
+
+    On the thread that created it nothing ever blocks: sleep() and wait() move
+    time forward at once and run the callbacks scheduled with
+    call_at()/call_later() that fall due on the way, in time order. A
+    scheduled stop_event.set() is how a test ends a loop after, say, an hour of
+    simulated refreshes. Background threads (the refresh loop, scanners)
+    instead block in sleep() and wait() until that thread has moved time past
+    their deadline, so only one thread ever drives the clock.
+    """
+
+    def __init__(self, start=0.0):
+        self.current = start
+        self.timers = []
+        self.counter = itertools.count()
+        self.lock = threading.RLock()
+        self.moved = threading.Condition(self.lock)
+        self.driver = threading.get_ident()
+        self.sleeps = 0
+
+    def time(self):
+        return self.current
+
+    def call_at(self, when, callback):
+        with self.lock:
+            heapq.heappush(self.timers, (when, next(self.counter), callback))
+
+    def call_later(self, delay, callback):
+        self.call_at(self.current + delay, callback)
+
+    def _run_until(self, deadline, event=None):
+        while event is None or not event.is_set():
+            with self.lock:
+                if not self.timers or self.timers[0][0] > deadline:
+                    if deadline != float("inf"):
+                        self.current = max(self.current, deadline)
+                        self.moved.notify_all()
+                    return
+                when, _, callback = heapq.heappop(self.timers)
+                self.current = max(self.current, when)
+                self.moved.notify_all()
+            callback()
+
+    def advance(self, seconds):
+        self._run_until(self.current + max(0.0, seconds))
+
+    def _follow(self, event, timeout):
+        with self.lock:
+            deadline = None if timeout is None else self.current + max(0.0, timeout)
+            while not event.is_set() and (deadline is None or self.current < deadline):
+                # Short real-time waits so an event set from outside is noticed too
+                self.moved.wait(0.01)
+        return event.is_set()
+
+    def sleep(self, seconds):
+        if threading.get_ident() != self.driver:
+            self._follow(threading.Event(), seconds)
+            return
+        self.sleeps += 1
+        self.advance(seconds)
+
+    def wait(self, event, timeout=None):
+        if event.is_set():
+            return True
+        if threading.get_ident() != self.driver:
+            return self._follow(event, timeout)
+        if timeout is None and not self.timers:
+            raise RuntimeError("FakeClock.wait would block forever: nothing scheduled")
+        deadline = float("inf") if timeout is None else self.current + max(0.0, timeout)
+        self._run_until(deadline, event)
+        return event.is_set()
+
+
+current = SystemClock()
+
+
+def set_clock(clock):
+    global current
+    current = clock
+
+
+def now():
+    return current.time()
+
+
+def sleep(seconds):
+    current.sleep(seconds)
+
+
+def wait(event, timeout=None):
+    return current.wait(event, timeout)
@@ -0,0 +1,141 @@
+import subprocess
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from lxc_tui.core import log_debug
+from lxc_tui import audit, clock, lxc_utils
+
+COMMAND_TIMEOUT = 15
+
+ACTIONS = {
+    "start": ("Starting", "Started"),
+    "stop": ("Stopping", "Stopped"),
+    "restart": ("Restarting", "Restarted"),
+    "snapshot": ("Snapshotting", "Snapshotted"),
+}
+
+
+def action_commands(action, lxc_id):
+    """Commands for a lifecycle action; snapshots run as jobs instead (snapshots.shared_store)."""
+    if action == "snapshot":
+        raise ValueError("Snapshots run as jobs, not lifecycle commands")
+    if action == "restart":
+        return [["lxc-stop", "-n", lxc_id], ["lxc-start", "-n", lxc_id]]
+    return [[f"lxc-{action}", "-n", lxc_id]]
+
+
+class CommandResult:
+    def __init__(self, lxc_id, label, ok, state, duration):
+        self.lxc_id = lxc_id
+        self.label = label
+        self.ok = ok
+        self.state = state
+        self.duration = duration
+
+    def __repr__(self):
+        return f"CommandResult({self.lxc_id!r}, {self.label!r}, ok={self.ok}, state={self.state!r})"
+
+
+def run_command(command, timeout=COMMAND_TIMEOUT, lxc_id=None, label=None):
+    log_debug(f"Executing command: {' '.join(command)}")
+    started = clock.now()
+    try:
+        proc = lxc_utils.spawn_command(command)
+    except OSError as e:
+        log_debug(f"Command failed to start: {e}")
+        audit.record(command, None, started, clock.now() - started, lxc_id, label, error=str(e))
+        return False
+    try:
+        proc.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        log_debug(f"Command timed out: {' '.join(command)}")
+        proc.kill()
+        audit.record(command, None, started, clock.now() - started, lxc_id, label)
+        return False
+    log_debug(f"Command completed with return code {proc.returncode}")
+    audit.record(command, proc.returncode, started, clock.now() - started, lxc_id, label)
+    return proc.returncode == 0
+
+
+def update_container_record(lxc_info, lxc_id, state, show_stopped):
+    for idx, container in enumerate(lxc_info):
+        if container[0] != lxc_id:
+            continue
+        if state == "STOPPED" and not show_stopped:
+            del lxc_info[idx]
+            return True
+        lxc_id, hostname, status, ip_addresses, unprivileged = container
+        if state != "RUNNING":
+            ip_addresses = ""
+        lxc_info[idx] = (lxc_id, hostname, state, ip_addresses, unprivileged)
+        return container != lxc_info[idx]
+    return False
+
+
+class CommandService:
+    """Runs lifecycle commands on a reusable worker pool.
+
+    Submitting a command sequence that is already in flight for the same container
+    returns the existing future instead of running it again. When a sequence
+    finishes, only that container's state is re-read, and the result is queued for
+    the main loop to apply with drain().
+    """
+
+    def __init__(self, workers=4, timeout=COMMAND_TIMEOUT):
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.in_flight = {}
+        self.results = deque()
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="lxc-command"
+        )
+
+    def submit(self, lxc_id, commands, label):
+        key = (lxc_id, tuple(tuple(command) for command in commands))
+        with self.lock:
+            future = self.in_flight.get(key)
+            if future is not None:
+                log_debug(f"Coalescing duplicate {label} for {lxc_id}")
+                return future
+            future = self.executor.submit(self._run, key, lxc_id, commands, label)
+            self.in_flight[key] = future
+            return future
+
+    def pending(self, lxc_id=None):
+        with self.lock:
+            return [
+                key for key in self.in_flight if lxc_id is None or key[0] == lxc_id
+            ]
+
+    def _run(self, key, lxc_id, commands, label):
+        started = clock.now()
+        ok = False
+        state = None
+        try:
+            ok = all(run_command(command, self.timeout, lxc_id, label) for command in commands)
+            state = lxc_utils.lookup_state(lxc_id)
+        except Exception as e:
+            log_debug(f"Error running {label} for {lxc_id}: {e}")
+        result = CommandResult(lxc_id, label, ok, state, clock.now() - started)
+        with self.lock:
+            self.in_flight.pop(key, None)
+            self.results.append(result)
+        return result
+
+    def drain(self):
+        drained = []
+        with self.lock:
+            while self.results:
+                drained.append(self.results.popleft())
+        return drained
+
+    def apply(self, lxc_info, show_stopped):
+        """Apply finished results to lxc_info; return them for status reporting."""
+        results = self.drain()
+        for result in results:
+            if result.state:
+                update_container_record(lxc_info, result.lxc_id, result.state, show_stopped)
+        return results
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False)
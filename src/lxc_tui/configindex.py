@@ -0,0 +1,239 @@
+import fnmatch
+import os
+import threading
+from collections import defaultdict
+from lxc_tui.core import log_debug
+from lxc_tui.groups import CONFIG_DIR
+from lxc_tui import lxc_utils
+
+GLOB_CHARS = "*?["
+
+
+def parse_config_text(text):
+    """Main-section key/value pairs of a Proxmox container config (snapshots skipped)."""
+    config = {}
+    for line in (text or "").splitlines():
+        if line.startswith("["):
+            break
+        if line.startswith("#") or ":" not in line:
+            continue
+        key, value = line.split(":", 1)
+        config[key.strip()] = value.strip()
+    return config
+
+
+def config_terms(config):
+    """Index terms for a parsed config.
+
+    Besides the whole "key: value" line, option lists are split so that
+    "features: nesting=1,keyctl=1" also yields features.nesting=1 and
+    nesting=1, and "mp0: /mnt/backup,mp=/data" yields mp0=/mnt/backup and
+    mp0.mp=/data.
+    """
+    terms = set()
+    for key, value in config.items():
+        terms.add((key, value))
+        if "," not in value and "=" not in value:
+            continue
+        for part in value.split(","):
+            option, sep, option_value = part.partition("=")
+            if not sep:
+                terms.add((key, part))
+                continue
+            terms.add((f"{key}.{option}", option_value))
+            terms.add((option, option_value))
+    return terms
+
+
+def _matches(pattern, text):
+    if any(char in pattern for char in GLOB_CHARS):
+        return fnmatch.fnmatchcase(text, pattern)
+    return pattern == text
+
+
+class ConfigIndex:
+    """Inverted index of container configs: key -> value -> container ids.
+
+    refresh() only stats the config directory; files whose mtime changed are
+    re-read through lxc_utils.read_config and their postings replaced, so
+    queries never touch /etc/pve.
+    """
+
+    def __init__(self, config_dir=CONFIG_DIR, read=None):
+        self.config_dir = config_dir
+        if read is None:
+            read = lxc_utils.read_config if config_dir == CONFIG_DIR else self.read_file
+        self.read = read
+        self.lock = threading.Lock()
+        self.mtimes = {}
+        self.configs = {}
+        self.terms = {}
+        self.postings = defaultdict(lambda: defaultdict(set))
+        self.reads = 0
+
+    def read_file(self, lxc_id):
+        try:
+            with open(os.path.join(self.config_dir, f"{lxc_id}.conf")) as f:
+                return f.read()
+        except OSError as e:
+            log_debug(f"Error reading config of {lxc_id}: {e}")
+            return None
+
+    def _remove(self, lxc_id):
+        for key, value in self.terms.pop(lxc_id, ()):
+            values = self.postings[key]
+            values[value].discard(lxc_id)
+            if not values[value]:
+                del values[value]
+            if not values:
+                del self.postings[key]
+        self.configs.pop(lxc_id, None)
+
+    def _add(self, lxc_id, config):
+        terms = config_terms(config)
+        for key, value in terms:
+            self.postings[key][value].add(lxc_id)
+        self.terms[lxc_id] = terms
+        self.configs[lxc_id] = config
+
+    def refresh(self):
+        """Re-index changed configs; return how many files were re-read."""
+        seen = {}
+        try:
+            with os.scandir(self.config_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".conf"):
+                        try:
+                            seen[entry.name[:-5]] = entry.stat().st_mtime_ns
+                        except OSError:
+                            continue
+        except OSError as e:
+            log_debug(f"Cannot list {self.config_dir}: {e}")
+        changed = 0
+        with self.lock:
+            for lxc_id in [i for i in self.mtimes if i not in seen]:
+                self._remove(lxc_id)
+                del self.mtimes[lxc_id]
+            for lxc_id, mtime in seen.items():
+                if self.mtimes.get(lxc_id) == mtime:
+                    continue
+                text = self.read(lxc_id)
+                self.reads += 1
+                changed += 1
+                self._remove(lxc_id)
+                if text is None:
+                    self.mtimes.pop(lxc_id, None)
+                    continue
+                self._add(lxc_id, parse_config_text(text))
+                self.mtimes[lxc_id] = mtime
+        if changed:
+            log_debug(f"Config index: re-read {changed} of {len(seen)} configs")
+        return changed
+
+    def ids(self):
+        with self.lock:
+            return set(self.configs)
+
+    def match(self, term):
+        """Container ids matching "key=value", "key!=value" or "key"; globs allowed."""
+        negate = "!=" in term
+        key, sep, value = term.partition("!=" if negate else "=")
+        with self.lock:
+            found = set()
+            for indexed_key in self.postings:
+                if not _matches(key, indexed_key):
+                    continue
+                for indexed_value, ids in self.postings[indexed_key].items():
+                    if not sep or _matches(value, indexed_value):
+                        found |= ids
+            return set(self.configs) - found if negate else found
+
+    def query(self, text):
+        """Ids matching every whitespace-separated term, sorted numerically."""
+        terms = text.split()
+        if not terms:
+            raise ValueError("Empty query")
+        result = None
+        for term in terms:
+            ids = self.match(term)
+            result = ids if result is None else result & ids
+        return sorted(result, key=_id_order)
+
+    def diff(self, a, b):
+        """(key, value in a, value in b) for every key whose values differ."""
+        with self.lock:
+            if a not in self.configs or b not in self.configs:
+                missing = a if a not in self.configs else b
+                raise ValueError(f"No config for {missing}")
+            first, second = self.configs[a], self.configs[b]
+            keys = sorted(set(first) | set(second))
+            return [(key, first.get(key), second.get(key)) for key in keys if first.get(key) != second.get(key)]
+
+    def drift(self):
+        """Keys set on several containers with differing values: {key: {value: ids}}.
+
+        Keys where every container has its own value (hostname, MAC
+        addresses) are identity, not drift, and are left out.
+        """
+        by_key = defaultdict(lambda: defaultdict(list))
+        with self.lock:
+            for lxc_id in sorted(self.configs, key=_id_order):
+                for key, value in self.configs[lxc_id].items():
+                    by_key[key][value].append(lxc_id)
+        report = {}
+        for key, values in sorted(by_key.items()):
+            holders = sum(len(ids) for ids in values.values())
+            if 1 < len(values) < holders:
+                report[key] = dict(values)
+        return report
+
+
+def _id_order(lxc_id):
+    return (0, int(lxc_id), "") if lxc_id.isdigit() else (1, 0, lxc_id)
+
+
+def run_query(index, text):
+    """Lines answering a query view/report request: "diff A B" or search terms."""
+    words = text.split()
+    if words and words[0] == "diff":
+        if len(words) != 3:
+            raise ValueError("Usage: diff <id> <id>")
+        changes = index.diff(words[1], words[2])
+        lines = [f"{len(changes)} difference(s) between {words[1]} and {words[2]}", ""]
+        for key, first, second in changes:
+            lines.append(f"{key}:")
+            lines.append(f"  {words[1]}: {'-' if first is None else first}")
+            lines.append(f"  {words[2]}: {'-' if second is None else second}")
+        return lines
+    ids = index.query(text)
+    lines = [f"{len(ids)} container(s) match {text}", ""]
+    for lxc_id in ids:
+        lines.append(f"{lxc_id:<6} {index.configs.get(lxc_id, {}).get('hostname', '')}")
+    return lines
+
+
+def drift_lines(index):
+    lines = []
+    for key, values in index.drift().items():
+        lines.append(f"{key}:")
+        for value, ids in sorted(values.items(), key=lambda item: -len(item[1])):
+            lines.append(f"  {len(ids):>4} x {value}: {', '.join(ids)}")
+    return lines or ["No config drift found"]
+
+
+def run_report(queries, config_dir=CONFIG_DIR, out=None):
+    """Headless --report: answer each query, or print the drift report if there are none."""
+    index = ConfigIndex(config_dir)
+    index.refresh()
+    lines = [f"Indexed {len(index.ids())} container configs from {config_dir}", ""]
+    try:
+        if not queries:
+            lines += drift_lines(index)
+        for text in queries:
+            lines += run_query(index, text) + [""]
+    except ValueError as e:
+        lines.append(f"Error: {e}")
+        print("\n".join(lines), file=out)
+        return 1
+    print("\n".join(lines), file=out)
+    return 0
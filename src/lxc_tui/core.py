@@ -1,6 +1,8 @@
 import threading
 import curses
 import time
+from collections import deque
+from lxc_tui.clock import now as current_time
 
 screen_lock = threading.Lock()
 DEBUG = False
@@ -12,6 +14,33 @@ def log_debug(message):
             debug_file.write(f"{time.ctime()}: {message}\n")
 
 
+class ByteCounter:
+    """Counts bytes handed to curses, bucketed per second for a sliding window."""
+
+    def __init__(self, window=60, clock=current_time):
+        self.window = window
+        self.clock = clock
+        self.total = 0
+        self.buckets = deque()
+
+    def add(self, count, now=None):
+        second = int(self.clock() if now is None else now)
+        self.total += count
+        if self.buckets and self.buckets[-1][0] == second:
+            self.buckets[-1][1] += count
+        else:
+            self.buckets.append([second, count])
+        while self.buckets and self.buckets[0][0] <= second - self.window:
+            self.buckets.popleft()
+
+    def recent(self, now=None):
+        second = int(self.clock() if now is None else now)
+        return sum(count for stamp, count in self.buckets if stamp > second - self.window)
+
+
+output_bytes = ByteCounter()
+
+
 def safe_addstr(stdscr, y, x, text, attr=0):
     with screen_lock:
         log_debug(f"Acquiring screen_lock for safe_addstr at ({y}, {x})")
@@ -19,6 +48,7 @@ def safe_addstr(stdscr, y, x, text, attr=0):
             max_len = curses.COLS - x
             if len(text) > max_len:
                 text = text[:max_len]
+            output_bytes.add(len(text.encode("utf-8")))
             try:
                 stdscr.addstr(y, x, text, attr)
             except curses.error as e:
@@ -43,3 +73,47 @@ class Plugin:
         operation_done_event,
     ):
         raise NotImplementedError("Plugin must implement execute method")
+
+
+class IsolatedPlugin(Plugin):
+    """Plugin run by the plugin host, in a worker process unless plugins are trusted.
+
+    run() gets a read-only PluginSnapshot and returns or yields commands:
+    ("action", action, lxc_id), ("notify", text), ("panel", title, lines) or
+    ("select", lxc_id). It never sees the screen or the live container list,
+    and it is killed if it runs longer than budget seconds.
+    """
+
+    budget = 5.0
+
+    def run(self, snapshot):
+        raise NotImplementedError("Isolated plugin must implement run method")
+
+
+class AppContext:
+    """Shared services handed to the main loop, refresh thread and event handler."""
+
+    def __init__(self):
+        self.history = None
+        self.cache = None
+        self.panes = None
+        self.attach = None
+        self.commands = None
+        self.resize = None
+        self.frames = None
+        self.netstats = None
+        self.disk = None
+        self.health = None
+        self.plugin_host = None
+        self.config_index = None
+        self.pending_attach = set()
+        self.listeners = []
+        self.show_stopped = False
+        self.last_refresh = None
+
+    def notify_refresh(self, lxc_info, include_stopped):
+        for listener in self.listeners:
+            try:
+                listener(lxc_info, include_stopped)
+            except Exception as e:
+                log_debug(f"Refresh listener {listener} failed: {e}")
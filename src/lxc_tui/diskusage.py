@@ -0,0 +1,191 @@
+import os
+import shutil
+import subprocess
+import threading
+from lxc_tui.core import log_debug
+from lxc_tui import clock
+from lxc_tui.groups import CONFIG_DIR, raw_lxc_key
+from lxc_tui.metrics import format_bytes
+
+LXC_ROOT = "/var/lib/lxc"
+PENDING = "..."
+
+
+def resolve_rootfs(lxc_id, config_dir=CONFIG_DIR, lxc_root=LXC_ROOT):
+    """Return a directory holding the container's root filesystem, or None.
+
+    lxc.rootfs.path wins when it names a directory (with or without the "dir:"
+    prefix); otherwise <lxc_root>/<id>/rootfs, where Proxmox mounts the rootfs
+    volume of a running container.
+    """
+    for config in (os.path.join(config_dir, f"{lxc_id}.conf"), os.path.join(lxc_root, lxc_id, "config")):
+        try:
+            with open(config) as f:
+                for line in f:
+                    if line.startswith("["):
+                        break
+                    raw = raw_lxc_key(line)
+                    if raw is not None and raw[0] == "lxc.rootfs.path":
+                        path = raw[1]
+                        path = path[4:] if path.startswith("dir:") else path
+                        if os.path.isdir(path):
+                            return path
+        except OSError:
+            continue
+    path = os.path.join(lxc_root, lxc_id, "rootfs")
+    return path if os.path.isdir(path) else None
+
+
+class DirectoryCache:
+    """Bytes used by the files directly inside each directory of one tree, keyed on mtime.
+
+    A directory's mtime changes when entries are added, removed or renamed, but
+    not when something deeper in the tree changes, so every pass still lstat()s
+    each directory; there is no way to skip a subtree without inotify. What is
+    saved is the rest: only directories whose mtime changed are listed and have
+    their files stat()ed, so a pass over D directories and F files costs D stats
+    instead of D listings plus F stats. Files growing in place do not touch the
+    mtime; a full rescan every few passes picks those up.
+    """
+
+    def __init__(self):
+        self.entries = {}
+
+    def listing(self, path, mtime, full=False):
+        cached = self.entries.get(path)
+        if cached is not None and cached[0] == mtime and not full:
+            return cached[1], cached[2]
+        files = 0
+        subdirs = []
+        with os.scandir(path) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+                    else:
+                        files += entry.stat(follow_symlinks=False).st_blocks * 512
+                except OSError:
+                    continue
+        self.entries[path] = (mtime, files, tuple(subdirs))
+        return files, subdirs
+
+    def total(self, root, full=False):
+        """Disk usage of the tree under root, staying on root's filesystem."""
+        try:
+            device = os.lstat(root).st_dev
+        except OSError:
+            return None
+        seen = set()
+        total = 0
+        stack = [root]
+        while stack:
+            path = stack.pop()
+            try:
+                st = os.lstat(path)
+                if st.st_dev != device:
+                    continue
+                files, subdirs = self.listing(path, st.st_mtime_ns, full)
+            except OSError as e:
+                log_debug(f"Skipping {path}: {e}")
+                continue
+            seen.add(path)
+            total += files
+            stack.extend(subdirs)
+        if len(seen) < len(self.entries):
+            self.entries = {path: self.entries[path] for path in seen if path in self.entries}
+        return total
+
+
+def lower_priority():
+    """Drop the calling thread to nice 19 and the idle I/O class where possible."""
+    tid = threading.get_native_id()
+    try:
+        os.setpriority(os.PRIO_PROCESS, tid, 19)
+    except (AttributeError, OSError) as e:
+        log_debug(f"Could not lower scanner CPU priority: {e}")
+    if shutil.which("ionice"):
+        try:
+            subprocess.run(
+                ["ionice", "-c", "3", "-p", str(tid)],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=5,
+            )
+        except (OSError, subprocess.SubprocessError) as e:
+            log_debug(f"Could not lower scanner I/O priority: {e}")
+
+
+class DiskScanner:
+    """Background, low-priority rootfs usage scanner feeding the DISK column.
+
+    Containers are scanned one after another; each result is published as soon
+    as it is ready, so the column fills in while a pass is still running.
+    """
+
+    def __init__(self, config_dir=CONFIG_DIR, lxc_root=LXC_ROOT, interval=300.0, full_every=12):
+        self.config_dir = config_dir
+        self.lxc_root = lxc_root
+        self.interval = interval
+        self.full_every = full_every
+        self.caches = {}
+        self.lock = threading.Lock()
+        self.lxc_ids = []
+        self.usage = {}
+        self.version = 0
+        self.passes = 0
+        self.wake = threading.Event()
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def listener(self, lxc_info, include_stopped):
+        with self.lock:
+            known = set(self.lxc_ids)
+            self.lxc_ids = [container[0] for container in lxc_info]
+        if not known.issuperset(self.lxc_ids):
+            self.wake.set()
+
+    def get(self, lxc_id):
+        with self.lock:
+            usage = self.usage.get(lxc_id, PENDING)
+        return usage if isinstance(usage, str) else format_bytes(usage)
+
+    def scan_once(self):
+        full = self.full_every and self.passes % self.full_every == 0
+        with self.lock:
+            lxc_ids = list(self.lxc_ids)
+        scanned = set()
+        for lxc_id in lxc_ids:
+            if self.stop_event.is_set():
+                return
+            rootfs = resolve_rootfs(lxc_id, self.config_dir, self.lxc_root)
+            total = None
+            if rootfs:
+                scanned.add(rootfs)
+                cache = self.caches.setdefault(rootfs, DirectoryCache())
+                total = cache.total(rootfs, full)
+            usage = "" if total is None else total
+            with self.lock:
+                if self.usage.get(lxc_id) != usage:
+                    self.usage[lxc_id] = usage
+                    self.version += 1
+        # Drop trees of containers that are gone or whose rootfs moved
+        self.caches = {rootfs: cache for rootfs, cache in self.caches.items() if rootfs in scanned}
+        self.passes += 1
+
+    def run(self):
+        lower_priority()
+        while not self.stop_event.is_set():
+            self.wake.clear()
+            try:
+                self.scan_once()
+            except Exception as e:
+                log_debug(f"Disk scan failed: {e}")
+            clock.wait(self.wake, self.interval)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="disk-scanner", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.wake.set()
@@ -1,19 +1,263 @@
 import curses
 import subprocess
-import threading
-import time
-from lxc_tui.core import safe_addstr, log_debug
-from lxc_tui.lxc_utils import execute_lxc_command, get_lxc_info
+from lxc_tui.core import safe_addstr, log_debug, IsolatedPlugin
+from lxc_tui.notifications import notify, SUCCESS, WARNING, ERROR
+from lxc_tui.lxc_utils import get_lxc_info
+from lxc_tui.commands import ACTIONS, action_commands
+from lxc_tui.snapshots import new_snapshot_name, shared_store
+from lxc_tui.layout import cycle_split_mode
+from lxc_tui.groups import view as group_view
+from lxc_tui import palette, tracing
+from lxc_tui.plugin_host import make_snapshot, may_execute
+from lxc_tui.configindex import run_query, drift_lines
+from lxc_tui.audit import default_audit_path
 from lxc_tui.ui_components import (
     display_container_list,
     update_navigation_bar,
     update_highlighted_row,
     show_info,
     show_help,
-    animate_indicator,
+    show_history,
+    show_notifications,
+    show_audit,
+    show_scroll_panel,
+    show_log_search,
+    show_log_tail,
+    read_line,
+    draw_panel,
+    apply_resize,
+    clear_screen,
+    invalidate_status_line,
+    draw_status_line,
 )
 
 
+def attach_to_container(stdscr, lxc_id, context=None):
+    if tracing.replaying:
+        notify(f"Not attaching to {lxc_id}: replaying a trace", WARNING)
+        return
+    manager = context.attach if context is not None else None
+    if manager is not None and manager.available:
+        if manager.attach(lxc_id):
+            notify(f"Opened {manager.multiplexer} window {manager.window_name(lxc_id)}", SUCCESS)
+            return
+        log_debug(f"Multiplexer attach failed for {lxc_id}, suspending TUI instead")
+    clear_screen(stdscr)
+    stdscr.refresh()
+    log_debug(f"Attaching to container {lxc_id}")
+    subprocess.run(["lxc-attach", "-n", lxc_id])
+
+
+def prompt_choice(stdscr, prompt, choices=None):
+    safe_addstr(stdscr, curses.LINES - 2, 0, " " * (curses.COLS - 1), curses.color_pair(0))
+    safe_addstr(stdscr, curses.LINES - 2, 0, prompt, curses.color_pair(4))
+    invalidate_status_line()
+    stdscr.refresh()
+    stdscr.nodelay(False)
+    while True:
+        choice = stdscr.getch()
+        if choices is None or choice in choices:
+            break
+    stdscr.nodelay(True)
+    return choice
+
+
+def confirm_action(stdscr, prompt):
+    return prompt_choice(stdscr, prompt) in [ord("y"), ord("Y")]
+
+
+def full_listing(lxc_info, show_stopped):
+    """Every container, stopped ones included, for resolving targets typed by the user."""
+    if show_stopped:
+        return lxc_info
+    return get_lxc_info(include_stopped=True) or lxc_info
+
+
+def run_palette(stdscr, lxc_info, context=None):
+    text = read_line(stdscr, ":", palette.history)
+    if not text:
+        return
+    service = context.commands if context is not None else None
+    if service is None:
+        notify("The command palette needs the background command service", ERROR)
+        return
+    try:
+        plan = palette.build_plan(text, full_listing(lxc_info, context.show_stopped), group_view.index)
+    except ValueError as e:
+        notify(str(e), ERROR)
+        return
+    if not palette.plan_size(plan):
+        notify(f"Nothing to do for '{text}'", WARNING)
+        return
+    lines = [f"Plan for: {text}", ""] + palette.describe_plan(plan) + ["", "Run this plan? (y/n)"]
+    draw_panel(stdscr, lines, curses.color_pair(4), 50)
+    stdscr.nodelay(False)
+    choice = stdscr.getch()
+    stdscr.nodelay(True)
+    if choice in [ord("y"), ord("Y")]:
+        palette.run_plan(plan, service)
+        notify(f"Running plan: {palette.plan_size(plan)} operation(s)", key="plan")
+    else:
+        notify("Plan canceled")
+
+
+tail_targets = []
+
+
+def run_log_tail(stdscr, lxc_info, current_row, pause_event, show_stopped=False):
+    text = read_line(stdscr, "Tail (ids, 101-120, tag:, state:, all; empty for selected): ", tail_targets)
+    if text is None:
+        return
+    try:
+        if text.strip():
+            containers = full_listing(lxc_info, show_stopped)
+            lxc_ids = [c[0] for c in palette.resolve_targets(text.split(), containers, group_view.index)]
+        else:
+            lxc_ids = [lxc_info[current_row][0]] if current_row < len(lxc_info) else []
+    except ValueError as e:
+        notify(str(e), ERROR)
+        return
+    if not lxc_ids:
+        notify(f"No containers match '{text}'", WARNING)
+        return
+    show_log_tail(stdscr, lxc_ids, pause_event)
+
+
+config_queries = []
+
+
+def run_config_query(stdscr, pause_event, context=None):
+    index = context.config_index if context is not None else None
+    if index is None:
+        notify("Config queries need the config index", ERROR)
+        return
+    text = read_line(stdscr, "Config (key=value, key!=value, diff A B; empty for drift): ", config_queries)
+    if text is None:
+        return
+    index.refresh()
+    try:
+        if text.strip():
+            lines = run_query(index, text)
+        else:
+            lines = [f"Config drift across {len(index.ids())} containers", ""] + drift_lines(index)
+    except ValueError as e:
+        notify(str(e), ERROR)
+        return
+    show_scroll_panel(stdscr, lines[0], lines[2:] or [""], pause_event, 70)
+
+
+def report_result(stdscr, result):
+    if result.ok:
+        notify(f"{ACTIONS[result.label][1]} {result.lxc_id}", SUCCESS, key=f"action {result.lxc_id}")
+    else:
+        notify(f"Failed to {result.label} {result.lxc_id}", ERROR, key=f"action {result.lxc_id}")
+
+
+def run_action(
+    stdscr,
+    lxc_info,
+    current_row,
+    show_stopped,
+    lxc_id,
+    action,
+    operation_done_event,
+    context=None,
+):
+    if action == "snapshot":
+        try:
+            shared_store().create(lxc_id, new_snapshot_name())
+        except (RuntimeError, ValueError) as e:
+            notify(f"Cannot snapshot {lxc_id}: {e}", ERROR, key=f"action {lxc_id}")
+            return
+        notify(f"{ACTIONS[action][0]} {lxc_id}...", key=f"action {lxc_id}")
+        return
+    service = context.commands if context is not None else None
+    if service is None:
+        notify(f"Cannot {action} {lxc_id} without the background command service", ERROR)
+        return
+    service.submit(lxc_id, action_commands(action, lxc_id), action)
+    notify(f"{ACTIONS[action][0]} {lxc_id}...", key=f"action {lxc_id}")
+
+
+def apply_plugin_command(
+    stdscr,
+    plugin,
+    command,
+    lxc_info,
+    current_row,
+    show_stopped,
+    pause_event,
+    operation_done_event,
+    context=None,
+):
+    """Carry out one command sent back by an isolated plugin; return the new row."""
+    kind = command[0]
+    name = plugin.description
+    if kind == "error":
+        notify(f"Plugin {name}: {command[1]}", ERROR, key=f"plugin {name}")
+    elif kind == "notify":
+        notify(f"{name}: {command[1]}", key=f"plugin {name}")
+    elif kind == "select":
+        ids = [container[0] for container in lxc_info]
+        if command[1] in ids:
+            current_row = ids.index(command[1])
+            display_container_list(stdscr, lxc_info, current_row)
+    elif kind == "panel":
+        show_scroll_panel(stdscr, command[1], list(command[2]) or [""], pause_event)
+        display_container_list(stdscr, lxc_info, current_row)
+    elif kind == "action":
+        action, lxc_id = command[1], command[2]
+        if confirm_action(stdscr, f"{name} wants to {action} {lxc_id}. Allow? (y/n)"):
+            run_action(stdscr, lxc_info, current_row, show_stopped, lxc_id, action, operation_done_event, context)
+        else:
+            notify(f"Denied {name}: {action} {lxc_id}")
+    return current_row
+
+
+INPUT_TIMEOUT = 50
+MAX_KEYS_PER_TICK = 1024
+
+
+def read_keys(stdscr, limit=MAX_KEYS_PER_TICK):
+    """Wait up to INPUT_TIMEOUT ms for a key, then drain everything already queued."""
+    keys = []
+    key = stdscr.getch()
+    if key != -1:
+        stdscr.nodelay(True)
+        while key != -1 and len(keys) < limit:
+            keys.append(key)
+            key = stdscr.getch()
+    stdscr.timeout(INPUT_TIMEOUT)
+    return keys
+
+
+def move_cursor(lxc_info, current_row, steps):
+    """Apply a run of +1/-1 steps, clamping at the ends like separate key presses."""
+    if not steps:
+        return current_row
+    if group_view.mode:
+        stops = group_view.stops(lxc_info)
+        current_row = group_view.move(lxc_info, current_row, 0)
+    else:
+        stops = range(len(lxc_info))
+        current_row = max(0, min(len(lxc_info) - 1, current_row))
+    if current_row not in stops:
+        return current_row
+    position = stops.index(current_row)
+    for step in steps:
+        position = max(0, min(len(stops) - 1, position + step))
+    return stops[position]
+
+
+def show_cursor_move(stdscr, old_row, new_row, lxc_info, context=None):
+    frames = context.frames if context is not None else None
+    if frames is None:
+        update_highlighted_row(stdscr, old_row, new_row, lxc_info)
+    else:
+        frames.request(old_row)
+        frames.flush(stdscr, new_row, lxc_info)
+
+
 def handle_events(
     stdscr,
     lxc_info,
@@ -23,98 +267,99 @@ def handle_events(
     stop_event,
     operation_done_event,
     plugins,
+    context=None,
 ):
-    key = stdscr.getch()
-    invalid_key_timeout = None
-    key_map = {plugin.key: plugin for plugin in plugins}
+    """Process every key queued since the last tick.
 
-    if key == curses.KEY_RESIZE:
-        lines, cols = stdscr.getmaxyx()
-        curses.resize_term(lines, cols)
-        log_debug(
-            f"Terminal resized via KEY_RESIZE to: LINES={curses.LINES}, COLS={curses.COLS}"
+    Runs of Up/Down are folded into one cursor movement and painted once;
+    other keys are handled in order, with any pending movement applied first.
+    """
+    keys = read_keys(stdscr)
+    key_map = {plugin.key: plugin for plugin in plugins}
+    drawn_row = current_row
+    steps = []
+    for key in keys:
+        if key in (curses.KEY_UP, curses.KEY_DOWN):
+            steps.append(-1 if key == curses.KEY_UP else 1)
+            continue
+        current_row = move_cursor(lxc_info, current_row, steps)
+        steps = []
+        if key == curses.KEY_RESIZE:
+            if context is not None and context.resize is not None:
+                context.resize.note()
+            else:
+                apply_resize(stdscr, lxc_info, current_row, show_stopped, plugins, context)
+                drawn_row = current_row
+            continue
+        if current_row != drawn_row:
+            show_cursor_move(stdscr, drawn_row, current_row, lxc_info, context)
+        pause_event.set()
+        current_row, show_stopped, should_quit = handle_key(
+            stdscr,
+            key,
+            lxc_info,
+            current_row,
+            show_stopped,
+            pause_event,
+            stop_event,
+            operation_done_event,
+            plugins,
+            key_map,
+            context,
         )
+        pause_event.clear()
+        drawn_row = current_row
+        if should_quit:
+            return current_row, show_stopped, True
+    current_row = move_cursor(lxc_info, current_row, steps)
+    if current_row != drawn_row:
+        show_cursor_move(stdscr, drawn_row, current_row, lxc_info, context)
+    return current_row, show_stopped, False
+
+
+def handle_key(
+    stdscr,
+    key,
+    lxc_info,
+    current_row,
+    show_stopped,
+    pause_event,
+    stop_event,
+    operation_done_event,
+    plugins,
+    key_map,
+    context=None,
+):
+    if key == ord("g"):
+        mode = group_view.cycle_mode()
+        log_debug(f"Grouping changed to {mode}")
+        if mode:
+            current_row = group_view.move(lxc_info, current_row, 0)
+        display_container_list(stdscr, lxc_info, current_row)
+    elif key == ord("z") and group_view.mode:
+        current_row = group_view.toggle(lxc_info, current_row)
         display_container_list(stdscr, lxc_info, current_row)
-        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
-        return current_row, show_stopped, False, invalid_key_timeout
-
-    if key == -1:
-        return current_row, show_stopped, False, invalid_key_timeout
-
-    pause_event.set()
-    if key == curses.KEY_UP and current_row > 0:
-        old_row = current_row
-        current_row -= 1
-        update_highlighted_row(stdscr, old_row, current_row, lxc_info)
-    elif key == curses.KEY_DOWN and current_row < len(lxc_info) - 1:
-        old_row = current_row
-        current_row += 1
-        update_highlighted_row(stdscr, old_row, current_row, lxc_info)
     elif key == curses.KEY_ENTER or key in [10, 13, 32]:
         if current_row < len(lxc_info):
             lxc_id, hostname, status, ip_addresses, unprivileged = lxc_info[current_row]
             if status == "STOPPED":
-                safe_addstr(
-                    stdscr,
-                    curses.LINES - 3,
-                    0,
-                    " " * (curses.COLS - 1),
-                    curses.color_pair(0),
-                )
-                safe_addstr(
-                    stdscr,
-                    curses.LINES - 2,
-                    0,
-                    " " * (curses.COLS - 1),
-                    curses.color_pair(0),
-                )
-                stdscr.attron(curses.color_pair(4))
-                safe_addstr(
+                choice = prompt_choice(
                     stdscr,
-                    curses.LINES - 2,
-                    0,
                     f"{lxc_id} is currently stopped. Start and attach? (y/n)",
+                    [ord("y"), ord("Y"), ord("n"), ord("N")],
                 )
-                stdscr.attroff(curses.color_pair(4))
-                stdscr.refresh()
-                stdscr.nodelay(False)
-                while True:
-                    choice = stdscr.getch()
-                    if choice in [ord("y"), ord("Y"), ord("n"), ord("N")]:
-                        break
-                stdscr.nodelay(True)
                 if choice in [ord("y"), ord("Y")]:
-                    safe_addstr(
-                        stdscr,
-                        curses.LINES - 2,
-                        0,
-                        " " * (curses.COLS - 1),
-                        curses.color_pair(0),
-                    )
-                    operation_done_event.clear()
-                    spinner_thread = threading.Thread(
-                        target=animate_indicator, args=(stdscr, operation_done_event)
-                    )
-                    spinner_thread.start()
-                    if execute_lxc_command(
-                        stdscr, ["lxc-start", "-n", lxc_id], operation_done_event
-                    ):
-                        time.sleep(2)
-                        log_debug(f"Attaching to container {lxc_id}")
-                        subprocess.run(
-                            ["xterm", "-e", "lxc-attach", "-n", lxc_id], check=False
-                        )
-                        lxc_info[:] = get_lxc_info(show_stopped)
-                        display_container_list(stdscr, lxc_info, current_row)
-                    operation_done_event.set()
-                    spinner_thread.join()
+                    if context is not None and context.commands is not None:
+                        context.pending_attach.add(lxc_id)
+                        context.commands.submit(lxc_id, action_commands("start", lxc_id), "start")
+                        notify(f"Starting {lxc_id}, will attach when running...", key=f"action {lxc_id}")
+                    else:
+                        notify(f"Cannot start {lxc_id} without the background command service", ERROR)
+                    display_container_list(stdscr, lxc_info, current_row)
                 else:
                     display_container_list(stdscr, lxc_info, current_row)
             else:
-                stdscr.clear()
-                stdscr.refresh()
-                log_debug(f"Attaching to running container {lxc_id}")
-                subprocess.run(["lxc-attach", "-n", lxc_id])
+                attach_to_container(stdscr, lxc_id, context)
                 display_container_list(stdscr, lxc_info, current_row)
         update_navigation_bar(stdscr, show_stopped, plugins)
     elif key == ord("s"):
@@ -124,161 +369,55 @@ def handle_events(
         display_container_list(stdscr, lxc_info, current_row)
         update_navigation_bar(stdscr, show_stopped, plugins, force=True)
     elif key == ord("q") or key == 27:
-        safe_addstr(stdscr, curses.LINES - 2, 0, "Goodbye!👋", curses.color_pair(4))
+        notify("Goodbye!👋")
+        draw_status_line(stdscr, force=True)
         stdscr.refresh()
         stop_event.set()
-        return current_row, show_stopped, True, invalid_key_timeout
+        return current_row, show_stopped, True
     elif key == ord("x"):
         if current_row < len(lxc_info):
             lxc_id, hostname, status, ip_addresses, unprivileged = lxc_info[current_row]
-            safe_addstr(
-                stdscr,
-                curses.LINES - 2,
-                0,
-                " " * (curses.COLS - 1),
-                curses.color_pair(0),
-            )
             if status == "RUNNING":
-                safe_addstr(
-                    stdscr,
-                    curses.LINES - 2,
-                    0,
-                    f"Stopping container {lxc_id}... (y/n)",
-                    curses.color_pair(4),
-                )
-                stdscr.refresh()
-                stdscr.nodelay(False)
-                choice = stdscr.getch()
-                if choice in [ord("y"), ord("Y")]:
-                    operation_done_event.clear()
-                    spinner_thread = threading.Thread(
-                        target=animate_indicator, args=(stdscr, operation_done_event)
-                    )
-                    spinner_thread.start()
-                    if execute_lxc_command(
-                        stdscr, ["lxc-stop", "-n", lxc_id], operation_done_event
-                    ):
-                        safe_addstr(
-                            stdscr,
-                            curses.LINES - 2,
-                            0,
-                            f"Stopped {lxc_id}",
-                            curses.color_pair(1),
-                        )
-                        lxc_info[:] = get_lxc_info(show_stopped)
-                        display_container_list(stdscr, lxc_info, current_row)
-                    operation_done_event.set()
-                    spinner_thread.join()
-                else:
-                    safe_addstr(
-                        stdscr,
-                        curses.LINES - 2,
-                        0,
-                        "Action canceled",
-                        curses.color_pair(4),
-                    )
+                action = "stop"
             elif status == "STOPPED":
-                safe_addstr(
+                action = "start"
+            else:
+                action = None
+            if action is not None and confirm_action(
+                stdscr, f"{ACTIONS[action][0]} container {lxc_id}... (y/n)"
+            ):
+                run_action(
                     stdscr,
-                    curses.LINES - 2,
-                    0,
-                    f"Starting container {lxc_id}... (y/n)",
-                    curses.color_pair(4),
+                    lxc_info,
+                    current_row,
+                    show_stopped,
+                    lxc_id,
+                    action,
+                    operation_done_event,
+                    context,
                 )
-                stdscr.refresh()
-                stdscr.nodelay(False)
-                choice = stdscr.getch()
-                if choice in [ord("y"), ord("Y")]:
-                    operation_done_event.clear()
-                    spinner_thread = threading.Thread(
-                        target=animate_indicator, args=(stdscr, operation_done_event)
-                    )
-                    spinner_thread.start()
-                    if execute_lxc_command(
-                        stdscr, ["lxc-start", "-n", lxc_id], operation_done_event
-                    ):
-                        safe_addstr(
-                            stdscr,
-                            curses.LINES - 2,
-                            0,
-                            f"Started {lxc_id}",
-                            curses.color_pair(1),
-                        )
-                        lxc_info[:] = get_lxc_info(show_stopped)
-                        display_container_list(stdscr, lxc_info, current_row)
-                    operation_done_event.set()
-                    spinner_thread.join()
-                else:
-                    safe_addstr(
-                        stdscr,
-                        curses.LINES - 2,
-                        0,
-                        "Action canceled",
-                        curses.color_pair(4),
-                    )
-            stdscr.nodelay(True)
+            elif action is not None:
+                notify("Action canceled")
         update_navigation_bar(stdscr, show_stopped, plugins)
     elif key == ord("r"):
         if current_row < len(lxc_info):
             lxc_id, hostname, status, ip_addresses, unprivileged = lxc_info[current_row]
             if status == "RUNNING":
-                safe_addstr(
-                    stdscr,
-                    curses.LINES - 2,
-                    0,
-                    f"Restarting container {lxc_id}... (y/n)",
-                    curses.color_pair(4),
-                )
-                stdscr.refresh()
-                stdscr.nodelay(False)
-                choice = stdscr.getch()
-                if choice in [ord("y"), ord("Y")]:
-                    operation_done_event.clear()
-                    spinner_thread = threading.Thread(
-                        target=animate_indicator, args=(stdscr, operation_done_event)
-                    )
-                    spinner_thread.start()
-                    if execute_lxc_command(
-                        stdscr, ["lxc-stop", "-n", lxc_id], operation_done_event
-                    ) and execute_lxc_command(
-                        stdscr, ["lxc-start", "-n", lxc_id], operation_done_event
-                    ):
-                        safe_addstr(
-                            stdscr,
-                            curses.LINES - 2,
-                            0,
-                            f"Restarted {lxc_id}",
-                            curses.color_pair(1),
-                        )
-                        lxc_info[:] = get_lxc_info(show_stopped)
-                        display_container_list(stdscr, lxc_info, current_row)
-                    else:
-                        safe_addstr(
-                            stdscr,
-                            curses.LINES - 2,
-                            0,
-                            f"Failed to restart {lxc_id}",
-                            curses.color_pair(2),
-                        )
-                    operation_done_event.set()
-                    spinner_thread.join()
-                else:
-                    safe_addstr(
+                if confirm_action(stdscr, f"Restarting container {lxc_id}... (y/n)"):
+                    run_action(
                         stdscr,
-                        curses.LINES - 2,
-                        0,
-                        "Action canceled",
-                        curses.color_pair(4),
+                        lxc_info,
+                        current_row,
+                        show_stopped,
+                        lxc_id,
+                        "restart",
+                        operation_done_event,
+                        context,
                     )
+                else:
+                    notify("Action canceled")
             else:
-                safe_addstr(
-                    stdscr,
-                    curses.LINES - 2,
-                    0,
-                    f"Container {lxc_id} is not running, cannot restart",
-                    curses.color_pair(2),
-                )
-            stdscr.nodelay(True)
+                notify(f"Container {lxc_id} is not running, cannot restart", ERROR)
         update_navigation_bar(stdscr, show_stopped, plugins)
     elif key == ord("i"):
         if current_row < len(lxc_info):
@@ -290,20 +429,78 @@ def handle_events(
         show_help(stdscr, show_stopped, pause_event, plugins)
         display_container_list(stdscr, lxc_info, current_row)
         update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+    elif key == ord("H") and context is not None and context.history is not None:
+        show_history(stdscr, context.history, pause_event)
+        display_container_list(stdscr, lxc_info, current_row)
+        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+    elif key == ord(":"):
+        run_palette(stdscr, lxc_info, context)
+        clear_screen(stdscr)
+        display_container_list(stdscr, lxc_info, current_row)
+        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+        if context is not None and context.panes is not None:
+            context.panes.invalidate()
+    elif key == ord("/"):
+        show_log_search(stdscr, pause_event)
+        clear_screen(stdscr)
+        display_container_list(stdscr, lxc_info, current_row)
+        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+    elif key == ord("t"):
+        run_log_tail(stdscr, lxc_info, current_row, pause_event, show_stopped)
+        clear_screen(stdscr)
+        display_container_list(stdscr, lxc_info, current_row)
+        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+    elif key == ord("c"):
+        run_config_query(stdscr, pause_event, context)
+        clear_screen(stdscr)
+        display_container_list(stdscr, lxc_info, current_row)
+        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+    elif key == ord("a"):
+        show_audit(stdscr, default_audit_path(), pause_event)
+        display_container_list(stdscr, lxc_info, current_row)
+        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+    elif key == ord("m"):
+        show_notifications(stdscr, pause_event)
+        display_container_list(stdscr, lxc_info, current_row)
+        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+    elif key == ord("v"):
+        mode = cycle_split_mode()
+        log_debug(f"Split mode changed to {mode}")
+        clear_screen(stdscr)
+        display_container_list(stdscr, lxc_info, current_row)
+        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+        if context is not None and context.panes is not None:
+            context.panes.invalidate()
+    elif key in key_map and isinstance(key_map[key], IsolatedPlugin):
+        plugin = key_map[key]
+        host = context.plugin_host if context is not None else None
+        if host is None:
+            notify(f"{plugin.description} needs the plugin host", ERROR)
+        else:
+            try:
+                host.submit(plugin, make_snapshot(lxc_info, current_row, show_stopped))
+                notify(f"{plugin.description}...", key=f"plugin {plugin.description}")
+            except (RuntimeError, OSError) as e:
+                notify(str(e), WARNING)
+    elif key in key_map and not may_execute(key_map[key]):
+        notify(
+            f"{key_map[key].description} runs on the UI thread; start with --trusted-plugins to enable it",
+            WARNING,
+        )
     elif key in key_map:
+        # A copy, so a plugin cannot corrupt the list the refresh thread updates
         current_row = key_map[key].execute(
             stdscr,
-            lxc_info,
+            list(lxc_info),
             current_row,
             show_stopped,
             pause_event,
             operation_done_event,
         )
-        update_navigation_bar(stdscr, show_stopped, plugins)
+        current_row = max(0, min(current_row, len(lxc_info) - 1))
+        update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+        if context is not None and context.panes is not None:
+            context.panes.invalidate()
     else:
-        safe_addstr(stdscr, curses.LINES - 2, 0, "Invalid Key", curses.color_pair(4))
-        stdscr.refresh()
-        invalid_key_timeout = time.time() + 2
-
-    pause_event.clear()
-    return current_row, show_stopped, False, invalid_key_timeout
+        notify("Invalid Key", WARNING, ttl=2)
+    return current_row, show_stopped, False
@@ -0,0 +1,213 @@
+import socket
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from lxc_tui.core import log_debug
+from lxc_tui import clock
+from lxc_tui.lxc_utils import get_lxc_info
+from lxc_tui.metrics import read_cgroup_metrics
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+STATES = [
+    "RUNNING",
+    "STOPPED",
+    "STARTING",
+    "STOPPING",
+    "ABORTING",
+    "FREEZING",
+    "FROZEN",
+    "THAWED",
+]
+CGROUP_METRICS = [
+    ("memory_bytes", "lxc_container_memory_bytes", "gauge", "Current memory usage.", 1),
+    ("memory_limit_bytes", "lxc_container_memory_limit_bytes", "gauge", "Memory limit.", 1),
+    ("swap_bytes", "lxc_container_swap_bytes", "gauge", "Current swap usage.", 1),
+    ("pids", "lxc_container_pids", "gauge", "Number of tasks in the container.", 1),
+    (
+        "cpu_usage_usec",
+        "lxc_container_cpu_usage_seconds_total",
+        "counter",
+        "Total CPU time consumed.",
+        1e-6,
+    ),
+]
+
+
+def parse_listen_address(value):
+    host, _, port = value.rpartition(":")
+    if not port.isdigit():
+        raise ValueError(f"Invalid exporter address {value!r}, expected [HOST]:PORT")
+    return host.strip("[]"), int(port)
+
+
+class IPv6HTTPServer(ThreadingHTTPServer):
+    address_family = socket.AF_INET6
+
+
+def server_class(host):
+    return IPv6HTTPServer if ":" in host else ThreadingHTTPServer
+
+
+def format_value(value):
+    """Integers as they are; floats with every digit, since %g keeps only six."""
+    return str(value) if isinstance(value, int) else repr(float(value))
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _labels(**labels):
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in labels.items()) + "}"
+
+
+def render_metrics(lxc_info, cgroup_metrics, collected_at, duration, collections):
+    lines = [
+        "# HELP lxc_container_info Container metadata.",
+        "# TYPE lxc_container_info gauge",
+    ]
+    for lxc_id, hostname, status, ip_addresses, unprivileged in lxc_info:
+        lines.append(f"lxc_container_info{_labels(id=lxc_id, hostname=hostname)} 1")
+
+    lines += [
+        "# HELP lxc_container_state Current container state, one series per known state.",
+        "# TYPE lxc_container_state gauge",
+    ]
+    for lxc_id, hostname, status, ip_addresses, unprivileged in lxc_info:
+        states = STATES if status in STATES else STATES + [status]
+        for state in states:
+            lines.append(
+                f"lxc_container_state{_labels(id=lxc_id, state=state)} {int(state == status)}"
+            )
+
+    lines += [
+        "# HELP lxc_container_unprivileged Whether the container runs unprivileged.",
+        "# TYPE lxc_container_unprivileged gauge",
+    ]
+    for lxc_id, hostname, status, ip_addresses, unprivileged in lxc_info:
+        value = int(unprivileged.lower() in ("true", "yes", "1"))
+        lines.append(f"lxc_container_unprivileged{_labels(id=lxc_id)} {value}")
+
+    lines += [
+        "# HELP lxc_container_ip_info Addresses assigned to the container.",
+        "# TYPE lxc_container_ip_info gauge",
+    ]
+    for lxc_id, hostname, status, ip_addresses, unprivileged in lxc_info:
+        for address in filter(None, (a.strip() for a in ip_addresses.split(","))):
+            if address == "?":
+                continue
+            family = "ipv6" if ":" in address else "ipv4"
+            lines.append(
+                f"lxc_container_ip_info{_labels(id=lxc_id, family=family, address=address)} 1"
+            )
+
+    for key, name, metric_type, help_text, scale in CGROUP_METRICS:
+        samples = [
+            (lxc_id, metrics[key])
+            for lxc_id, metrics in sorted(cgroup_metrics.items())
+            if key in metrics
+        ]
+        if not samples:
+            continue
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {metric_type}"]
+        for lxc_id, value in samples:
+            lines.append(f"{name}{_labels(id=lxc_id)} {format_value(value if scale == 1 else value * scale)}")
+
+    lines += [
+        "# HELP lxc_exporter_last_collect_timestamp_seconds When the cached snapshot was collected.",
+        "# TYPE lxc_exporter_last_collect_timestamp_seconds gauge",
+        f"lxc_exporter_last_collect_timestamp_seconds {collected_at:.3f}",
+        "# HELP lxc_exporter_collect_duration_seconds Time taken by the last collection.",
+        "# TYPE lxc_exporter_collect_duration_seconds gauge",
+        f"lxc_exporter_collect_duration_seconds {duration:.6f}",
+        "# HELP lxc_exporter_collections_total Collections run by the background collector.",
+        "# TYPE lxc_exporter_collections_total counter",
+        f"lxc_exporter_collections_total {collections}",
+    ]
+    return ("\n".join(lines) + "\n").encode("utf-8")
+
+
+class MetricsCollector:
+    """Background collector; scrapes only ever read its cached rendering."""
+
+    def __init__(self, interval=10.0, cgroup_root=None):
+        self.interval = interval
+        self.cgroup_root = cgroup_root
+        self.lock = threading.Lock()
+        self.collections = 0
+        self.payload = render_metrics([], {}, 0.0, 0.0, 0)
+
+    def collect(self):
+        started = clock.now()
+        lxc_info = get_lxc_info(include_stopped=True)
+        cgroup_metrics = {}
+        for lxc_id, hostname, status, ip_addresses, unprivileged in lxc_info:
+            if status != "RUNNING":
+                continue
+            if self.cgroup_root is None:
+                metrics = read_cgroup_metrics(lxc_id)
+            else:
+                metrics = read_cgroup_metrics(lxc_id, self.cgroup_root)
+            if metrics:
+                cgroup_metrics[lxc_id] = metrics
+        finished = clock.now()
+        self.collections += 1
+        payload = render_metrics(
+            lxc_info, cgroup_metrics, finished, finished - started, self.collections
+        )
+        with self.lock:
+            self.payload = payload
+
+    def snapshot(self):
+        with self.lock:
+            return self.payload
+
+    def run(self, stop_event):
+        while not stop_event.is_set():
+            try:
+                self.collect()
+            except Exception as e:
+                log_debug(f"Exporter collection failed: {e}")
+            clock.wait(stop_event, self.interval)
+
+
+def make_handler(collector):
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            if self.path.split("?", 1)[0] == "/metrics":
+                body = collector.snapshot()
+                self.send_response(200)
+                self.send_header("Content-Type", CONTENT_TYPE)
+            elif self.path == "/":
+                body = b'<html><body><a href="/metrics">Metrics</a></body></html>\n'
+                self.send_response(200)
+                self.send_header("Content-Type", "text/html")
+            else:
+                body = b"Not found\n"
+                self.send_response(404)
+                self.send_header("Content-Type", "text/plain")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format, *args):
+            log_debug(f"Exporter: {format % args}")
+
+    return MetricsHandler
+
+
+def run_exporter(address, interval=10.0):
+    host, port = parse_listen_address(address)
+    collector = MetricsCollector(interval)
+    stop_event = threading.Event()
+    collector_thread = threading.Thread(target=collector.run, args=(stop_event,), daemon=True)
+    collector_thread.start()
+    server = server_class(host)((host, port), make_handler(collector))
+    shown = f"[{host}]" if ":" in host else host or "0.0.0.0"
+    print(f"Serving LXC metrics on http://{shown}:{port}/metrics")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        stop_event.set()
+        server.server_close()
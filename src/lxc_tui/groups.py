@@ -0,0 +1,262 @@
+import os
+import re
+import threading
+from collections import Counter
+from lxc_tui.core import log_debug
+from lxc_tui import clock
+
+GROUP_MODES = [None, "tag", "pool", "state", "privilege"]
+# Each container sits in exactly one group, so with several tags it is its first (sorted) one
+MODE_LABELS = {"tag": "primary tag"}
+CONFIG_DIR = "/etc/pve/lxc"
+POOL_CONFIG = "/etc/pve/user.cfg"
+# Raw LXC keys as Proxmox's own parser accepts them: "lxc.key: value" or "lxc.key = value"
+RAW_LXC_KEY = re.compile(r"^(lxc\.[a-z0-9_\-.]+)(?::|\s*=)\s*(.*?)\s*$")
+
+
+def raw_lxc_key(line):
+    """(key, value) of a raw lxc.* line in a container config, or None."""
+    match = RAW_LXC_KEY.match(line)
+    return match.groups() if match else None
+
+
+class MtimeCache:
+    """Caches a parsed file until its mtime changes."""
+
+    def __init__(self, parse):
+        self.parse = parse
+        self.entries = {}
+
+    def get(self, path, default):
+        try:
+            mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            self.entries.pop(path, None)
+            return default
+        cached = self.entries.get(path)
+        if cached is None or cached[0] != mtime:
+            try:
+                cached = (mtime, self.parse(path))
+            except OSError as e:
+                log_debug(f"Error reading {path}: {e}")
+                return default
+            self.entries[path] = cached
+        return cached[1]
+
+
+def parse_tags(path):
+    with open(path) as f:
+        for line in f:
+            if line.startswith("["):
+                break
+            if line.startswith("tags:"):
+                return sorted(t for t in re.split(r"[;,\s]+", line.split(":", 1)[1]) if t)
+    return []
+
+
+def parse_pools(path):
+    pools = {}
+    with open(path) as f:
+        for line in f:
+            if not line.startswith("pool:"):
+                continue
+            fields = line.rstrip("\n").split(":")
+            if len(fields) >= 4:
+                for vmid in filter(None, fields[3].split(",")):
+                    pools[vmid.strip()] = fields[1]
+    return pools
+
+
+def _mtime(path):
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
+class GroupIndex:
+    """Group membership and per-group state counts, maintained from refresh deltas.
+
+    update() only recomputes the group of containers whose record changed since
+    the previous snapshot and adjusts the counters for those, so the per-frame
+    cost does not grow with the size of the fleet. In tag and pool mode it also
+    re-groups containers whose config or the pool file changed on disk; those
+    mtimes are checked at most every recheck seconds.
+    """
+
+    def __init__(self, mode=None, config_dir=CONFIG_DIR, pool_config=POOL_CONFIG, recheck=2.0):
+        self.mode = mode
+        self.config_dir = config_dir
+        self.pool_config = pool_config
+        self.recheck = recheck
+        self.tags = MtimeCache(parse_tags)
+        self.pools = MtimeCache(parse_pools)
+        self.lock = threading.Lock()
+        self.records = {}
+        self.members = {}
+        self.counts = {}
+        self.sources = {}
+        self.checked = None
+
+    def group_of(self, container):
+        lxc_id, hostname, status, ip_addresses, unprivileged = container
+        if self.mode == "tag":
+            tags = self.tags.get(os.path.join(self.config_dir, f"{lxc_id}.conf"), [])
+            return tags[0] if tags else "untagged"
+        if self.mode == "pool":
+            return self.pools.get(self.pool_config, {}).get(lxc_id, "no pool")
+        if self.mode == "state":
+            return status
+        if self.mode == "privilege":
+            return "unprivileged" if unprivileged.lower() in ("true", "yes", "1") else "privileged"
+        return ""
+
+    def source_mtimes(self, lxc_ids):
+        """mtime of the file each container's group comes from, in tag and pool mode."""
+        if self.mode == "pool":
+            mtime = _mtime(self.pool_config)
+            return {lxc_id: mtime for lxc_id in lxc_ids}
+        if self.mode == "tag":
+            return {lxc_id: _mtime(os.path.join(self.config_dir, f"{lxc_id}.conf")) for lxc_id in lxc_ids}
+        return {}
+
+    def _remove(self, lxc_id):
+        self.sources.pop(lxc_id, None)
+        group, status = self.members.pop(lxc_id)
+        counts = self.counts[group]
+        counts[status] -= 1
+        if counts[status] <= 0:
+            del counts[status]
+        if not counts:
+            del self.counts[group]
+
+    def _add(self, container):
+        group = self.group_of(container)
+        self.members[container[0]] = (group, container[2])
+        self.counts.setdefault(group, Counter())[container[2]] += 1
+        self.sources.update(self.source_mtimes([container[0]]))
+
+    def update(self, lxc_info, include_stopped=None):
+        with self.lock:
+            current = {container[0]: container for container in lxc_info}
+            changed = 0
+            for lxc_id in [i for i in self.records if i not in current]:
+                self._remove(lxc_id)
+                del self.records[lxc_id]
+                changed += 1
+            edited = set()
+            now = clock.now()
+            if self.mode in ("tag", "pool") and (self.checked is None or now - self.checked >= self.recheck):
+                self.checked = now
+                mtimes = self.source_mtimes([i for i in current if i in self.records])
+                edited = {i for i, mtime in mtimes.items() if self.sources.get(i) != mtime}
+            for lxc_id, container in current.items():
+                if self.records.get(lxc_id) == container and lxc_id not in edited:
+                    continue
+                if lxc_id in self.members:
+                    self._remove(lxc_id)
+                self._add(container)
+                self.records[lxc_id] = container
+                changed += 1
+            return changed
+
+    def set_mode(self, mode):
+        with self.lock:
+            self.mode = mode
+            self.records.clear()
+            self.members.clear()
+            self.counts.clear()
+            self.sources.clear()
+            self.checked = None
+
+    def group_counts(self, group):
+        with self.lock:
+            return Counter(self.counts.get(group, {}))
+
+
+class GroupView:
+    """Grouped, collapsible presentation of lxc_info on top of a GroupIndex."""
+
+    def __init__(self, index=None):
+        self.index = index or GroupIndex()
+        self.collapsed = set()
+
+    @property
+    def mode(self):
+        return self.index.mode
+
+    def cycle_mode(self):
+        mode = GROUP_MODES[(GROUP_MODES.index(self.mode) + 1) % len(GROUP_MODES)]
+        self.index.set_mode(mode)
+        self.collapsed.clear()
+        return mode
+
+    def groups(self, lxc_info):
+        self.index.update(lxc_info)
+        ordered = {}
+        with self.index.lock:
+            for idx, container in enumerate(lxc_info):
+                group = self.index.members[container[0]][0]
+                ordered.setdefault(group, []).append(idx)
+        return sorted(ordered.items())
+
+    def rows(self, lxc_info):
+        """Return display rows: ("group", name, member indexes) and ("container", index)."""
+        rows = []
+        for group, indexes in self.groups(lxc_info):
+            rows.append(("group", group, indexes))
+            if group not in self.collapsed:
+                rows.extend(("container", idx) for idx in indexes)
+        return rows
+
+    def stops(self, lxc_info):
+        """Cursor positions in display order; a collapsed group is a single stop."""
+        stops = []
+        for group, indexes in self.groups(lxc_info):
+            stops.extend(indexes[:1] if group in self.collapsed else indexes)
+        return stops
+
+    def move(self, lxc_info, current_row, delta):
+        stops = self.stops(lxc_info)
+        if not stops:
+            return current_row
+        if current_row not in stops:
+            group = self.group_of_row(lxc_info, current_row)
+            current_row = next(
+                (idx for g, indexes in self.groups(lxc_info) if g == group for idx in indexes[:1]),
+                stops[0],
+            )
+        position = stops.index(current_row) if current_row in stops else 0
+        return stops[max(0, min(len(stops) - 1, position + delta))]
+
+    def group_of_row(self, lxc_info, current_row):
+        if not 0 <= current_row < len(lxc_info):
+            return None
+        self.index.update(lxc_info)
+        with self.index.lock:
+            return self.index.members[lxc_info[current_row][0]][0]
+
+    def toggle(self, lxc_info, current_row):
+        group = self.group_of_row(lxc_info, current_row)
+        if group is None:
+            return current_row
+        if group in self.collapsed:
+            self.collapsed.discard(group)
+        else:
+            self.collapsed.add(group)
+        for name, indexes in self.groups(lxc_info):
+            if name == group:
+                return indexes[0]
+        return current_row
+
+    def header(self, group, indexes):
+        counts = self.index.group_counts(group)
+        running = counts.get("RUNNING", 0)
+        stopped = counts.get("STOPPED", 0)
+        other = sum(counts.values()) - running - stopped
+        marker = "+" if group in self.collapsed else "-"
+        extra = f", {other} other" if other else ""
+        return f"{marker} {MODE_LABELS.get(self.mode, self.mode)}: {group} ({running} running, {stopped} stopped{extra})"
+
+
+view = GroupView()
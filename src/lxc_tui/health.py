@@ -0,0 +1,265 @@
+import configparser
+import os
+import random
+import shlex
+import socket
+import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from lxc_tui.core import log_debug
+from lxc_tui.groups import CONFIG_DIR, MtimeCache, parse_tags
+from lxc_tui import lxc_utils
+from lxc_tui.ip_discovery import PLACEHOLDERS
+from lxc_tui.clock import now as current_time, wait as clock_wait
+
+HEALTHY = "ok"
+UNHEALTHY = "FAIL"
+PENDING = "..."
+TIMED_OUT = "?"
+
+
+def default_health_config_path():
+    base = os.environ.get("XDG_CONFIG_HOME") or os.path.join(
+        os.path.expanduser("~"), ".config"
+    )
+    return os.path.join(base, "lxc-tui", "health.ini")
+
+
+class HealthCheck:
+    def __init__(self, ports=(), command=None, interval=30.0, timeout=3.0):
+        self.ports = tuple(ports)
+        self.command = command
+        self.interval = interval
+        self.timeout = timeout
+
+    def __repr__(self):
+        return f"HealthCheck(ports={self.ports}, command={self.command!r})"
+
+
+def load_health_config(path):
+    """Read checks keyed by section: a container id, "tag:<name>" or "*".
+
+    [tag:web]
+    tcp = 80, 443
+    command = systemctl is-active nginx
+    interval = 30
+    timeout = 3
+    """
+    parser = configparser.ConfigParser(interpolation=None)
+    try:
+        parser.read(path)
+    except configparser.Error as e:
+        log_debug(f"Error reading health config {path}: {e}")
+        return {}
+    checks = {}
+    for section in parser.sections():
+        options = parser[section]
+        try:
+            ports = [int(port) for port in options.get("tcp", "").replace(",", " ").split()]
+            check = HealthCheck(
+                ports,
+                options.get("command") or None,
+                options.getfloat("interval", 30.0),
+                options.getfloat("timeout", 3.0),
+            )
+        except ValueError as e:
+            log_debug(f"Ignoring health check [{section}]: {e}")
+            continue
+        if check.ports or check.command:
+            checks[section] = check
+    return checks
+
+
+def first_ip(ip_addresses):
+    for address in ip_addresses.replace(",", " ").split():
+        if ":" not in address and address not in PLACEHOLDERS:
+            return address
+    return None
+
+
+def tcp_probe(host, port, timeout):
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError as e:
+        log_debug(f"TCP probe {host}:{port} failed: {e}")
+        return False
+
+
+def command_probe(lxc_id, command, timeout):
+    try:
+        result = subprocess.run(
+            ["lxc-attach", "-n", lxc_id, "--"] + shlex.split(command),
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL,
+            timeout=timeout,
+            start_new_session=True,
+        )
+    except (OSError, subprocess.SubprocessError) as e:
+        log_debug(f"Command probe in {lxc_id} failed: {e}")
+        return False
+    return result.returncode == 0
+
+
+def run_check(container, check, tcp=tcp_probe, command=command_probe, lookup=None):
+    """True/False for a finished check, or None while the container has no IPv4 yet.
+
+    The row's address is empty until the first refresh and, with
+    --low-bandwidth, for every row but the selected one, so it is looked up
+    when missing rather than failing the check.
+    """
+    lxc_id, hostname, status, ip_addresses, unprivileged = container
+    if check.ports:
+        host = first_ip(ip_addresses)
+        if host is None:
+            host = first_ip((lookup or lxc_utils.lookup_ips)(lxc_id))
+        if host is None:
+            return None
+        if not all(tcp(host, port, check.timeout) for port in check.ports):
+            return False
+    if check.command:
+        return command(lxc_id, check.command, check.timeout)
+    return True
+
+
+class HealthMonitor:
+    """Runs configured health checks on a bounded pool and caches the results.
+
+    A scheduler thread submits probes for the containers passed to listener()
+    as they fall due, whether or not their rows are on screen; get() only
+    reads the last result. Each due time is jittered so checks with the same
+    interval spread out instead of firing together. A probe still running past
+    its timeout shows as TIMED_OUT, and only occupies one worker, so other
+    containers keep being checked. A container without an address yet stays
+    PENDING and is retried after retry seconds.
+    """
+
+    def __init__(
+        self,
+        checks,
+        workers=8,
+        jitter=0.2,
+        config_dir=CONFIG_DIR,
+        probe=run_check,
+        clock=current_time,
+        tick=1.0,
+        retry=5.0,
+    ):
+        self.checks = checks
+        self.jitter = jitter
+        self.config_dir = config_dir
+        self.probe = probe
+        self.clock = clock
+        self.tick = tick
+        self.retry = retry
+        self.tags = MtimeCache(parse_tags)
+        self.lock = threading.Lock()
+        self.results = {}
+        self.due = {}
+        self.in_flight = {}
+        self.assigned = {}
+        self.version = 0
+        self.containers = []
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="health")
+
+    def check_for(self, lxc_id):
+        if lxc_id in self.checks:
+            return self.checks[lxc_id]
+        tags = self.tags.get(os.path.join(self.config_dir, f"{lxc_id}.conf"), [])
+        for tag in tags:
+            if f"tag:{tag}" in self.checks:
+                return self.checks[f"tag:{tag}"]
+        return self.checks.get("*")
+
+    def next_due(self, now, interval):
+        return now + interval * (1 + random.uniform(-self.jitter, self.jitter))
+
+    def _run(self, container, check):
+        lxc_id = container[0]
+        try:
+            healthy = self.probe(container, check)
+        except Exception as e:
+            log_debug(f"Health check for {lxc_id} failed: {e}")
+            healthy = False
+        with self.lock:
+            self.in_flight.pop(lxc_id, None)
+            if healthy is None:
+                result = PENDING
+                interval = min(self.retry, check.interval)
+            else:
+                result = HEALTHY if healthy else UNHEALTHY
+                interval = check.interval
+            if self.results.get(lxc_id, PENDING) != result:
+                self.version += 1
+            self.results[lxc_id] = result
+            self.due[lxc_id] = self.next_due(self.clock(), interval)
+
+    def assign(self, containers):
+        """Resolve each running container's check; stats configs, so keep it off the render path."""
+        assigned = {}
+        for container in containers:
+            if container[2] == "RUNNING":
+                check = self.check_for(container[0])
+                if check is not None:
+                    assigned[container[0]] = check
+        with self.lock:
+            self.assigned = assigned
+        return assigned
+
+    def listener(self, lxc_info, include_stopped):
+        containers = list(lxc_info)
+        self.assign(containers)
+        with self.lock:
+            self.containers = containers
+
+    def schedule(self):
+        """Submit a probe for every running container whose check is due."""
+        with self.lock:
+            containers = list(self.containers)
+        assigned = self.assign(containers)
+        for container in containers:
+            lxc_id = container[0]
+            check = assigned.get(lxc_id)
+            if check is None:
+                continue
+            now = self.clock()
+            with self.lock:
+                if lxc_id in self.in_flight or now < self.due.get(lxc_id, 0):
+                    continue
+                self.in_flight[lxc_id] = now
+                try:
+                    self.executor.submit(self._run, container, check)
+                except RuntimeError:
+                    self.in_flight.pop(lxc_id, None)
+
+    def get(self, container):
+        lxc_id, status = container[0], container[2]
+        if status != "RUNNING":
+            return ""
+        with self.lock:
+            check = self.assigned.get(lxc_id)
+            if check is None:
+                return ""
+            started = self.in_flight.get(lxc_id)
+            if started is not None and self.clock() - started > check.timeout * max(1, len(check.ports) + 1):
+                return TIMED_OUT
+            return self.results.get(lxc_id, PENDING)
+
+    def run(self):
+        while not self.stop_event.is_set():
+            try:
+                self.schedule()
+            except Exception as e:
+                log_debug(f"Health scheduling failed: {e}")
+            clock_wait(self.stop_event, self.tick)
+
+    def start(self):
+        self.thread = threading.Thread(target=self.run, name="health-scheduler", daemon=True)
+        self.thread.start()
+
+    def shutdown(self):
+        self.stop_event.set()
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,195 @@
+import json
+import os
+import threading
+import time
+from bisect import bisect_right
+from lxc_tui.core import log_debug
+from lxc_tui import clock
+from lxc_tui.ip_discovery import settled_ips
+
+CHECKPOINT_INTERVAL = 200
+
+
+def default_history_path():
+    base = os.environ.get("XDG_STATE_HOME") or os.path.join(
+        os.path.expanduser("~"), ".local", "state"
+    )
+    return os.path.join(base, "lxc-tui", "history.ndjson")
+
+
+def diff_snapshots(known, lxc_info, include_stopped, timestamp):
+    """Return (events, new_known) for the transitions between known and lxc_info.
+
+    When stopped containers are filtered out of lxc_info, a container that
+    disappears is recorded as having stopped rather than removed. A running
+    container whose addresses are still being looked up keeps its last known
+    ones, so lookups do not show up as IP changes.
+    """
+    events = []
+    new_known = {}
+    for lxc_id, hostname, status, ip_addresses, unprivileged in lxc_info:
+        old = known.get(lxc_id)
+        ip_addresses = settled_ips(status, ip_addresses, old[1] if old is not None else "")
+        new_known[lxc_id] = (status, ip_addresses)
+        if old is None:
+            events.append({"t": timestamp, "id": lxc_id, "k": "added", "n": status})
+            if ip_addresses:
+                events.append(
+                    {"t": timestamp, "id": lxc_id, "k": "ip", "o": "", "n": ip_addresses}
+                )
+            continue
+        if old[0] != status:
+            events.append(
+                {"t": timestamp, "id": lxc_id, "k": "state", "o": old[0], "n": status}
+            )
+        if old[1] != ip_addresses:
+            events.append(
+                {"t": timestamp, "id": lxc_id, "k": "ip", "o": old[1], "n": ip_addresses}
+            )
+
+    for lxc_id, (status, ip_addresses) in known.items():
+        if lxc_id in new_known:
+            continue
+        if include_stopped:
+            events.append({"t": timestamp, "id": lxc_id, "k": "removed", "o": status})
+            continue
+        new_known[lxc_id] = ("STOPPED", "")
+        if status != "STOPPED":
+            events.append(
+                {"t": timestamp, "id": lxc_id, "k": "state", "o": status, "n": "STOPPED"}
+            )
+        if ip_addresses:
+            events.append(
+                {"t": timestamp, "id": lxc_id, "k": "ip", "o": ip_addresses, "n": ""}
+            )
+    return events, new_known
+
+
+def apply_event(known, event):
+    kind = event.get("k")
+    lxc_id = event.get("id")
+    if kind == "checkpoint":
+        known.clear()
+        known.update({key: tuple(value) for key, value in event["s"].items()})
+    elif kind == "added":
+        known[lxc_id] = (event["n"], "")
+    elif kind == "removed":
+        known.pop(lxc_id, None)
+    elif kind == "state":
+        known[lxc_id] = (event["n"], known.get(lxc_id, ("", ""))[1])
+    elif kind == "ip":
+        known[lxc_id] = (known.get(lxc_id, ("", ""))[0], event["n"])
+
+
+def format_event(event):
+    stamp = time.strftime("%H:%M:%S", time.localtime(event["t"]))
+    kind = event["k"]
+    if kind == "added":
+        change = f"appeared ({event['n']})"
+    elif kind == "removed":
+        change = "removed"
+    else:
+        change = f"{kind} {event.get('o') or '-'} -> {event.get('n') or '-'}"
+    return f"{stamp}  {event['id']:<6} {change}"
+
+
+class EventLog:
+    """Append-only NDJSON log of container state and IP transitions.
+
+    Every CHECKPOINT_INTERVAL events a checkpoint holding the full known state is
+    written, and its timestamp and byte offset are appended to a sidecar index so
+    time-window queries and startup only read from the nearest checkpoint onward.
+    """
+
+    def __init__(self, path, checkpoint_interval=CHECKPOINT_INTERVAL):
+        self.path = path
+        self.index_path = path + ".idx"
+        self.checkpoint_interval = checkpoint_interval
+        self.lock = threading.Lock()
+        self.known = {}
+        self.events_since_checkpoint = 0
+        self.index = []
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._load_index()
+        self._restore_known()
+
+    def _load_index(self):
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path) as index_file:
+            for line in index_file:
+                try:
+                    timestamp, offset = line.split()
+                    self.index.append((float(timestamp), int(offset)))
+                except ValueError:
+                    continue
+
+    def _read_from(self, offset):
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "rb") as log_file:
+            log_file.seek(offset)
+            for raw_line in log_file:
+                try:
+                    yield json.loads(raw_line)
+                except ValueError:
+                    continue
+
+    def _restore_known(self):
+        offset = self.index[-1][1] if self.index else 0
+        for event in self._read_from(offset):
+            apply_event(self.known, event)
+            if event.get("k") != "checkpoint":
+                self.events_since_checkpoint += 1
+
+    def _append(self, log_file, record):
+        log_file.write((json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8"))
+
+    def _write_checkpoint(self, log_file, timestamp):
+        offset = log_file.tell()
+        self._append(
+            log_file,
+            {"t": timestamp, "k": "checkpoint", "s": {k: list(v) for k, v in self.known.items()}},
+        )
+        with open(self.index_path, "a") as index_file:
+            index_file.write(f"{timestamp} {offset}\n")
+        self.index.append((timestamp, offset))
+        self.events_since_checkpoint = 0
+
+    def observe(self, lxc_info, include_stopped, timestamp=None):
+        if timestamp is None:
+            timestamp = clock.now()
+        with self.lock:
+            events, new_known = diff_snapshots(
+                self.known, lxc_info, include_stopped, timestamp
+            )
+            if not events and self.index:
+                return []
+            try:
+                with open(self.path, "ab") as log_file:
+                    for event in events:
+                        self._append(log_file, event)
+                    self.known = new_known
+                    self.events_since_checkpoint += len(events)
+                    if not self.index or self.events_since_checkpoint >= self.checkpoint_interval:
+                        self._write_checkpoint(log_file, timestamp)
+            except OSError as e:
+                log_debug(f"Error writing history log {self.path}: {e}")
+            return events
+
+    def listener(self, lxc_info, include_stopped):
+        self.observe(lxc_info, include_stopped)
+
+    def query(self, since, until=None):
+        with self.lock:
+            position = bisect_right([timestamp for timestamp, _ in self.index], since)
+            offset = self.index[position - 1][1] if position else 0
+            return [
+                event
+                for event in self._read_from(offset)
+                if event.get("k") != "checkpoint"
+                and event["t"] >= since
+                and (until is None or event["t"] <= until)
+            ]
@@ -0,0 +1,89 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from lxc_tui.core import log_debug
+from lxc_tui import clock
+
+TIMED_OUT = "?"
+# What a running container shows while its addresses are unknown
+PLACEHOLDERS = ("", TIMED_OUT)
+
+
+def settled_ips(status, ip_addresses, previous):
+    """ip_addresses, or previous while a running container only has a lookup placeholder."""
+    if status == "RUNNING" and ip_addresses in PLACEHOLDERS:
+        return previous
+    return ip_addresses
+
+
+class IpResolver:
+    """Looks up container IPs on a thread pool and caches them with a TTL.
+
+    get() never blocks: it returns whatever is cached (possibly stale or empty)
+    and schedules a lookup when the entry is missing or expired. A lookup that
+    runs past its timeout is reported as TIMED_OUT until it finishes.
+    """
+
+    def __init__(self, lookup, workers=8, timeout=2.0, ttl=30.0, on_update=None):
+        self.lookup = lookup
+        self.timeout = timeout
+        self.ttl = ttl
+        self.on_update = on_update
+        self.lock = threading.Lock()
+        self.cache = {}
+        self.in_flight = {}
+        self.executor = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="ip-lookup"
+        )
+
+    def _resolve(self, lxc_id):
+        try:
+            ip_addresses = self.lookup(lxc_id)
+        except Exception as e:
+            log_debug(f"IP lookup for {lxc_id} failed: {e}")
+            ip_addresses = None
+        with self.lock:
+            self.in_flight.pop(lxc_id, None)
+            if ip_addresses is not None:
+                self.cache[lxc_id] = (ip_addresses, clock.now() + self.ttl)
+            else:
+                previous = self.cache.get(lxc_id, ("", 0))[0]
+                self.cache[lxc_id] = (previous, clock.now() + self.timeout)
+        if self.on_update is not None:
+            self.on_update(lxc_id)
+
+    def get(self, lxc_id):
+        now = clock.now()
+        with self.lock:
+            ip_addresses, expires = self.cache.get(lxc_id, ("", 0))
+            started = self.in_flight.get(lxc_id)
+            if started is None and now >= expires:
+                self.in_flight[lxc_id] = now
+                try:
+                    self.executor.submit(self._resolve, lxc_id)
+                except RuntimeError:
+                    self.in_flight.pop(lxc_id, None)
+            elif started is not None and now - started > self.timeout:
+                return ip_addresses or TIMED_OUT
+        return ip_addresses
+
+    def peek(self, lxc_id):
+        """The last known addresses, without scheduling a lookup."""
+        with self.lock:
+            return self.cache.get(lxc_id, ("", 0))[0]
+
+    def forget(self, lxc_id):
+        with self.lock:
+            self.cache.pop(lxc_id, None)
+
+    def wait(self, timeout=None):
+        deadline = None if timeout is None else clock.now() + timeout
+        while True:
+            with self.lock:
+                if not self.in_flight:
+                    return True
+            if deadline is not None and clock.now() >= deadline:
+                return False
+            clock.sleep(0.01)
+
+    def shutdown(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,116 @@
+import itertools
+import threading
+from lxc_tui.core import log_debug
+from lxc_tui import audit, clock, lxc_utils
+
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+
+def stop_process(proc):
+    """SIGTERM a subprocess; backend handles without terminate() are killed."""
+    terminate = getattr(proc, "terminate", None)
+    (terminate or proc.kill)()
+
+
+class Job:
+    def __init__(self, job_id, label, command):
+        self.id = job_id
+        self.label = label
+        self.command = command
+        self.state = RUNNING
+        self.started = clock.now()
+        self.finished = None
+        self.progress = ""
+        self.proc = None
+        self.cancel_requested = False
+        self.done = threading.Event()
+
+    @property
+    def elapsed(self):
+        return (self.finished or clock.now()) - self.started
+
+    def describe(self):
+        status = self.state if self.state != RUNNING else f"{self.elapsed:.0f}s"
+        progress = f" {self.progress}" if self.progress and self.state == RUNNING else ""
+        return f"#{self.id} {self.label} [{status}]{progress}"
+
+
+class JobManager:
+    """Runs long commands as tracked background jobs with progress and cancellation.
+
+    Each job's progress is the last line the command printed. on_done is called
+    from the job thread with the finished Job.
+    """
+
+    def __init__(self, on_done=None, keep=20):
+        self.on_done = on_done
+        self.keep = keep
+        self.lock = threading.Lock()
+        self.jobs = []
+        self.ids = itertools.count(1)
+
+    def submit(self, label, command, on_done=None):
+        job = Job(next(self.ids), label, command)
+        with self.lock:
+            self.jobs.append(job)
+            finished = [j for j in self.jobs if j.state != RUNNING]
+            for old in finished[: max(0, len(finished) - self.keep)]:
+                self.jobs.remove(old)
+        thread = threading.Thread(target=self._run, args=(job, on_done), daemon=True)
+        thread.start()
+        return job
+
+    def _run(self, job, on_done):
+        log_debug(f"Starting job #{job.id}: {' '.join(job.command)}")
+        try:
+            job.proc = lxc_utils.spawn_command(job.command, output=True)
+            if job.cancel_requested:
+                stop_process(job.proc)
+            for line in getattr(job.proc, "stdout", None) or ():
+                if line.strip():
+                    job.progress = line.strip()[:60]
+            returncode = job.proc.wait()
+            audit.record(job.command, returncode, job.started, clock.now() - job.started, action=job.label.split()[0])
+            if job.cancel_requested:
+                job.state = CANCELLED
+            else:
+                job.state = DONE if returncode == 0 else FAILED
+        except OSError as e:
+            job.progress = str(e)
+            job.state = FAILED
+            audit.record(
+                job.command, None, job.started, clock.now() - job.started, action=job.label.split()[0], error=str(e)
+            )
+        job.finished = clock.now()
+        log_debug(f"Job #{job.id} finished: {job.state}")
+        for callback in (on_done, self.on_done):
+            if callback is not None:
+                try:
+                    callback(job)
+                except Exception as e:
+                    log_debug(f"Job callback failed: {e}")
+        job.done.set()
+
+    def cancel(self, job_id):
+        with self.lock:
+            job = next((j for j in self.jobs if j.id == job_id), None)
+        if job is None or job.state != RUNNING:
+            return False
+        job.cancel_requested = True
+        if job.proc is not None:
+            try:
+                stop_process(job.proc)
+            except OSError as e:
+                log_debug(f"Failed to cancel job #{job_id}: {e}")
+        return True
+
+    def active(self):
+        with self.lock:
+            return [job for job in self.jobs if job.state == RUNNING]
+
+    def recent(self):
+        with self.lock:
+            return list(self.jobs)
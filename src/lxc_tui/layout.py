@@ -0,0 +1,157 @@
+from lxc_tui.core import log_debug
+
+SPLIT_MODES = ["list", "details", "metrics", "log"]
+split_mode = "list"
+
+
+class Column:
+    """A list column; flex columns absorb the width left over by fixed ones."""
+
+    def __init__(
+        self, key, title, width=0, min_width=None, flex=False, priority=0, value=None, volatile=False
+    ):
+        self.key = key
+        self.title = title
+        self.width = max(width, len(title))
+        self.min_width = self.width if min_width is None else min_width
+        self.flex = flex
+        self.priority = priority
+        self.value = value
+        self.volatile = volatile
+
+    def text(self, container):
+        return str(self.value(container))
+
+
+def _field(index):
+    return lambda container: container[index]
+
+
+BASE_COLUMNS = [
+    Column("id", "ID", 5, priority=100, value=_field(0)),
+    Column("hostname", "HOSTNAME", 20, min_width=10, priority=90, value=_field(1)),
+    Column("state", "STATE", 10, min_width=8, priority=95, value=_field(2)),
+    Column(
+        "ip", "IP ADDRESSES", 50, min_width=15, flex=True, priority=50, value=_field(3), volatile=True
+    ),
+    Column("unprivileged", "UNPRIVILEGED", priority=10, value=_field(4)),
+]
+
+columns = list(BASE_COLUMNS)
+_layout_cache = {}
+
+
+class ColumnLayout:
+    def __init__(self, width, placed):
+        self.width = width
+        self.placed = placed
+        self.header = self.format(None)
+
+    def format(self, container):
+        cells = []
+        for column, width in self.placed:
+            text = column.title if container is None else column.text(container)
+            if len(text) > width:
+                text = text[: max(0, width - 3)] + "..." if width > 3 else text[:width]
+            cells.append(f"{text:<{width}}")
+        return " ".join(cells)[: self.width]
+
+    def stable_key(self, container):
+        """The row's text without volatile columns, for skipping IP-only changes."""
+        return tuple(column.text(container) for column, width in self.placed if not column.volatile)
+
+
+def register_column(column, before="unprivileged"):
+    keys = [existing.key for existing in columns]
+    if column.key in keys:
+        columns[keys.index(column.key)] = column
+    elif before in keys:
+        columns.insert(keys.index(before), column)
+    else:
+        columns.append(column)
+    _layout_cache.clear()
+
+
+def unregister_column(key):
+    columns[:] = [column for column in columns if column.key != key]
+    _layout_cache.clear()
+
+
+def compute_column_layout(width):
+    active = list(columns)
+
+    def needed(cols):
+        return sum(column.min_width for column in cols) + len(cols) - 1
+
+    while len(active) > 1 and needed(active) > width:
+        active.remove(min(active, key=lambda column: column.priority))
+
+    widths = {column.key: column.min_width for column in active}
+    spare = width - needed(active)
+    for column in sorted(active, key=lambda column: -column.priority):
+        if column.flex:
+            continue
+        grow = min(spare, column.width - column.min_width)
+        widths[column.key] += grow
+        spare -= grow
+    flex_columns = [column for column in active if column.flex]
+    for column in flex_columns:
+        widths[column.key] += spare // len(flex_columns)
+    return ColumnLayout(width, [(column, widths[column.key]) for column in active])
+
+
+def get_column_layout(width):
+    layout = _layout_cache.get(width)
+    if layout is None:
+        layout = compute_column_layout(width)
+        if len(_layout_cache) >= 16:
+            _layout_cache.clear()
+        _layout_cache[width] = layout
+        log_debug(f"Computed column layout for width {width}")
+    return layout
+
+
+def set_split_mode(mode):
+    global split_mode
+    if mode not in SPLIT_MODES:
+        raise ValueError(f"Unknown split mode: {mode}")
+    split_mode = mode
+
+
+def cycle_split_mode():
+    set_split_mode(SPLIT_MODES[(SPLIT_MODES.index(split_mode) + 1) % len(SPLIT_MODES)])
+    return split_mode
+
+
+class Rect:
+    def __init__(self, top, left, height, width):
+        self.top = top
+        self.left = left
+        self.height = height
+        self.width = width
+
+    def __eq__(self, other):
+        return isinstance(other, Rect) and vars(self) == vars(other)
+
+    def __repr__(self):
+        return f"Rect({self.top}, {self.left}, {self.height}, {self.width})"
+
+
+def compute_panes(lines, cols, mode=None):
+    """Return {pane name: Rect} for the current split mode.
+
+    The bottom two lines stay reserved for the status line and navigation bar.
+    """
+    mode = mode or split_mode
+    height = max(0, lines - 2)
+    if mode == "list" or cols < 100:
+        return {"list": Rect(0, 0, height, cols)}
+    list_width = cols * 3 // 5
+    return {
+        "list": Rect(0, 0, height, list_width),
+        mode: Rect(0, list_width + 1, height, cols - list_width - 1),
+    }
+
+
+def list_width(cols):
+    return compute_panes(2, cols)["list"].width
@@ -0,0 +1,165 @@
+import glob
+import mmap
+import os
+import re
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from lxc_tui.core import log_debug
+from lxc_tui.groups import CONFIG_DIR, raw_lxc_key
+from lxc_tui.panes import LOG_DIR
+
+MAX_MATCHES_PER_FILE = 1000
+MAX_LINE_BYTES = 512
+
+
+def console_logs(config_dir=CONFIG_DIR):
+    """Console log files set with lxc.console.logfile in the container configs."""
+    paths = []
+    for config in glob.glob(os.path.join(config_dir, "*.conf")):
+        try:
+            with open(config) as f:
+                for line in f:
+                    if line.startswith("["):
+                        break
+                    raw = raw_lxc_key(line)
+                    if raw is not None and raw[0] == "lxc.console.logfile" and raw[1]:
+                        paths.append(raw[1])
+        except OSError:
+            continue
+    return paths
+
+
+def log_files(log_dir=LOG_DIR, config_dir=CONFIG_DIR):
+    paths = sorted(glob.glob(os.path.join(log_dir, "*.log")))
+    for path in console_logs(config_dir):
+        if path not in paths and os.path.isfile(path):
+            paths.append(path)
+    return paths
+
+
+def compile_query(text):
+    """Byte regex for a query; case-insensitive unless it contains upper case."""
+    flags = 0 if any(char.isupper() for char in text) else re.IGNORECASE
+    try:
+        return re.compile(text.encode("utf-8"), flags | re.MULTILINE)
+    except re.error as e:
+        raise ValueError(f"Bad pattern: {e}")
+
+
+class Match:
+    def __init__(self, path, offset, text):
+        self.path = path
+        self.offset = offset
+        self.text = text
+
+    def describe(self):
+        return f"{os.path.basename(self.path)}@{self.offset}: {self.text}"
+
+
+def search_file(path, pattern, limit=MAX_MATCHES_PER_FILE, cancelled=None):
+    """Matching lines of path as Match objects, scanning it through mmap.
+
+    The regex runs directly over the mapping, so the kernel pages the file in
+    on demand and a multi-GB log never has to fit in memory. Each matching line
+    is reported once, with the byte offset of its start.
+    """
+    matches = []
+    try:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return matches
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                position = 0
+                while len(matches) < limit:
+                    if cancelled is not None and cancelled.is_set():
+                        break
+                    found = pattern.search(data, position)
+                    if found is None:
+                        break
+                    start = data.rfind(b"\n", 0, found.start()) + 1
+                    end = data.find(b"\n", found.end())
+                    end = len(data) if end == -1 else end
+                    line = data[start: min(end, start + MAX_LINE_BYTES)]
+                    matches.append(Match(path, start, line.decode("utf-8", errors="replace").rstrip("\r")))
+                    position = end + 1
+                    if position >= len(data):
+                        break
+    except (OSError, ValueError) as e:
+        log_debug(f"Cannot search {path}: {e}")
+    return matches
+
+
+class LogSearch:
+    """Searches many log files in parallel; results are published per finished file."""
+
+    def __init__(self, pattern, paths, workers=4):
+        self.pattern = pattern
+        self.paths = paths
+        self.lock = threading.Lock()
+        self.results = deque()
+        self.finished = 0
+        self.cancelled = threading.Event()
+        self.executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="log-search")
+        for path in paths:
+            self.executor.submit(self._search, path)
+        self.executor.shutdown(wait=False)
+
+    def _search(self, path):
+        matches = [] if self.cancelled.is_set() else search_file(path, self.pattern, cancelled=self.cancelled)
+        with self.lock:
+            self.results.extend(matches)
+            self.finished += 1
+
+    @property
+    def done(self):
+        with self.lock:
+            return self.finished == len(self.paths)
+
+    def drain(self):
+        with self.lock:
+            drained = list(self.results)
+            self.results.clear()
+        return drained
+
+    def cancel(self):
+        self.cancelled.set()
+
+
+def read_lines_at(path, offset, count):
+    """Up to count lines starting at byte offset, as (offset, text) pairs."""
+    lines = []
+    try:
+        with open(path, "rb") as f:
+            f.seek(offset)
+            while len(lines) < count:
+                raw = f.readline(MAX_LINE_BYTES * 8)
+                if not raw:
+                    break
+                lines.append((offset, raw.decode("utf-8", errors="replace").rstrip("\r\n")))
+                offset += len(raw)
+    except OSError as e:
+        log_debug(f"Cannot read {path}: {e}")
+    return lines
+
+
+def previous_line_offset(path, offset, count=1, block_size=4096):
+    """Byte offset of the line count lines before the one starting at offset."""
+    try:
+        with open(path, "rb") as f:
+            position = offset
+            data = b""
+            while position > 0 and data.count(b"\n") <= count:
+                step = min(block_size, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+    except OSError:
+        return offset
+    # data ends at offset, which is the start of a line, so its last byte is a newline
+    end = len(data) - 1
+    for _ in range(count):
+        end = data.rfind(b"\n", 0, end)
+        if end == -1:
+            return 0
+    return position + end + 1
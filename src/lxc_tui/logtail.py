@@ -0,0 +1,291 @@
+import bisect
+import ctypes
+import ctypes.util
+import itertools
+import os
+import re
+import selectors
+import struct
+import threading
+from datetime import datetime
+from lxc_tui import clock
+from lxc_tui.core import log_debug
+from lxc_tui.panes import LOG_DIR, tail_file
+
+IN_MODIFY = 0x2
+IN_ATTRIB = 0x4
+IN_MOVED_TO = 0x80
+IN_CREATE = 0x100
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+EVENT_HEADER = struct.Struct("iIII")
+MAX_READ = 1 << 20
+
+LXC_STAMP = re.compile(rb"^(?:\S+ ){1,2}(\d{14}\.\d{3}) ")
+ISO_STAMP = re.compile(rb"^\[?(\d{4}-\d{2}-\d{2})[T ](\d{2}:\d{2}:\d{2}(?:\.\d+)?)")
+
+
+def parse_timestamp(line):
+    """Timestamp of an LXC ("lxc-start 101 20241019123456.789 ...") or ISO-stamped line, or None."""
+    try:
+        match = LXC_STAMP.match(line)
+        if match:
+            return datetime.strptime(match.group(1).decode(), "%Y%m%d%H%M%S.%f").timestamp()
+        match = ISO_STAMP.match(line)
+        if match:
+            text = f"{match.group(1).decode()} {match.group(2).decode()}"
+            fmt = "%Y-%m-%d %H:%M:%S.%f" if "." in text else "%Y-%m-%d %H:%M:%S"
+            return datetime.strptime(text, fmt).timestamp()
+    except ValueError:
+        pass
+    return None
+
+
+class Inotify:
+    """Minimal ctypes wrapper around inotify; raises OSError where it is unavailable."""
+
+    def __init__(self):
+        libc_name = ctypes.util.find_library("c")
+        if libc_name is None:
+            raise OSError("libc not found")
+        self.libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(self.libc, "inotify_init1"):
+            raise OSError("inotify is not available")
+        self.fd = self.libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+    def add_watch(self, path, mask):
+        wd = self.libc.inotify_add_watch(self.fd, os.fsencode(path), mask)
+        if wd < 0:
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch {path} failed")
+        return wd
+
+    def read(self):
+        """(watch descriptor, file name) for every queued event."""
+        try:
+            data = os.read(self.fd, 65536)
+        except BlockingIOError:
+            return []
+        events = []
+        offset = 0
+        while offset + EVENT_HEADER.size <= len(data):
+            wd, mask, cookie, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = data[offset: offset + length].rstrip(b"\0").decode("utf-8", errors="replace")
+            offset += length
+            events.append((wd, name))
+        return events
+
+    def close(self):
+        os.close(self.fd)
+
+
+class RateLimiter:
+    """Token bucket: rate lines per second with bursts of up to burst lines."""
+
+    def __init__(self, rate, burst):
+        self.rate = rate
+        self.burst = burst
+        self.tokens = burst
+        self.last = None
+
+    def allow(self, now):
+        if self.last is not None:
+            self.tokens = min(self.burst, self.tokens + (now - self.last) * self.rate)
+        self.last = now
+        if self.tokens >= 1:
+            self.tokens -= 1
+            return True
+        return False
+
+
+class TailSource:
+    """One followed log file; survives truncation and rotation."""
+
+    def __init__(self, lxc_id, path, limiter):
+        self.lxc_id = lxc_id
+        self.path = path
+        self.limiter = limiter
+        self.file = None
+        self.inode = None
+        self.position = 0
+        self.partial = b""
+        self.dropped = 0
+        self.skipped_bytes = 0
+
+    def open(self, at_end=True):
+        try:
+            self.file = open(self.path, "rb")
+        except OSError:
+            self.file = None
+            return False
+        st = os.fstat(self.file.fileno())
+        self.inode = st.st_ino
+        self.position = st.st_size if at_end else 0
+        self.partial = b""
+        return True
+
+    def read_lines(self):
+        """Complete lines appended since the last call."""
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return []
+        if self.file is None or st.st_ino != self.inode:
+            if self.file is not None:
+                self.file.close()
+            if not self.open(at_end=False):
+                return []
+        elif st.st_size < self.position:
+            self.position = 0
+            self.partial = b""
+        if st.st_size == self.position:
+            return []
+        skip = st.st_size - self.position - MAX_READ
+        if skip > 0:
+            # Fell far behind a flooding writer: jump ahead rather than read it all
+            self.skipped_bytes += skip
+            self.position += skip
+            self.partial = b""
+        self.file.seek(self.position)
+        data = self.file.read(st.st_size - self.position)
+        self.position += len(data)
+        lines = (self.partial + data).split(b"\n")
+        self.partial = lines.pop()
+        if skip > 0 and lines:
+            lines.pop(0)
+        return lines
+
+    def close(self):
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+class MultiTail:
+    """Follows many log files from a single thread and merges them by timestamp.
+
+    The thread waits on one selector holding an inotify descriptor (one watch
+    per log directory) and a wake-up pipe; without inotify it falls back to
+    polling every poll_interval seconds. Lines are interleaved by their own
+    timestamp (arrival time when they have none) into a ring of capacity
+    entries. Each source is rate limited, and lines over its budget are
+    dropped and counted instead of starving the others.
+    """
+
+    def __init__(self, sources, capacity=2000, rate=50.0, burst=200, poll_interval=0.5, backlog=10):
+        self.sources = [TailSource(lxc_id, path, RateLimiter(rate, burst)) for lxc_id, path in sources]
+        self.capacity = capacity
+        self.poll_interval = poll_interval
+        self.backlog = backlog
+        self.lock = threading.Lock()
+        self.lines = []
+        self.counter = itertools.count()
+        self.version = 0
+        self.stop_event = threading.Event()
+        self.thread = None
+        self.inotify = None
+        self.watches = {}
+        self.wake_read, self.wake_write = os.pipe()
+
+    def _insert(self, stamp, lxc_id, text):
+        bisect.insort(self.lines, (stamp, next(self.counter), lxc_id, text))
+        if len(self.lines) > self.capacity:
+            del self.lines[: len(self.lines) - self.capacity]
+
+    def add_lines(self, source, raw_lines, now, limited=True):
+        added = 0
+        with self.lock:
+            for raw in raw_lines:
+                if limited and not source.limiter.allow(now):
+                    source.dropped += 1
+                    continue
+                stamp = parse_timestamp(raw)
+                text = raw.decode("utf-8", errors="replace").rstrip("\r")
+                self._insert(now if stamp is None else stamp, source.lxc_id, text)
+                added += 1
+            if added or limited:
+                self.version += 1
+        return added
+
+    def snapshot(self, count):
+        with self.lock:
+            return self.lines[-count:]
+
+    def dropped(self):
+        return {source.lxc_id: source.dropped for source in self.sources if source.dropped}
+
+    def _watch(self):
+        try:
+            self.inotify = Inotify()
+        except OSError as e:
+            log_debug(f"inotify unavailable, polling logs: {e}")
+            return
+        for source in self.sources:
+            directory, name = os.path.split(source.path)
+            try:
+                wd = self.inotify.add_watch(directory, IN_MODIFY | IN_CREATE | IN_MOVED_TO | IN_ATTRIB)
+            except OSError as e:
+                log_debug(f"Cannot watch {directory}: {e}")
+                continue
+            self.watches.setdefault((wd, name), []).append(source)
+
+    def start(self):
+        now = clock.now()
+        for source in self.sources:
+            seed = [line.encode("utf-8") for line in tail_file(source.path, self.backlog)]
+            self.add_lines(source, seed, now, limited=False)
+            source.open(at_end=True)
+        self._watch()
+        self.thread = threading.Thread(target=self.run, name="log-tail", daemon=True)
+        self.thread.start()
+
+    def poll(self, sources=None):
+        now = clock.now()
+        for source in self.sources if sources is None else sources:
+            lines = source.read_lines()
+            if lines:
+                self.add_lines(source, lines, now)
+
+    def run(self):
+        selector = selectors.DefaultSelector()
+        selector.register(self.wake_read, selectors.EVENT_READ, "wake")
+        if self.inotify is not None:
+            selector.register(self.inotify.fd, selectors.EVENT_READ, "inotify")
+        try:
+            # With inotify the timeout is only a safety net for missed events
+            timeout = self.poll_interval if self.inotify is None else self.poll_interval * 10
+            while not self.stop_event.is_set():
+                ready = selector.select(timeout)
+                if not ready:
+                    self.poll()
+                    continue
+                for key, _ in ready:
+                    if key.data == "inotify":
+                        changed = []
+                        for event in self.inotify.read():
+                            for source in self.watches.get(event, ()):
+                                if source not in changed:
+                                    changed.append(source)
+                        self.poll(changed)
+        except Exception as e:
+            log_debug(f"Log tail loop failed: {e}")
+        finally:
+            selector.close()
+
+    def stop(self):
+        self.stop_event.set()
+        os.write(self.wake_write, b"x")
+        if self.thread is not None:
+            self.thread.join(timeout=2)
+        if self.inotify is not None:
+            self.inotify.close()
+        for source in self.sources:
+            source.close()
+        os.close(self.wake_read)
+        os.close(self.wake_write)
+
+
+def container_logs(lxc_ids, log_dir=LOG_DIR):
+    return [(lxc_id, os.path.join(log_dir, f"{lxc_id}.log")) for lxc_id in lxc_ids]
@@ -5,10 +5,51 @@ import os
 import importlib
 import time
 import logging
-from lxc_tui.core import log_debug, Plugin, safe_addstr
-from lxc_tui.lxc_utils import get_lxc_info, refresh_lxc_info
-from lxc_tui.ui_components import display_container_list, update_navigation_bar
-from lxc_tui.event_handler import handle_events
+from lxc_tui.core import log_debug, Plugin, IsolatedPlugin, safe_addstr, AppContext, output_bytes
+from lxc_tui.history import EventLog, default_history_path
+from lxc_tui.cache import InventoryCache, default_cache_path
+from lxc_tui.panes import PaneManager
+from lxc_tui.attach import AttachManager, set_detached_sessions
+from lxc_tui.commands import CommandService
+from lxc_tui.audit import AuditLog, default_audit_path, set_audit_log
+from lxc_tui.netstats import NetStats, SYSFS_NET
+from lxc_tui.diskusage import DiskScanner
+from lxc_tui.health import HealthMonitor, load_health_config, default_health_config_path
+from lxc_tui.layout import Column, register_column
+from lxc_tui.groups import view as group_view
+from lxc_tui.lxc_utils import (
+    get_lxc_info,
+    refresh_lxc_info,
+    set_backend,
+    set_ip_resolver,
+    set_ips_on_demand,
+    request_ips,
+    lookup_ips,
+)
+from lxc_tui import clock, lxc_utils, ui_components
+from lxc_tui.ip_discovery import IpResolver
+from lxc_tui.exporter import run_exporter
+from lxc_tui.configindex import ConfigIndex, run_report
+from lxc_tui.backends import select_backend
+from lxc_tui.tracing import RecordingBackend, ReplayBackend
+from lxc_tui import plugin_host, tracing
+from lxc_tui.plugin_host import PluginHost
+from lxc_tui.notifications import notify, queue as notifications
+from lxc_tui.ui_components import (
+    display_container_list,
+    update_navigation_bar,
+    draw_status_line,
+    ResizeDebouncer,
+    FrameLimiter,
+    apply_resize,
+)
+from lxc_tui.event_handler import (
+    handle_events,
+    report_result,
+    apply_plugin_command,
+    attach_to_container,
+    INPUT_TIMEOUT,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -28,7 +69,7 @@ def load_plugins():
                     if (
                         isinstance(obj, type)
                         and issubclass(obj, Plugin)
-                        and obj != Plugin
+                        and obj not in (Plugin, IsolatedPlugin)
                     ):
                         plugin_instance = obj()
                         plugins.append(plugin_instance)
@@ -38,6 +79,61 @@ def load_plugins():
     return plugins
 
 
+def create_context():
+    context = AppContext()
+    try:
+        context.history = EventLog(default_history_path())
+        context.listeners.append(context.history.listener)
+    except OSError as e:
+        log_debug(f"History log disabled: {e}")
+    context.cache = InventoryCache(default_cache_path())
+    context.listeners.append(context.cache.listener)
+    context.listeners.append(group_view.index.update)
+    context.panes = PaneManager()
+    context.attach = AttachManager()
+    context.commands = CommandService()
+    context.plugin_host = PluginHost(in_process=plugin_host.trusted)
+    context.config_index = ConfigIndex()
+    context.resize = ResizeDebouncer()
+    context.frames = FrameLimiter(fps=5 if ui_components.low_bandwidth else 30, clock=clock.now)
+    if context.attach.available and not tracing.replaying:
+        register_column(
+            Column(
+                "session",
+                "ATT",
+                3,
+                priority=20,
+                value=lambda container: "*" if container[0] in context.attach.sessions() else "",
+            ),
+            before="id",
+        )
+    if tracing.replaying:
+        # These read the live host, not the trace, so they stay off in replay
+        return context
+    if os.path.isdir(SYSFS_NET):
+        context.netstats = NetStats()
+        for key, title in (("rx", "RX"), ("tx", "TX")):
+            register_column(
+                Column(
+                    key,
+                    title,
+                    8,
+                    priority=15,
+                    value=lambda container, key=key: context.netstats.rate_text(container[0], key),
+                    volatile=True,
+                )
+            )
+    context.disk = DiskScanner()
+    context.listeners.append(context.disk.listener)
+    register_column(Column("disk", "DISK", 7, priority=12, value=lambda c: context.disk.get(c[0])))
+    checks = load_health_config(default_health_config_path())
+    if checks:
+        context.health = HealthMonitor(checks)
+        context.listeners.append(context.health.listener)
+        register_column(Column("health", "HEALTH", 6, priority=30, value=context.health.get))
+    return context
+
+
 def main(stdscr):
     logger.debug("Checking screen size")
     if curses.LINES < 10 or curses.COLS < 80:
@@ -49,28 +145,45 @@ def main(stdscr):
     logger.debug("Setting up curses")
     curses.curs_set(0)
     stdscr.nodelay(True)
-    stdscr.timeout(50)
+    stdscr.timeout(INPUT_TIMEOUT)
 
     show_stopped = False
     lxc_info = []
-    invalid_key_timeout = None
     stop_event = threading.Event()
     pause_event = threading.Event()
     operation_done_event = threading.Event()
     current_row = 0
+    context = create_context()
 
-    logger.debug("Getting initial lxc_info")
-    try:
-        lxc_info = get_lxc_info(show_stopped)
-    except Exception as e:
-        log_debug(f"Error in main: {e}")
-        safe_addstr(stdscr, 0, 0, f"Error getting LXC info: {e}")
-        stdscr.refresh()
-        stdscr.getch()
-        return
+    logger.debug("Loading cached lxc_info")
+    lxc_info, stale_since = context.cache.load(show_stopped)
+    if stale_since is None:
+        logger.debug("Getting initial lxc_info")
+        try:
+            lxc_info = get_lxc_info(show_stopped)
+        except Exception as e:
+            log_debug(f"Error in main: {e}")
+            safe_addstr(stdscr, 0, 0, f"Error getting LXC info: {e}")
+            stdscr.refresh()
+            stdscr.getch()
+            return
+        context.notify_refresh(lxc_info, show_stopped)
+    else:
+        notify(
+            f"Showing cached inventory from {time.strftime('%H:%M:%S', time.localtime(stale_since))}, refreshing...",
+            ttl=3600,
+            key="stale",
+        )
+
+    if context.disk is not None:
+        context.disk.listener(lxc_info, show_stopped)
+        context.disk.start()
+    if context.health is not None:
+        context.health.listener(lxc_info, show_stopped)
+        context.health.start()
 
     logger.debug("Starting refresh thread")
-    refresh_thread = threading.Thread(target=refresh_lxc_info, args=(lxc_info, stop_event, pause_event, show_stopped))
+    refresh_thread = threading.Thread(target=refresh_lxc_info, args=(lxc_info, stop_event, pause_event, show_stopped, context))
     refresh_thread.daemon = True
     refresh_thread.start()
 
@@ -89,27 +202,67 @@ def main(stdscr):
     update_navigation_bar(stdscr, show_stopped, plugins, force=True)
 
     last_lxc_info = lxc_info.copy()
+    last_sessions = None
+    last_versions = None
 
     logger.debug("Entering main loop")
     while True:
         logger.debug("Loop iteration start")
-        if invalid_key_timeout and time.time() > invalid_key_timeout:
-            logger.debug("Clearing invalid_key_timeout")
-            safe_addstr(stdscr, curses.LINES - 2, 0, " " * (curses.COLS - 1), curses.color_pair(0))
-            invalid_key_timeout = None
+        if context.resize.due():
+            context.resize.clear()
+            apply_resize(stdscr, lxc_info, current_row, show_stopped, plugins, context)
 
-        logger.debug("Calling get_lxc_info")
-        new_lxc_info = get_lxc_info(show_stopped)
         logger.debug("Checking lxc_info")
-        if new_lxc_info != last_lxc_info:
-            lxc_info[:] = new_lxc_info
+        if stale_since is not None and context.last_refresh is not None:
+            logger.debug("Live refresh arrived, dropping cached inventory marker")
+            stale_since = None
+            notifications.dismiss("stale")
+        for result in context.commands.apply(lxc_info, show_stopped):
+            report_result(stdscr, result)
+            if result.lxc_id in context.pending_attach:
+                context.pending_attach.discard(result.lxc_id)
+                if result.ok:
+                    attach_to_container(stdscr, result.lxc_id, context)
+                    last_lxc_info = None
+        for plugin, command in context.plugin_host.collect():
+            current_row = apply_plugin_command(
+                stdscr, plugin, command, lxc_info, current_row, show_stopped, pause_event, operation_done_event,
+                context,
+            )
+        sessions = context.attach.sessions() if context.attach.available else None
+        if context.netstats is not None:
+            context.netstats.tick(lxc_info, clock.now())
+        column_versions = (
+            context.health.version if context.health is not None else None,
+            context.netstats.version if context.netstats is not None else None,
+            context.disk.version if context.disk is not None else None,
+        )
+        changed = (
+            lxc_info != last_lxc_info or sessions != last_sessions or column_versions != last_versions
+        )
+        if changed and context.frames.ready():
+            context.frames.mark()
             last_lxc_info = lxc_info.copy()
+            last_sessions = sessions
+            last_versions = column_versions
+            current_row = min(current_row, max(0, len(lxc_info) - 1))
             display_container_list(stdscr, lxc_info, current_row)
+            context.frames.discard()
+        elif draw_status_line(stdscr):
+            stdscr.refresh()
+        context.frames.flush(stdscr, current_row, lxc_info)
+
+        selected_id = lxc_info[current_row][0] if current_row < len(lxc_info) else None
+        if lxc_utils.ips_on_demand:
+            request_ips(selected_id)
+        context.panes.tick(stdscr, selected_id)
 
         logger.debug("Calling handle_events")
-        current_row, show_stopped, should_quit, invalid_key_timeout = handle_events(
-            stdscr, lxc_info, current_row, show_stopped, pause_event, stop_event, operation_done_event, plugins
+        current_row, show_stopped, should_quit = handle_events(
+            stdscr, lxc_info, current_row, show_stopped, pause_event, stop_event, operation_done_event, plugins,
+            context=context,
         )
+        context.show_stopped = show_stopped
         logger.debug(f"should_quit: {should_quit}")
 
         if should_quit:
@@ -117,6 +270,13 @@ def main(stdscr):
             stop_event.set()
             logger.debug("Joining thread")
             refresh_thread.join()
+            context.commands.shutdown()
+            context.plugin_host.shutdown()
+            if context.disk is not None:
+                context.disk.stop()
+            log_debug(f"Screen output: {output_bytes.total} bytes")
+            if context.health is not None:
+                context.health.shutdown()
             logger.debug("Breaking loop")
             break
         logger.debug("Loop iteration end")
@@ -126,6 +286,66 @@ if __name__ == "__main__":
     logging.basicConfig(level=logging.DEBUG)
     parser = argparse.ArgumentParser(description="LXC TUI")
     parser.add_argument("--debug", action="store_true", help="Enable debug logging")
+    parser.add_argument(
+        "--backend",
+        choices=["auto", "subprocess", "liblxc"],
+        default="auto",
+        help="Container backend (auto uses python3-lxc when installed)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="TRACE",
+        help="Record every backend call (listings, config reads, commands) with timings to TRACE",
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="TRACE",
+        help="Answer backend calls from a recorded TRACE instead of the real system",
+    )
+    parser.add_argument(
+        "--replay-speed",
+        type=float,
+        default=1.0,
+        help="Replay speed factor; 0 replays without the recorded delays",
+    )
+    parser.add_argument(
+        "--tmux-detached",
+        action="store_true",
+        help="Outside tmux/screen, open attach sessions in a detached 'lxc-tui' tmux session",
+    )
+    parser.add_argument(
+        "--trusted-plugins",
+        action="store_true",
+        help="Run isolated plugins in-process instead of in worker processes",
+    )
+    parser.add_argument(
+        "--sync-ips",
+        action="store_true",
+        help="Read IP columns from lxc-ls in the refresh instead of parallel lookups",
+    )
+    parser.add_argument(
+        "--low-bandwidth",
+        action="store_true",
+        help="Cap the frame rate, redraw only changed rows and look up IPs for the selected container only",
+    )
+    parser.add_argument(
+        "--exporter",
+        metavar="[HOST]:PORT",
+        help="Serve Prometheus metrics on this address instead of starting the TUI",
+    )
+    parser.add_argument(
+        "--exporter-interval",
+        type=float,
+        default=10.0,
+        help="Seconds between background collections in exporter mode",
+    )
+    parser.add_argument(
+        "--report",
+        nargs="*",
+        metavar="QUERY",
+        help="Print a config report instead of starting the TUI: drift across all containers, "
+        "or the containers matching each QUERY (nesting=1, 'mp*=/mnt/backup*', 'diff 101 205')",
+    )
     args = parser.parse_args()
     import lxc_tui.core
 
@@ -135,9 +355,48 @@ if __name__ == "__main__":
         with open("debug_log.txt", "w") as debug_file:
             debug_file.write(f"Debugging started at {time.ctime()}\n")
 
+    if args.replay:
+        backend = ReplayBackend(args.replay, args.replay_speed)
+        tracing.set_replaying(True)
+    else:
+        backend = select_backend(args.backend)
+    if args.record:
+        backend = RecordingBackend(backend, args.record)
+    set_backend(backend)
+    resolver = None if args.sync_ips and not args.low_bandwidth else IpResolver(lookup_ips)
+    set_ip_resolver(resolver)
+    set_ips_on_demand(args.low_bandwidth)
+    ui_components.set_low_bandwidth(args.low_bandwidth)
+    plugin_host.set_trusted(args.trusted_plugins)
+    set_detached_sessions(args.tmux_detached)
+    audit_log = None
+    if args.replay:
+        # Replayed commands never ran on this host; keep them out of its audit trail
+        log_debug("Audit log disabled while replaying")
+    else:
+        try:
+            audit_log = AuditLog(default_audit_path())
+        except OSError as e:
+            log_debug(f"Audit log disabled: {e}")
+    set_audit_log(audit_log)
+
+    status = 0
     try:
-        curses.wrapper(main)
+        if args.report is not None:
+            status = run_report(args.report)
+        elif args.exporter:
+            run_exporter(args.exporter, args.exporter_interval)
+        else:
+            curses.wrapper(main)
     except Exception as e:
         log_debug(f"Error running the TUI: {e}")
         print(f"Error running the TUI: {e}")
         input("Press Enter to exit...")
+    finally:
+        if resolver is not None:
+            resolver.shutdown()
+        if audit_log is not None:
+            audit_log.close()
+        if args.record:
+            backend.close()
+    raise SystemExit(status)
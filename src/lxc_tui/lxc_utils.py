@@ -1,8 +1,7 @@
 import subprocess
 import os
-import time
-import curses
-from lxc_tui.core import log_debug, safe_addstr
+from lxc_tui.core import log_debug
+from lxc_tui import clock
 
 
 def get_lxc_column(column_name):
@@ -27,12 +26,117 @@ def get_lxc_column(column_name):
         return []
 
 
+backend = None
+ip_resolver = None
+
+
+def set_backend(new_backend):
+    global backend
+    backend = new_backend
+    log_debug(f"Using {new_backend.name if new_backend else 'subprocess'} backend")
+
+
+def set_ip_resolver(resolver):
+    global ip_resolver
+    ip_resolver = resolver
+
+
+ips_on_demand = False
+ip_requests = set()
+
+
+def set_ips_on_demand(enabled):
+    global ips_on_demand
+    ips_on_demand = enabled
+
+
+def request_ips(*lxc_ids):
+    """In on-demand mode, only these containers get their IPs looked up."""
+    ip_requests.clear()
+    ip_requests.update(lxc_id for lxc_id in lxc_ids if lxc_id is not None)
+
+
+def get_lxc_ips(lxc_id, timeout=2):
+    result = subprocess.run(
+        ["lxc-info", "-n", lxc_id, "-i", "-H"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        timeout=timeout,
+        start_new_session=True,
+    )
+    addresses = [
+        line.strip()
+        for line in result.stdout.splitlines()
+        if line.strip() and line.strip() not in ("127.0.0.1", "::1")
+    ]
+    ipv4_addresses = [address for address in addresses if ":" not in address]
+    ipv6_addresses = [address for address in addresses if ":" in address]
+    return ", ".join(ipv4_addresses + ipv6_addresses)
+
+
+def get_lxc_state(lxc_id, timeout=5):
+    result = subprocess.run(
+        ["lxc-info", "-n", lxc_id, "-s", "-H"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        timeout=timeout,
+        start_new_session=True,
+    )
+    return result.stdout.strip() or None
+
+
+def lookup_state(lxc_id):
+    if backend is not None:
+        return backend.get_state(lxc_id)
+    return get_lxc_state(lxc_id)
+
+
+def lookup_ips(lxc_id):
+    if backend is not None:
+        return backend.get_ips(lxc_id)
+    return get_lxc_ips(lxc_id)
+
+
+def read_config_file(lxc_id):
+    config_file = f"/etc/pve/lxc/{lxc_id}.conf"
+    if not os.path.exists(config_file):
+        return None
+    with open(config_file) as f:
+        return f.read()
+
+
+def read_config(lxc_id):
+    if backend is not None:
+        return backend.read_config(lxc_id)
+    return read_config_file(lxc_id)
+
+
+def read_hostname(lxc_id):
+    hostname = "Unknown"
+    for config_line in (read_config(lxc_id) or "").splitlines():
+        if "hostname" in config_line:
+            hostname = config_line.split(":")[1].strip()
+            break
+    return hostname
+
+
 def get_lxc_info(include_stopped=False):
+    if backend is not None:
+        return backend.get_lxc_info(include_stopped)
+    return query_lxc_info(include_stopped)
+
+
+def query_lxc_info(include_stopped=False):
     try:
         names = get_lxc_column("NAME")
         states = get_lxc_column("STATE")
-        ipv4s = get_lxc_column("IPV4")
-        ipv6s = get_lxc_column("IPV6")
+        if ip_resolver is None:
+            ipv4s = get_lxc_column("IPV4")
+            ipv6s = get_lxc_column("IPV6")
+        else:
+            ipv4s = ipv6s = ["-"] * len(names)
         unprivilegeds = get_lxc_column("UNPRIVILEGED")
 
         min_length = min(
@@ -55,16 +159,10 @@ def get_lxc_info(include_stopped=False):
             ipv4_addresses = ipv4.split(", ") if ipv4 != "-" else []
             ipv6_addresses = ipv6.split(", ") if ipv6 != "-" else []
             ip_addresses = ", ".join(filter(None, ipv4_addresses + ipv6_addresses))
+            if ip_resolver is not None:
+                ip_addresses = resolve_ips(lxc_id, status)
 
-            config_file = f"/etc/pve/lxc/{lxc_id}.conf"
-            hostname = "Unknown"
-            if os.path.exists(config_file):
-                with open(config_file) as f:
-                    for config_line in f:
-                        if "hostname" in config_line:
-                            hostname = config_line.split(":")[1].strip()
-                            break
-
+            hostname = read_hostname(lxc_id)
             lxc_info.append((lxc_id, hostname, status, ip_addresses, unprivileged))
 
         return lxc_info
@@ -73,73 +171,54 @@ def get_lxc_info(include_stopped=False):
         return []
 
 
-def get_lxc_config(lxc_id):
-    config_file = f"/etc/pve/lxc/{lxc_id}.conf"
-    config_info = {}
-    if os.path.exists(config_file):
-        with open(config_file) as conf_file:
-            config_info = dict(
-                line.strip().split(":", 1) for line in conf_file if ":" in line
-            )
-    return config_info
+def resolve_ips(lxc_id, status):
+    if status != "RUNNING":
+        ip_resolver.forget(lxc_id)
+        return ""
+    if ips_on_demand and lxc_id not in ip_requests:
+        return ip_resolver.peek(lxc_id)
+    return ip_resolver.get(lxc_id)
 
 
-def execute_lxc_command(stdscr, command, operation_done_event):
-    try:
-        log_debug(f"Executing command: {' '.join(command)}")
-        with open(os.devnull, "w") as devnull:
-            proc = subprocess.Popen(
-                command, start_new_session=True, stdout=devnull, stderr=devnull
-            )
-            animation = ["|", "/", "-", "\\"]
-            idx = 0
-            start_time = time.time()
-            while proc.poll() is None and (time.time() - start_time) < 15:
-                safe_addstr(
-                    stdscr,
-                    curses.LINES - 2,
-                    0,
-                    f"Executing {command[0]} {command[-1]} {animation[idx % 4]}",
-                    curses.color_pair(4),
-                )
-                stdscr.refresh()
-                time.sleep(0.1)
-                idx += 1
-            proc.wait(timeout=15 - (time.time() - start_time))
-        log_debug(f"Command completed with return code {proc.returncode}")
-        return proc.returncode == 0
-    except subprocess.TimeoutExpired as e:
-        log_debug(f"Command timed out: {e}")
-        proc.kill()
-        safe_addstr(
-            stdscr,
-            curses.LINES - 2,
-            0,
-            f"Command {command[0]} {command[-1]} timed out",
-            curses.color_pair(2),
-        )
-        stdscr.refresh()
-        time.sleep(2)
-        return False
-    except Exception as e:
-        log_debug(f"Error executing command: {e}")
-        safe_addstr(
-            stdscr,
-            curses.LINES - 2,
-            0,
-            f"Error executing {command[0]} {command[-1]}: {e}",
-            curses.color_pair(2),
+def get_lxc_config(lxc_id):
+    return dict(
+        line.strip().split(":", 1)
+        for line in (read_config(lxc_id) or "").splitlines(keepends=True)
+        if ":" in line
+    )
+
+
+def spawn_command(command, output=False):
+    if backend is not None:
+        return backend.spawn(command, output)
+    if output:
+        return subprocess.Popen(
+            command,
+            start_new_session=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
         )
-        stdscr.refresh()
-        time.sleep(2)
-        return False
+    return subprocess.Popen(
+        command,
+        start_new_session=True,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+    )
 
 
-def refresh_lxc_info(lxc_info, stop_event, pause_event, show_stopped):
+def refresh_lxc_info(lxc_info, stop_event, pause_event, show_stopped, context=None):
     while not stop_event.is_set():
         if not pause_event.is_set():
+            if context is not None:
+                show_stopped = context.show_stopped
             new_lxc_info = get_lxc_info(show_stopped)
             if new_lxc_info != lxc_info:
                 lxc_info[:] = new_lxc_info
                 log_debug("LXC info refreshed")
-        time.sleep(0.5)
+                if context is not None:
+                    context.notify_refresh(new_lxc_info, show_stopped)
+            if context is not None:
+                context.last_refresh = clock.now()
+        clock.wait(stop_event, 0.5)
@@ -0,0 +1,80 @@
+import os
+from lxc_tui import clock
+
+CGROUP_ROOT = "/sys/fs/cgroup"
+
+
+def cgroup_path(lxc_id, root=CGROUP_ROOT):
+    for candidate in (
+        os.path.join(root, "lxc", lxc_id),
+        os.path.join(root, f"lxc.payload.{lxc_id}"),
+        os.path.join(root, "lxc.payload", lxc_id),
+    ):
+        if os.path.isdir(candidate):
+            return candidate
+    return None
+
+
+def _read_int(path):
+    try:
+        with open(path) as f:
+            value = f.read().strip()
+        return None if value == "max" else int(value)
+    except (OSError, ValueError):
+        return None
+
+
+def _read_keyed(path):
+    values = {}
+    try:
+        with open(path) as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) == 2 and parts[1].isdigit():
+                    values[parts[0]] = int(parts[1])
+    except OSError:
+        pass
+    return values
+
+
+def read_cgroup_metrics(lxc_id, root=CGROUP_ROOT):
+    """Return a dict of cgroup v2 resource counters, empty when unavailable."""
+    path = cgroup_path(lxc_id, root)
+    if path is None:
+        return {}
+    metrics = {}
+    for key, filename in (
+        ("memory_bytes", "memory.current"),
+        ("memory_limit_bytes", "memory.max"),
+        ("swap_bytes", "memory.swap.current"),
+        ("pids", "pids.current"),
+    ):
+        value = _read_int(os.path.join(path, filename))
+        if value is not None:
+            metrics[key] = value
+    cpu = _read_keyed(os.path.join(path, "cpu.stat"))
+    if "usage_usec" in cpu:
+        metrics["cpu_usage_usec"] = cpu["usage_usec"]
+    return metrics
+
+
+def format_bytes(value):
+    for unit in ("B", "K", "M", "G", "T"):
+        if abs(value) < 1024 or unit == "T":
+            return f"{value:.0f}{unit}" if unit == "B" else f"{value:.1f}{unit}"
+        value /= 1024.0
+
+
+class CpuTracker:
+    """Turns cumulative cpu usage_usec counters into a percentage of one CPU."""
+
+    def __init__(self):
+        self.samples = {}
+
+    def percent(self, lxc_id, usage_usec, now=None):
+        now = clock.now() if now is None else now
+        previous = self.samples.get(lxc_id)
+        self.samples[lxc_id] = (now, usage_usec)
+        if previous is None or now <= previous[0]:
+            return None
+        return max(0.0, (usage_usec - previous[1]) / ((now - previous[0]) * 1e6) * 100)
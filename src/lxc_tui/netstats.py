@@ -0,0 +1,154 @@
+import os
+import re
+from array import array
+from lxc_tui.groups import CONFIG_DIR, MtimeCache, raw_lxc_key
+from lxc_tui.metrics import format_bytes
+from lxc_tui import clock
+
+SYSFS_NET = "/sys/class/net"
+NET_LINE = re.compile(r"^net(\d+):")
+VETH_PAIR = re.compile(r"^lxc\.net\.(\d+)\.veth\.pair$")
+
+
+def parse_veth_names(path, lxc_id):
+    """Host-side veth names for a container config.
+
+    Proxmox names the host end of netN "veth<id>i<N>"; an explicit
+    lxc.net.N.veth.pair (as "key: value" or "key = value") overrides that.
+    """
+    names = {}
+    with open(path) as f:
+        for line in f:
+            if line.startswith("["):
+                break
+            match = NET_LINE.match(line)
+            if match:
+                names.setdefault(int(match.group(1)), f"veth{lxc_id}i{match.group(1)}")
+            raw = raw_lxc_key(line)
+            match = VETH_PAIR.match(raw[0]) if raw is not None else None
+            if match and raw[1]:
+                names[int(match.group(1))] = raw[1]
+    return [names[index] for index in sorted(names)]
+
+
+class CounterRing:
+    """Fixed-size ring of (time, rx, tx) samples stored in typed arrays."""
+
+    def __init__(self, capacity=60):
+        self.capacity = capacity
+        self.times = array("d", [0.0] * capacity)
+        self.rx = array("Q", [0] * capacity)
+        self.tx = array("Q", [0] * capacity)
+        self.count = 0
+        self.head = 0
+
+    def append(self, now, rx, tx):
+        self.times[self.head] = now
+        self.rx[self.head] = rx
+        self.tx[self.head] = tx
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+
+    def _index(self, back):
+        return (self.head - 1 - back) % self.capacity
+
+    def rate(self):
+        """(rx bytes/s, tx bytes/s) between the two newest samples, or None."""
+        if self.count < 2:
+            return None
+        new, old = self._index(0), self._index(1)
+        elapsed = self.times[new] - self.times[old]
+        if elapsed <= 0 or self.rx[new] < self.rx[old] or self.tx[new] < self.tx[old]:
+            return None
+        return (
+            (self.rx[new] - self.rx[old]) / elapsed,
+            (self.tx[new] - self.tx[old]) / elapsed,
+        )
+
+
+def _read_counter(path):
+    try:
+        with open(path, "rb") as f:
+            return int(f.read())
+    except (OSError, ValueError):
+        return None
+
+
+class NetStats:
+    """Samples host-side veth counters for all running containers in one sweep.
+
+    RX and TX are from the container's point of view, so they are the veth's
+    tx_bytes and rx_bytes respectively.
+    """
+
+    def __init__(self, sysfs_root=SYSFS_NET, config_dir=CONFIG_DIR, interval=1.0, capacity=60):
+        self.sysfs_root = sysfs_root
+        self.config_dir = config_dir
+        self.interval = interval
+        self.capacity = capacity
+        self.veths = {}
+        self.rings = {}
+        self.last_sweep = None
+        self.version = 0
+        self.texts = {}
+
+    def veth_names(self, lxc_id):
+        cache = self.veths.get(lxc_id)
+        if cache is None:
+            cache = self.veths[lxc_id] = MtimeCache(lambda path: parse_veth_names(path, lxc_id))
+        return cache.get(os.path.join(self.config_dir, f"{lxc_id}.conf"), [])
+
+    def read_totals(self, lxc_id):
+        rx = tx = 0
+        found = False
+        for veth in self.veth_names(lxc_id):
+            statistics = os.path.join(self.sysfs_root, veth, "statistics")
+            veth_rx = _read_counter(os.path.join(statistics, "rx_bytes"))
+            veth_tx = _read_counter(os.path.join(statistics, "tx_bytes"))
+            if veth_rx is None or veth_tx is None:
+                continue
+            rx += veth_tx
+            tx += veth_rx
+            found = True
+        return (rx, tx) if found else None
+
+    def sweep(self, lxc_info, now=None):
+        now = clock.now() if now is None else now
+        running = set()
+        for lxc_id, hostname, status, ip_addresses, unprivileged in lxc_info:
+            if status != "RUNNING":
+                continue
+            running.add(lxc_id)
+            totals = self.read_totals(lxc_id)
+            if totals is None:
+                self.rings.pop(lxc_id, None)
+                continue
+            ring = self.rings.get(lxc_id)
+            if ring is None:
+                ring = self.rings[lxc_id] = CounterRing(self.capacity)
+            ring.append(now, *totals)
+        for lxc_id in [i for i in self.rings if i not in running]:
+            del self.rings[lxc_id]
+        self.last_sweep = now
+        texts = {lxc_id: (self.rate_text(lxc_id, "rx"), self.rate_text(lxc_id, "tx")) for lxc_id in self.rings}
+        if texts != self.texts:
+            # Only a change in what the columns show is worth a repaint
+            self.texts = texts
+            self.version += 1
+
+    def tick(self, lxc_info, now=None):
+        now = clock.now() if now is None else now
+        if self.last_sweep is not None and now - self.last_sweep < self.interval:
+            return False
+        self.sweep(lxc_info, now)
+        return True
+
+    def rate(self, lxc_id):
+        ring = self.rings.get(lxc_id)
+        return ring.rate() if ring is not None else None
+
+    def rate_text(self, lxc_id, direction):
+        rate = self.rate(lxc_id)
+        if rate is None:
+            return ""
+        return f"{format_bytes(rate[0 if direction == 'rx' else 1])}/s"
@@ -0,0 +1,105 @@
+import threading
+import time
+from collections import deque
+from lxc_tui.clock import now as current_time
+
+INFO = 0
+SUCCESS = 1
+WARNING = 2
+ERROR = 3
+
+PRIORITY_NAMES = {INFO: "info", SUCCESS: "ok", WARNING: "warning", ERROR: "error"}
+DEFAULT_TTL = {INFO: 3.0, SUCCESS: 3.0, WARNING: 5.0, ERROR: 8.0}
+
+
+class Notification:
+    def __init__(self, text, priority, posted, expires, key=None):
+        self.text = text
+        self.priority = priority
+        self.posted = posted
+        self.expires = expires
+        self.key = key
+        self.count = 1
+
+    def label(self):
+        return f"{self.text} (x{self.count})" if self.count > 1 else self.text
+
+    def describe(self):
+        stamp = time.strftime("%H:%M:%S", time.localtime(self.posted))
+        return f"{stamp} {PRIORITY_NAMES[self.priority]:<7} {self.label()}"
+
+
+class NotificationQueue:
+    """Bounded queue of status-line messages, shown one at a time.
+
+    A message posted again while it is still queued collapses into a repeat
+    counter; posting with a key replaces that key's text in place. Expiry is
+    checked against the time the main loop passes to select(), so nothing
+    waits for a message to go away. The shown message stays up for at least
+    min_display seconds unless one with a higher priority arrives.
+    """
+
+    def __init__(self, maxlen=8, history=200, min_display=1.0, clock=current_time):
+        self.maxlen = maxlen
+        self.min_display = min_display
+        self.clock = clock
+        self.lock = threading.Lock()
+        self.pending = []
+        self.history = deque(maxlen=history)
+        self.current = None
+        self.shown_at = 0.0
+
+    def post(self, text, priority=INFO, ttl=None, key=None, now=None):
+        now = self.clock() if now is None else now
+        expires = now + (DEFAULT_TTL[priority] if ttl is None else ttl)
+        with self.lock:
+            for notification in self.pending:
+                if key is not None and notification.key == key:
+                    notification.text = text
+                    notification.priority = priority
+                    notification.expires = expires
+                    return notification
+                if key is None and notification.text == text and notification.priority == priority:
+                    notification.count += 1
+                    notification.expires = max(notification.expires, expires)
+                    return notification
+            notification = Notification(text, priority, now, expires, key)
+            self.pending.append(notification)
+            self.history.append(notification)
+            if len(self.pending) > self.maxlen:
+                self.pending.remove(
+                    min(self.pending, key=lambda n: (n is self.current, n.priority, n.posted))
+                )
+            return notification
+
+    def dismiss(self, key):
+        with self.lock:
+            self.pending = [n for n in self.pending if n.key != key]
+
+    def select(self, now=None):
+        """Return the notification to show at `now`, or None for an empty status line."""
+        now = self.clock() if now is None else now
+        with self.lock:
+            self.pending = [n for n in self.pending if n.expires > now]
+            if self.current not in self.pending:
+                self.current = None
+            if not self.pending:
+                return None
+            best = max(self.pending, key=lambda n: (n.priority, n.posted))
+            if self.current is None or best.priority > self.current.priority:
+                self.current, self.shown_at = best, now
+            elif best is not self.current and now - self.shown_at >= self.min_display:
+                self.pending.remove(self.current)
+                self.current, self.shown_at = best, now
+            return self.current
+
+    def recent(self):
+        with self.lock:
+            return list(self.history)
+
+
+queue = NotificationQueue()
+
+
+def notify(text, priority=INFO, ttl=None, key=None):
+    return queue.post(text, priority, ttl, key)
@@ -0,0 +1,167 @@
+import fnmatch
+import os
+import threading
+from concurrent.futures import wait
+from lxc_tui.core import log_debug
+from lxc_tui.commands import ACTIONS, action_commands
+from lxc_tui.notifications import notify, SUCCESS, ERROR
+from lxc_tui.jobs import DONE
+from lxc_tui.snapshots import new_snapshot_name, shared_store
+
+# States a container must be in for each action to apply; None means any.
+REQUIRED_STATE = {
+    "start": "STOPPED",
+    "stop": "RUNNING",
+    "restart": "RUNNING",
+    "snapshot": None,
+}
+
+RESULT_STATE = {
+    "start": "RUNNING",
+    "stop": "STOPPED",
+    "restart": "RUNNING",
+}
+
+history = []
+
+
+class PlanStep:
+    def __init__(self, action, lxc_ids, skipped):
+        self.action = action
+        self.lxc_ids = lxc_ids
+        self.skipped = skipped
+
+    def __repr__(self):
+        return f"PlanStep({self.action!r}, {self.lxc_ids}, skipped={self.skipped})"
+
+
+def parse_command(text):
+    """Split "stop 101-105; snapshot 101-105; start 101-105" into (action, targets)."""
+    statements = []
+    for statement in text.split(";"):
+        words = statement.split()
+        if not words:
+            continue
+        action = words[0].lower()
+        if action not in ACTIONS:
+            raise ValueError(f"Unknown action '{words[0]}' (use {', '.join(ACTIONS)})")
+        if len(words) < 2:
+            raise ValueError(f"'{action}' needs at least one target")
+        statements.append((action, words[1:]))
+    if not statements:
+        raise ValueError("Empty command")
+    return statements
+
+
+def _in_range(lxc_id, target):
+    low, high = target.split("-", 1)
+    try:
+        return int(low) <= int(lxc_id) <= int(high)
+    except ValueError:
+        return False
+
+
+def target_matches(target, container, index):
+    lxc_id, hostname, status, ip_addresses, unprivileged = container
+    kind, _, value = target.partition(":")
+    if not value:
+        if target in ("all", "*"):
+            return True
+        if "-" in target and target[0].isdigit():
+            return _in_range(lxc_id, target)
+        return lxc_id == target
+    if kind == "tag":
+        tags = index.tags.get(os.path.join(index.config_dir, f"{lxc_id}.conf"), [])
+        return value in tags
+    if kind == "pool":
+        return index.pools.get(index.pool_config, {}).get(lxc_id) == value
+    if kind == "state":
+        return status == value.upper()
+    if kind == "name":
+        return fnmatch.fnmatch(hostname, value)
+    raise ValueError(f"Unknown target '{target}' (use id, 101-120, tag:, pool:, state:, name:)")
+
+
+def resolve_targets(targets, lxc_info, index):
+    return [
+        container
+        for container in lxc_info
+        if any(target_matches(target, container, index) for target in targets)
+    ]
+
+
+def build_plan(text, lxc_info, index):
+    """Resolve a palette command against lxc_info into ordered steps.
+
+    Steps run one after another and the containers inside a step run in
+    parallel, so a restart becomes "stop all of them" followed by "start all of
+    them" rather than one container at a time. Eligibility is checked against
+    the state the earlier steps leave behind, so "stop 101; start 101" starts
+    101 again.
+    """
+    plan = []
+    states = {c[0]: c[2] for c in lxc_info}
+    for action, targets in parse_command(text):
+        containers = resolve_targets(targets, lxc_info, index)
+        required = REQUIRED_STATE[action]
+        eligible = [c[0] for c in containers if required is None or states[c[0]] == required]
+        skipped = [c[0] for c in containers if c[0] not in eligible]
+        if action in RESULT_STATE:
+            states.update((lxc_id, RESULT_STATE[action]) for lxc_id in eligible)
+        if action == "restart":
+            plan.append(PlanStep("stop", eligible, skipped))
+            plan.append(PlanStep("start", list(eligible), []))
+        else:
+            plan.append(PlanStep(action, eligible, skipped))
+    return plan
+
+
+def describe_plan(plan):
+    lines = []
+    for number, step in enumerate(plan, start=1):
+        ids = ", ".join(step.lxc_ids) or "nothing"
+        lines.append(f"{number}. {step.action} {ids}")
+        if step.skipped:
+            lines.append(f"   skipped (wrong state): {', '.join(step.skipped)}")
+    return lines
+
+
+def plan_size(plan):
+    return sum(len(step.lxc_ids) for step in plan)
+
+
+def execute_plan(plan, service, store=None):
+    """Run plan step by step; snapshots go to the snapshot store's jobs, the rest to service."""
+    failed = 0
+    for step in plan:
+        if not step.lxc_ids:
+            continue
+        log_debug(f"Plan step: {step.action} {step.lxc_ids}")
+        futures = []
+        jobs = []
+        for lxc_id in step.lxc_ids:
+            try:
+                if step.action == "snapshot":
+                    store = store or shared_store()
+                    jobs.append(store.create(lxc_id, new_snapshot_name()))
+                else:
+                    futures.append(service.submit(lxc_id, action_commands(step.action, lxc_id), step.action))
+            except (RuntimeError, ValueError) as e:
+                notify(f"Cannot {step.action} {lxc_id}: {e}", ERROR)
+                failed += 1
+        wait(futures)
+        failed += sum(1 for future in futures if future.exception() or not future.result().ok)
+        for job in jobs:
+            job.done.wait()
+        failed += sum(1 for job in jobs if job.state != DONE)
+    if failed:
+        notify(f"Plan finished with {failed} failed operation(s)", ERROR, key="plan")
+    else:
+        notify(f"Plan finished: {plan_size(plan)} operation(s)", SUCCESS, key="plan")
+    return failed
+
+
+def run_plan(plan, service, store=None):
+    thread = threading.Thread(target=execute_plan, args=(plan, service, store), daemon=True)
+    thread.start()
+    return thread
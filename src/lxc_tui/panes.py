@@ -0,0 +1,139 @@
+import curses
+import os
+from lxc_tui.core import log_debug, safe_addstr
+from lxc_tui.layout import compute_panes
+from lxc_tui.metrics import CpuTracker, format_bytes, read_cgroup_metrics
+from lxc_tui import clock
+
+LOG_DIR = "/var/log/lxc"
+
+
+def tail_file(path, max_lines, block_size=4096):
+    """Return the last max_lines lines of path, reading backwards from the end."""
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            position = f.tell()
+            data = b""
+            while position > 0 and data.count(b"\n") <= max_lines:
+                step = min(block_size, position)
+                position -= step
+                f.seek(position)
+                data = f.read(step) + data
+    except OSError:
+        return []
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return lines[-max_lines:]
+
+
+class Pane:
+    """A side pane that polls its data every interval seconds."""
+
+    title = ""
+    interval = 5.0
+
+    def lines(self, lxc_id, height):
+        raise NotImplementedError("Pane must implement lines method")
+
+
+class DetailsPane(Pane):
+    title = "Details"
+    interval = 5.0
+
+    def lines(self, lxc_id, height):
+        from lxc_tui.lxc_utils import get_lxc_config
+
+        return [f"{key.strip()}: {value.strip()}" for key, value in get_lxc_config(lxc_id).items()]
+
+
+class MetricsPane(Pane):
+    title = "Metrics"
+    interval = 1.0
+
+    def __init__(self):
+        self.cpu = CpuTracker()
+
+    def lines(self, lxc_id, height):
+        metrics = read_cgroup_metrics(lxc_id)
+        if not metrics:
+            return ["No cgroup metrics available"]
+        lines = []
+        if "cpu_usage_usec" in metrics:
+            percent = self.cpu.percent(lxc_id, metrics["cpu_usage_usec"])
+            lines.append(f"CPU:    {'...' if percent is None else f'{percent:.1f}%'}")
+        if "memory_bytes" in metrics:
+            limit = metrics.get("memory_limit_bytes")
+            suffix = f" / {format_bytes(limit)}" if limit else ""
+            lines.append(f"Memory: {format_bytes(metrics['memory_bytes'])}{suffix}")
+        if "swap_bytes" in metrics:
+            lines.append(f"Swap:   {format_bytes(metrics['swap_bytes'])}")
+        if "pids" in metrics:
+            lines.append(f"PIDs:   {metrics['pids']}")
+        return lines
+
+
+class LogPane(Pane):
+    title = "Log"
+    interval = 1.0
+
+    def __init__(self, log_dir=LOG_DIR):
+        self.log_dir = log_dir
+
+    def lines(self, lxc_id, height):
+        lines = tail_file(os.path.join(self.log_dir, f"{lxc_id}.log"), height)
+        return lines or ["No log output"]
+
+
+class PaneManager:
+    """Draws the side pane of the current split mode, only when its content changes."""
+
+    def __init__(self, panes=None):
+        self.panes = panes or {
+            "details": DetailsPane(),
+            "metrics": MetricsPane(),
+            "log": LogPane(),
+        }
+        self.drawn = {}
+        self.polled = {}
+
+    def invalidate(self):
+        self.drawn.clear()
+        self.polled.clear()
+
+    def tick(self, stdscr, lxc_id, now=None):
+        now = clock.now() if now is None else now
+        redrawn = False
+        for name, rect in compute_panes(curses.LINES, curses.COLS).items():
+            pane = self.panes.get(name)
+            if pane is None:
+                continue
+            key = (lxc_id, rect.top, rect.left, rect.height, rect.width)
+            last_poll = self.polled.get(name)
+            if last_poll is not None and last_poll[0] == key and now - last_poll[1] < pane.interval:
+                continue
+            self.polled[name] = (key, now)
+            try:
+                content = pane.lines(lxc_id, rect.height - 1) if lxc_id else []
+            except Exception as e:
+                log_debug(f"Pane {name} failed: {e}")
+                content = [f"Error: {e}"]
+            if self.drawn.get(name) == (key, content):
+                continue
+            self.drawn[name] = (key, content)
+            self.draw(stdscr, pane, rect, content)
+            redrawn = True
+        if redrawn:
+            stdscr.refresh()
+        return redrawn
+
+    def draw(self, stdscr, pane, rect, content):
+        title = f" {pane.title} "
+        for row in range(rect.height):
+            safe_addstr(stdscr, rect.top + row, rect.left - 1, "│")
+            if row == 0:
+                text, attr = title, curses.A_BOLD
+            elif row - 1 < len(content):
+                text, attr = content[row - 1], 0
+            else:
+                text, attr = "", 0
+            safe_addstr(stdscr, rect.top + row, rect.left, f"{text[: rect.width]:<{rect.width}}", attr)
@@ -0,0 +1,182 @@
+import multiprocessing
+from collections import deque, namedtuple
+from lxc_tui import clock
+from lxc_tui.core import log_debug
+from lxc_tui.commands import ACTIONS
+
+PluginSnapshot = namedtuple("PluginSnapshot", "containers current_row show_stopped")
+
+MAX_PANEL_LINES = 1000
+# Plain Plugin subclasses shipped with lxc-tui; others only run with --trusted-plugins
+BUILTIN_PLUGINS = ("lxc_tui.plugins.snapshots",)
+
+trusted = False
+
+
+def set_trusted(value):
+    global trusted
+    trusted = value
+
+
+def may_execute(plugin):
+    """Whether a plain Plugin may run its execute() in-process on the UI thread."""
+    return trusted or type(plugin).__module__ in BUILTIN_PLUGINS
+
+
+def make_snapshot(lxc_info, current_row, show_stopped):
+    return PluginSnapshot(tuple(tuple(container) for container in lxc_info), current_row, show_stopped)
+
+
+def validate_command(command, snapshot):
+    """Return why a plugin command is rejected, or None if it can be applied."""
+    if not isinstance(command, tuple) or not command:
+        return f"not a command: {command!r}"
+    kind = command[0]
+    ids = {container[0] for container in snapshot.containers}
+    if kind == "action":
+        if len(command) != 3 or command[1] not in ACTIONS:
+            return f"bad action {command!r}"
+        if command[2] not in ids:
+            return f"unknown container {command[2]!r}"
+    elif kind == "notify":
+        if len(command) != 2 or not isinstance(command[1], str):
+            return f"bad notify {command!r}"
+    elif kind == "panel":
+        if len(command) != 3 or not isinstance(command[1], str):
+            return f"bad panel {command[:2]!r}"
+        if not isinstance(command[2], (list, tuple)) or not all(isinstance(line, str) for line in command[2]):
+            return "panel lines must be strings"
+        if len(command[2]) > MAX_PANEL_LINES:
+            return f"panel has more than {MAX_PANEL_LINES} lines"
+    elif kind == "select":
+        if len(command) != 2 or command[1] not in ids:
+            return f"bad select {command!r}"
+    else:
+        return f"unknown command {kind!r}"
+    return None
+
+
+def _worker(plugin, snapshot, conn):
+    try:
+        for command in plugin.run(snapshot) or ():
+            conn.send(("command", command))
+        conn.send(("done", None))
+    except Exception as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+    finally:
+        conn.close()
+
+
+class PluginRun:
+    def __init__(self, plugin, snapshot, process, conn, deadline):
+        self.plugin = plugin
+        self.snapshot = snapshot
+        self.process = process
+        self.conn = conn
+        self.deadline = deadline
+
+
+class PluginHost:
+    """Runs isolated plugins off the UI thread and queues their commands.
+
+    Each invocation gets its own worker process, fed an immutable snapshot of
+    the list; commands stream back over a pipe and collect() hands the valid
+    ones to the main loop. A worker that overruns its plugin's budget is
+    killed. With in_process=True (trusted plugins) run() is called directly.
+    Finished and killed workers are reaped without blocking the caller.
+    """
+
+    def __init__(self, in_process=False, start_method="spawn"):
+        self.in_process = in_process
+        self.mp = multiprocessing.get_context(start_method)
+        self.runs = []
+        self.exiting = []
+        self.results = deque()
+
+    def running(self, plugin=None):
+        return [run.plugin for run in self.runs if plugin is None or run.plugin is plugin]
+
+    def submit(self, plugin, snapshot):
+        if self.running(plugin):
+            raise RuntimeError(f"{plugin.description} is still running")
+        if self.in_process:
+            try:
+                for command in plugin.run(snapshot) or ():
+                    self._accept(plugin, snapshot, command)
+            except Exception as e:
+                log_debug(f"Plugin {plugin.description} failed: {e}")
+                self.results.append((plugin, ("error", f"{type(e).__name__}: {e}")))
+            return
+        reader, writer = self.mp.Pipe(duplex=False)
+        process = self.mp.Process(
+            target=_worker, args=(plugin, snapshot, writer), name=f"plugin-{plugin.description}", daemon=True
+        )
+        process.start()
+        writer.close()
+        self.runs.append(PluginRun(plugin, snapshot, process, reader, clock.now() + plugin.budget))
+        log_debug(f"Started plugin {plugin.description} in pid {process.pid}")
+
+    def _accept(self, plugin, snapshot, command):
+        error = validate_command(command, snapshot)
+        if error is not None:
+            log_debug(f"Plugin {plugin.description} sent an invalid command: {error}")
+            self.results.append((plugin, ("error", error)))
+        else:
+            self.results.append((plugin, command))
+
+    def _read(self, run):
+        """Read whatever the worker has sent; return True once it is finished."""
+        try:
+            while run.conn.poll():
+                kind, payload = run.conn.recv()
+                if kind == "command":
+                    self._accept(run.plugin, run.snapshot, payload)
+                elif kind == "error":
+                    self.results.append((run.plugin, ("error", payload)))
+                    return True
+                else:
+                    return True
+        except (EOFError, OSError):
+            run.process.join(0)
+            code = run.process.exitcode
+            self.results.append(
+                (run.plugin, ("error", "worker exited" if code is None else f"worker exited with code {code}"))
+            )
+            return True
+        return False
+
+    def _finish(self, run):
+        run.conn.close()
+        self.runs.remove(run)
+        self.exiting.append(run.process)
+        self._reap()
+
+    def _reap(self):
+        # is_alive() reaps an exited worker without waiting for one that has not
+        self.exiting = [process for process in self.exiting if process.is_alive()]
+
+    def collect(self, now=None):
+        """Return (plugin, command) pairs that arrived since the last call."""
+        now = clock.now() if now is None else now
+        self._reap()
+        for run in list(self.runs):
+            if self._read(run):
+                self._finish(run)
+            elif now >= run.deadline:
+                log_debug(f"Killing plugin {run.plugin.description} after {run.plugin.budget}s")
+                run.process.kill()
+                self.results.append(
+                    (run.plugin, ("error", f"exceeded its {run.plugin.budget:g}s budget and was stopped"))
+                )
+                self._finish(run)
+        collected = list(self.results)
+        self.results.clear()
+        return collected
+
+    def shutdown(self):
+        for run in list(self.runs):
+            run.process.kill()
+            self._finish(run)
+        for process in self.exiting:
+            process.join(1)
+        self.exiting = []
@@ -0,0 +1,126 @@
+import curses
+from lxc_tui.core import Plugin, log_debug
+from lxc_tui.jobs import RUNNING
+from lxc_tui.notifications import notify, ERROR
+from lxc_tui.snapshots import new_snapshot_name, shared_store
+from lxc_tui.ui_components import display_container_list, draw_panel, clear_screen
+
+PANEL_ROWS = 12
+
+
+class SnapshotPlugin(Plugin):
+    """Built-in snapshot manager: list, create, rollback and delete snapshots."""
+
+    def __init__(self):
+        super().__init__()
+        self.key = ord("S")
+        self.description = "Snapshots"
+        self.store = shared_store()
+        self.jobs = self.store.jobs
+        self.job_id = None
+
+    def shown_jobs(self):
+        return self.jobs.recent()[-4:]
+
+    def selected_job(self):
+        """The running job `k` cancels: the one picked with `j`, else the newest."""
+        running = [job for job in self.shown_jobs() if job.state == RUNNING]
+        for job in running:
+            if job.id == self.job_id:
+                return job
+        return running[-1] if running else None
+
+    def next_job(self):
+        running = [job for job in self.shown_jobs() if job.state == RUNNING]
+        if not running:
+            self.job_id = None
+            return
+        current = self.selected_job()
+        self.job_id = running[(running.index(current) + 1) % len(running)].id
+
+    def panel_lines(self, lxc_id, selected, confirm=None):
+        snapshots = self.store.get(lxc_id)
+        lines = [f"Snapshots of {lxc_id} ({self.store.tool or 'no snapshot tool'})", ""]
+        if snapshots is None:
+            lines.append("Loading...")
+        elif not snapshots:
+            lines.append("No snapshots")
+        for idx, snapshot in enumerate((snapshots or [])[:PANEL_ROWS]):
+            marker = ">" if idx == selected else " "
+            lines.append(
+                f"{marker} {snapshot['name']:<24} {snapshot['created']:<20} {snapshot['description']}"
+            )
+        jobs = self.shown_jobs()
+        if jobs:
+            chosen = self.selected_job()
+            lines += ["", "Jobs:"] + [f"{'*' if job is chosen else ' '} {job.describe()}" for job in jobs]
+        lines += [""] * (PANEL_ROWS + 9 - len(lines))
+        lines.append(confirm or "c Create | r Rollback | d Delete | j Next job | k Cancel job | q Back")
+        return lines
+
+    def execute(
+        self,
+        stdscr,
+        lxc_info,
+        current_row,
+        show_stopped,
+        pause_event,
+        operation_done_event,
+    ):
+        if current_row >= len(lxc_info):
+            return current_row
+        lxc_id = lxc_info[current_row][0]
+        selected = 0
+        confirm = None
+        pending = None
+        pause_event.set()
+        stdscr.timeout(250)
+        clear_screen(stdscr)
+        try:
+            while True:
+                snapshots = self.store.get(lxc_id) or []
+                selected = max(0, min(selected, len(snapshots) - 1))
+                draw_panel(stdscr, self.panel_lines(lxc_id, selected, confirm), curses.color_pair(4), 70)
+                key = stdscr.getch()
+                if key == -1:
+                    continue
+                if confirm is not None:
+                    if key in (ord("y"), ord("Y")):
+                        action, name = pending
+                        self.start(action, lxc_id, name)
+                    confirm = None
+                    continue
+                if key in (ord("q"), 27):
+                    break
+                if key == curses.KEY_UP:
+                    selected -= 1
+                elif key == curses.KEY_DOWN:
+                    selected += 1
+                elif key == ord("c"):
+                    self.start("create", lxc_id, new_snapshot_name())
+                elif key in (ord("r"), ord("d")) and snapshots:
+                    action = "rollback" if key == ord("r") else "delete"
+                    pending = (action, snapshots[selected]["name"])
+                    if action == "rollback":
+                        confirm = f"Roll back {lxc_id} to {pending[1]}? (y/n)"
+                    else:
+                        confirm = f"Delete snapshot {pending[1]} of {lxc_id}? (y/n)"
+                elif key == ord("j"):
+                    self.next_job()
+                elif key == ord("k"):
+                    job = self.selected_job()
+                    if job is not None:
+                        self.jobs.cancel(job.id)
+        finally:
+            stdscr.nodelay(True)
+            clear_screen(stdscr)
+            pause_event.clear()
+            display_container_list(stdscr, lxc_info, current_row)
+        return current_row
+
+    def start(self, action, lxc_id, name):
+        try:
+            getattr(self.store, action)(lxc_id, name)
+        except (RuntimeError, ValueError) as e:
+            log_debug(f"Snapshot {action} failed to start: {e}")
+            notify(f"Snapshot {action} of {lxc_id} failed: {e}", ERROR)
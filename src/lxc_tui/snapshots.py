@@ -0,0 +1,147 @@
+import re
+import shutil
+import subprocess
+import threading
+import time
+from lxc_tui.core import log_debug
+from lxc_tui import clock
+from lxc_tui.jobs import JobManager
+
+SNAPSHOT_NAME = re.compile(r"^[A-Za-z][A-Za-z0-9_-]*$")
+
+
+def detect_snapshot_tool(which=shutil.which):
+    if which("pct"):
+        return "pct"
+    if which("lxc-snapshot"):
+        return "lxc-snapshot"
+    return None
+
+
+def parse_pct_snapshots(output):
+    snapshots = []
+    for line in output.splitlines():
+        if "->" not in line:
+            continue
+        fields = line.split("->", 1)[1].split(None, 3)
+        if not fields or fields[0] == "current":
+            continue
+        created = " ".join(fields[1:3]) if len(fields) >= 3 else ""
+        description = fields[3].strip() if len(fields) > 3 else ""
+        snapshots.append({"name": fields[0], "created": created, "description": description})
+    return snapshots
+
+
+def parse_lxc_snapshots(output):
+    snapshots = []
+    for line in output.splitlines():
+        fields = line.split()
+        if not fields or line.strip() == "No snapshots":
+            continue
+        created = " ".join(fields[2:4]) if len(fields) >= 4 else ""
+        snapshots.append({"name": fields[0], "created": created, "description": ""})
+    return snapshots
+
+
+def snapshot_command(tool, action, lxc_id, name=None):
+    if tool == "pct":
+        return {
+            "list": ["pct", "listsnapshot", lxc_id],
+            "create": ["pct", "snapshot", lxc_id, name],
+            "rollback": ["pct", "rollback", lxc_id, name],
+            "delete": ["pct", "delsnapshot", lxc_id, name],
+        }[action]
+    return {
+        "list": ["lxc-snapshot", "-n", lxc_id, "-L"],
+        "create": ["lxc-snapshot", "-n", lxc_id, "-N", name],
+        "rollback": ["lxc-snapshot", "-n", lxc_id, "-r", name],
+        "delete": ["lxc-snapshot", "-n", lxc_id, "-d", name],
+    }[action]
+
+
+def new_snapshot_name(now=None):
+    return time.strftime("snap%Y%m%d%H%M%S", time.localtime(now))
+
+
+class SnapshotStore:
+    """Lazily lists snapshots per container and runs changes as background jobs.
+
+    get() returns the cached list, or None while the first listing for that
+    container is still being read in the background.
+    """
+
+    def __init__(self, jobs, tool=None, ttl=300.0, run=subprocess.run):
+        self.jobs = jobs
+        self.tool = detect_snapshot_tool() if tool is None else tool
+        self.ttl = ttl
+        self.run = run
+        self.lock = threading.Lock()
+        self.cache = {}
+        self.loading = set()
+
+    def _load(self, lxc_id):
+        snapshots = []
+        try:
+            result = self.run(
+                snapshot_command(self.tool, "list", lxc_id),
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                timeout=30,
+            )
+            parse = parse_pct_snapshots if self.tool == "pct" else parse_lxc_snapshots
+            snapshots = parse(result.stdout)
+        except (OSError, subprocess.SubprocessError) as e:
+            log_debug(f"Error listing snapshots for {lxc_id}: {e}")
+        with self.lock:
+            self.cache[lxc_id] = (snapshots, clock.now())
+            self.loading.discard(lxc_id)
+
+    def get(self, lxc_id):
+        with self.lock:
+            cached = self.cache.get(lxc_id)
+            if cached is not None and clock.now() - cached[1] < self.ttl:
+                return cached[0]
+            if self.tool is None:
+                return []
+            if lxc_id not in self.loading:
+                self.loading.add(lxc_id)
+                threading.Thread(target=self._load, args=(lxc_id,), daemon=True).start()
+        return cached[0] if cached is not None else None
+
+    def invalidate(self, lxc_id):
+        with self.lock:
+            self.cache.pop(lxc_id, None)
+
+    def _submit(self, action, lxc_id, name):
+        if self.tool is None:
+            raise RuntimeError("Neither pct nor lxc-snapshot is installed")
+        if not SNAPSHOT_NAME.match(name):
+            raise ValueError(f"Invalid snapshot name: {name}")
+        return self.jobs.submit(
+            f"{action} {lxc_id}:{name}",
+            snapshot_command(self.tool, action, lxc_id, name),
+            on_done=lambda job: self.invalidate(lxc_id),
+        )
+
+    def create(self, lxc_id, name):
+        return self._submit("create", lxc_id, name)
+
+    def rollback(self, lxc_id, name):
+        return self._submit("rollback", lxc_id, name)
+
+    def delete(self, lxc_id, name):
+        return self._submit("delete", lxc_id, name)
+
+
+shared = None
+shared_lock = threading.Lock()
+
+
+def shared_store():
+    """The SnapshotStore, and its JobManager, used by the snapshot view, the palette and plugins."""
+    global shared
+    with shared_lock:
+        if shared is None:
+            shared = SnapshotStore(JobManager())
+        return shared
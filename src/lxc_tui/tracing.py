@@ -0,0 +1,231 @@
+import json
+import subprocess
+import threading
+import time
+from collections import defaultdict, deque
+from lxc_tui.core import log_debug
+
+replaying = False
+
+
+def set_replaying(value):
+    global replaying
+    replaying = value
+
+
+def _key(op, args):
+    return json.dumps([op, args], separators=(",", ":"))
+
+
+class TraceWriter:
+    """Appends one NDJSON event per backend call, stamped relative to the start."""
+
+    def __init__(self, path):
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.file = open(path, "w", encoding="utf-8")
+
+    def write(self, op, args, duration, **fields):
+        event = {"t": round(time.time() - self.started, 6), "op": op, "args": args, "dur": round(duration, 6)}
+        event.update(fields)
+        line = json.dumps(event, separators=(",", ":")) + "\n"
+        with self.lock:
+            if not self.file.closed:
+                self.file.write(line)
+                self.file.flush()
+
+    def close(self):
+        with self.lock:
+            self.file.close()
+
+
+class RecordingHandle:
+    """Wraps a spawned process and records its exit code and run time once."""
+
+    def __init__(self, proc, command, writer):
+        self.proc = proc
+        self.args = command
+        self.writer = writer
+        self.started = time.time()
+        self.recorded = False
+
+    @property
+    def returncode(self):
+        return self.proc.returncode
+
+    @property
+    def stdout(self):
+        return getattr(self.proc, "stdout", None)
+
+    def _record(self, returncode):
+        if returncode is not None and not self.recorded:
+            self.recorded = True
+            self.writer.write("spawn", [list(self.args)], time.time() - self.started, rc=returncode)
+        return returncode
+
+    def poll(self):
+        return self._record(self.proc.poll())
+
+    def wait(self, timeout=None):
+        return self._record(self.proc.wait(timeout=timeout))
+
+    def kill(self):
+        self.proc.kill()
+        if not self.recorded:
+            self.recorded = True
+            self.writer.write("spawn", [list(self.args)], time.time() - self.started, rc=None)
+
+
+class RecordingBackend:
+    """Passes every call through to backend and records result and timing.
+
+    Only top-level calls are recorded: the read_config calls get_lxc_info
+    makes through lxc_utils come back in here, but replaying the listing
+    answers them already, so they would only be left over in the trace.
+    """
+
+    def __init__(self, backend, path):
+        self.backend = backend
+        self.name = f"recording {backend.name}"
+        self.writer = TraceWriter(path)
+        self.local = threading.local()
+
+    def _call(self, op, *args):
+        depth = getattr(self.local, "depth", 0)
+        self.local.depth = depth + 1
+        started = time.time()
+        try:
+            result = getattr(self.backend, op)(*args)
+        finally:
+            self.local.depth = depth
+        if depth == 0:
+            self.writer.write(op, list(args), time.time() - started, result=result)
+        return result
+
+    def get_lxc_info(self, include_stopped=False):
+        return self._call("get_lxc_info", include_stopped)
+
+    def get_ips(self, lxc_id):
+        return self._call("get_ips", lxc_id)
+
+    def get_state(self, lxc_id):
+        return self._call("get_state", lxc_id)
+
+    def read_config(self, lxc_id):
+        return self._call("read_config", lxc_id)
+
+    def spawn(self, command, output=False):
+        return RecordingHandle(self.backend.spawn(command, output), command, self.writer)
+
+    def close(self):
+        self.writer.close()
+
+
+class ReplayHandle:
+    """Popen-like handle that finishes after the recorded (scaled) run time."""
+
+    def __init__(self, command, returncode, duration, clock=time.time, sleep=time.sleep):
+        self.args = command
+        self.clock = clock
+        self.sleep = sleep
+        self.finish_at = clock() + duration
+        self._returncode = returncode
+        self.returncode = None
+        self.stdout = None
+
+    def poll(self):
+        if self.returncode is None and self.clock() >= self.finish_at:
+            self.returncode = 1 if self._returncode is None else self._returncode
+        return self.returncode
+
+    def wait(self, timeout=None):
+        remaining = self.finish_at - self.clock()
+        if timeout is not None and remaining > timeout:
+            self.sleep(max(0.0, timeout))
+            raise subprocess.TimeoutExpired(self.args, timeout)
+        if remaining > 0:
+            self.sleep(remaining)
+            # The injected sleep need not move clock(); the wait is over either way
+            self.finish_at = min(self.finish_at, self.clock())
+        return self.poll()
+
+    def kill(self):
+        self.finish_at = self.clock()
+
+
+def load_trace(path):
+    events = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                events.append(json.loads(line))
+            except ValueError:
+                continue
+    return events
+
+
+class ReplayBackend:
+    """Answers backend calls from a trace recorded by RecordingBackend.
+
+    Each call takes the next recorded answer for the same operation and
+    arguments and takes as long as it did when recorded, divided by speed.
+    speed=0 replays without any delay. When the recorded answers for a call run
+    out, the last one is repeated.
+
+    Only backend calls are replayed. Health probes, network and disk
+    statistics and attaching are switched off while replaying (see
+    set_replaying); tags, pools, the config index and snapshot listings still
+    read the local /etc/pve.
+    """
+
+    name = "replay"
+
+    def __init__(self, path, speed=1.0, sleep=time.sleep):
+        self.speed = speed
+        self.sleep = sleep
+        self.lock = threading.Lock()
+        self.answers = defaultdict(deque)
+        self.last = {}
+        for event in load_trace(path):
+            self.answers[_key(event["op"], event.get("args", []))].append(event)
+        log_debug(f"Loaded {sum(len(q) for q in self.answers.values())} trace events from {path}")
+
+    def scaled(self, duration):
+        return 0.0 if not self.speed else duration / self.speed
+
+    def _next(self, op, args):
+        key = _key(op, args)
+        with self.lock:
+            queue = self.answers.get(key)
+            if queue:
+                self.last[key] = queue.popleft()
+            return self.last.get(key)
+
+    def _answer(self, op, args, default):
+        event = self._next(op, args)
+        if event is None:
+            log_debug(f"No recorded answer for {op} {args}")
+            return default
+        delay = self.scaled(event.get("dur", 0))
+        if delay > 0:
+            self.sleep(delay)
+        return event.get("result", default)
+
+    def get_lxc_info(self, include_stopped=False):
+        return [tuple(c) for c in self._answer("get_lxc_info", [include_stopped], [])]
+
+    def get_ips(self, lxc_id):
+        return self._answer("get_ips", [lxc_id], "")
+
+    def get_state(self, lxc_id):
+        return self._answer("get_state", [lxc_id], None)
+
+    def read_config(self, lxc_id):
+        return self._answer("read_config", [lxc_id], None)
+
+    def spawn(self, command, output=False):
+        event = self._next("spawn", [list(command)])
+        if event is None:
+            log_debug(f"No recorded result for {' '.join(command)}, reporting success")
+            return ReplayHandle(command, 0, 0.0, sleep=self.sleep)
+        return ReplayHandle(command, event.get("rc"), self.scaled(event.get("dur", 0)), sleep=self.sleep)
@@ -1,6 +1,14 @@
 import curses
-import time
-from lxc_tui.core import log_debug, safe_addstr, screen_lock
+from lxc_tui.core import log_debug, safe_addstr, screen_lock, output_bytes
+from lxc_tui.history import format_event
+from lxc_tui.layout import get_column_layout, list_width
+from lxc_tui.groups import view as group_view
+from lxc_tui import clock, notifications
+from lxc_tui.clock import now as current_time
+from lxc_tui.audit import read_audit, format_entry
+from lxc_tui.logtail import MultiTail, container_logs
+from lxc_tui.metrics import format_bytes
+from lxc_tui.logsearch import LogSearch, compile_query, log_files, read_lines_at, previous_line_offset
 
 
 def display_container_list(stdscr, lxc_info, current_row):
@@ -13,46 +21,131 @@ def display_container_list(stdscr, lxc_info, current_row):
         log_debug("Screen too small, displaying error message")
         return
 
-    id_width = 5
-    hostname_width = 20
-    state_width = 10
-    unprivileged_width = len("UNPRIVILEGED")
-    fixed_width = id_width + hostname_width + state_width + unprivileged_width + 4
-    max_ip_width = max(50, curses.COLS - fixed_width - 1)
+    width = list_width(curses.COLS)
+    column_layout = get_column_layout(width)
     max_rows = max(0, curses.LINES - 2)
     visible_containers = lxc_info[:max_rows]
 
-    for i in range(max_rows + 1):
-        safe_addstr(stdscr, i, 0, " " * cols)
+    if low_bandwidth:
+        display_changed_rows(stdscr, lxc_info, current_row, column_layout, max_rows)
+        draw_status_line(stdscr)
+        stdscr.refresh()
+        return
 
-    safe_addstr(
-        stdscr,
-        0,
-        0,
-        f"{'ID':<5} {'HOSTNAME':<20} {'STATE':<10} {'IP ADDRESSES':<50} {'UNPRIVILEGED'}",
-        curses.A_BOLD,
-    )
+    for i in range(max_rows):
+        safe_addstr(stdscr, i, 0, " " * width)
+    safe_addstr(stdscr, max_rows, 0, " " * cols)
 
-    for idx, container in enumerate(visible_containers):
-        lxc_id, hostname, status, ip_addresses, unprivileged = container
-        if len(ip_addresses) > max_ip_width:
-            ip_addresses = ip_addresses[: max_ip_width - 3] + "..."
+    safe_addstr(stdscr, 0, 0, column_layout.header, curses.A_BOLD)
 
-        line = f"{lxc_id:<5} {hostname:<20} {status:<10} {ip_addresses:<{max_ip_width}} {unprivileged}"
-        if idx == current_row:
-            stdscr.attron(curses.color_pair(3))
-            safe_addstr(stdscr, idx + 1, 0, line)
-            stdscr.attroff(curses.color_pair(3))
-        else:
-            color = (
-                curses.color_pair(1) if status == "RUNNING" else curses.color_pair(2)
-            )
-            safe_addstr(stdscr, idx + 1, 0, line, color)
+    if group_view.mode:
+        display_grouped_rows(stdscr, lxc_info, current_row, column_layout, max_rows)
+    else:
+        for idx, container in enumerate(visible_containers):
+            draw_container_row(stdscr, idx + 1, container, column_layout, idx == current_row)
 
+    draw_status_line(stdscr, force=True)
     stdscr.refresh()
 
 
-def update_navigation_bar(stdscr, show_stopped, plugins, force=False):
+low_bandwidth = False
+_rows_drawn = {}
+
+
+def set_low_bandwidth(enabled):
+    global low_bandwidth
+    low_bandwidth = enabled
+    _rows_drawn.clear()
+
+
+def list_rows(lxc_info, current_row, column_layout, max_rows):
+    """Return (key, text, attr) per screen row.
+
+    Keys ignore volatile columns, except on the selected row: with
+    --low-bandwidth that is the row whose IPs are looked up on demand, so the
+    answer has to reach the screen.
+    """
+    rows = [(("header", column_layout.header), column_layout.header, curses.A_BOLD)]
+
+    def container_row(idx):
+        selected = idx == current_row
+        text = column_layout.format(lxc_info[idx])
+        key = ("row", text if selected else column_layout.stable_key(lxc_info[idx]), selected)
+        return key, text, curses.A_REVERSE if selected else 0
+
+    if group_view.mode:
+        for row in group_view.rows(lxc_info)[: max(0, max_rows - 1)]:
+            if row[0] == "group":
+                text = group_view.header(row[1], row[2])[: column_layout.width]
+                selected = row[1] in group_view.collapsed and current_row in row[2]
+                rows.append((("group", text, selected), text, curses.A_REVERSE if selected else 0))
+            else:
+                rows.append(container_row(row[1]))
+    else:
+        rows.extend(container_row(idx) for idx in range(min(len(lxc_info), max_rows - 1)))
+    return rows
+
+
+def display_changed_rows(stdscr, lxc_info, current_row, column_layout, max_rows):
+    """Low-bandwidth redraw: only rows whose non-volatile content changed are sent.
+
+    Text is written without trailing padding, apart from the spaces needed to
+    cover what was drawn there before, and rows use no colour attributes.
+    """
+    if _rows_drawn.get("width") != column_layout.width:
+        _rows_drawn.clear()
+        _rows_drawn["width"] = column_layout.width
+    rows = list_rows(lxc_info, current_row, column_layout, max_rows)
+    for y in range(max_rows):
+        key, text, attr = rows[y] if y < len(rows) else (None, "", 0)
+        drawn = _rows_drawn.get(y)
+        if drawn is not None and drawn[0] == key:
+            continue
+        text = text.rstrip()
+        previous = len(drawn[1]) if drawn is not None else column_layout.width
+        if text or previous:
+            safe_addstr(stdscr, y, 0, text.ljust(previous), attr)
+        _rows_drawn[y] = (key, text)
+
+
+def draw_container_row(stdscr, y, container, column_layout, highlighted):
+    line = column_layout.format(container)
+    if highlighted:
+        stdscr.attron(curses.color_pair(3))
+        safe_addstr(stdscr, y, 0, line)
+        stdscr.attroff(curses.color_pair(3))
+    else:
+        color = (
+            curses.color_pair(1) if container[2] == "RUNNING" else curses.color_pair(2)
+        )
+        safe_addstr(stdscr, y, 0, line, color)
+
+
+def display_grouped_rows(stdscr, lxc_info, current_row, column_layout, max_rows):
+    for y, row in enumerate(group_view.rows(lxc_info)[: max(0, max_rows - 1)], start=1):
+        if row[0] == "group":
+            group, indexes = row[1], row[2]
+            attr = curses.A_BOLD
+            if group in group_view.collapsed and current_row in indexes:
+                attr = curses.color_pair(3) | curses.A_BOLD
+            text = group_view.header(group, indexes)[: column_layout.width]
+            safe_addstr(stdscr, y, 0, f"{text:<{column_layout.width}}", attr)
+        else:
+            idx = row[1]
+            draw_container_row(stdscr, y, lxc_info[idx], column_layout, idx == current_row)
+
+
+_nav_text_cache = {}
+_nav_drawn = {"position": None, "text": None}
+
+
+def navigation_text(cols, show_stopped, plugins):
+    plugin_keys = tuple((plugin.key, plugin.description) for plugin in plugins)
+    cache_key = (cols, show_stopped, plugin_keys)
+    nav_text = _nav_text_cache.get(cache_key)
+    if nav_text is not None:
+        return nav_text
+
     base_nav = "Commands: Up/Down - Navigate | Enter/Space - Attach | i - Info | x - Stop/Start | r - Restart | h - Help"
     plugin_nav = " | ".join(
         f"{chr(plugin.key)} - {plugin.description}"
@@ -66,51 +159,166 @@ def update_navigation_bar(stdscr, show_stopped, plugins, force=False):
     )
     short_nav = "Up/Down - Navigate | q - Quit"
 
-    if 80 <= curses.COLS <= 127:
+    if 80 <= cols <= 127:
         nav_text = short_nav
     else:
         nav_text = full_nav
-        if len(nav_text) > curses.COLS:
-            nav_text = nav_text[: curses.COLS - 3] + "..."
+        if len(nav_text) > cols:
+            nav_text = nav_text[: cols - 3] + "..."
+    if len(_nav_text_cache) > 32:
+        _nav_text_cache.clear()
+    _nav_text_cache[cache_key] = nav_text
+    return nav_text
 
-    current_nav = (
-        stdscr.instr(curses.LINES - 1, 0, curses.COLS)
-        .decode("utf-8", errors="ignore")
-        .strip()
-    )
-    if force or current_nav != nav_text:
+
+def invalidate_navigation_bar():
+    _nav_drawn["position"] = None
+    _nav_drawn["text"] = None
+
+
+def clear_screen(stdscr):
+    invalidate_navigation_bar()
+    invalidate_status_line()
+    _rows_drawn.clear()
+    stdscr.clear()
+
+
+def update_navigation_bar(stdscr, show_stopped, plugins, force=False):
+    nav_text = navigation_text(curses.COLS, show_stopped, plugins)
+    position = (curses.LINES, curses.COLS)
+    if force or _nav_drawn["position"] != position or _nav_drawn["text"] != nav_text:
         safe_addstr(stdscr, curses.LINES - 1, 0, " " * curses.COLS)
         safe_addstr(stdscr, curses.LINES - 1, 0, nav_text, curses.A_BOLD)
         stdscr.refresh()
+        _nav_drawn["position"] = position
+        _nav_drawn["text"] = nav_text
+
+
+STATUS_COLORS = {
+    notifications.INFO: 4,
+    notifications.SUCCESS: 1,
+    notifications.WARNING: 4,
+    notifications.ERROR: 2,
+}
+_status_drawn = {"position": None, "text": None}
+
+
+def invalidate_status_line():
+    _status_drawn["position"] = None
+    _status_drawn["text"] = None
+
+
+def draw_status_line(stdscr, force=False, now=None):
+    """Show the queue's current notification; returns True when the line changed."""
+    notification = notifications.queue.select(now)
+    text = notification.label() if notification is not None else ""
+    position = (curses.LINES, curses.COLS)
+    if not force and _status_drawn["position"] == position and _status_drawn["text"] == text:
+        return False
+    safe_addstr(stdscr, curses.LINES - 2, 0, " " * (curses.COLS - 1), curses.color_pair(0))
+    if notification is not None:
+        safe_addstr(
+            stdscr,
+            curses.LINES - 2,
+            0,
+            text,
+            curses.color_pair(STATUS_COLORS[notification.priority]),
+        )
+    _status_drawn["position"] = position
+    _status_drawn["text"] = text
+    return True
+
+
+class ResizeDebouncer:
+    """Collapses a burst of KEY_RESIZE events into one repaint once they settle."""
+
+    def __init__(self, delay=0.15):
+        self.delay = delay
+        self.pending_since = None
+
+    def note(self, now=None):
+        self.pending_since = clock.now() if now is None else now
+
+    def due(self, now=None):
+        if self.pending_since is None:
+            return False
+        now = clock.now() if now is None else now
+        return now - self.pending_since >= self.delay
+
+    def clear(self):
+        self.pending_since = None
+
+
+class FrameLimiter:
+    """Caps how often cursor movement repaints the list to fps frames per second.
+
+    request() remembers the row that is still drawn highlighted; flush() paints
+    the move once a frame is due, so a burst of movement costs one refresh.
+    """
+
+    def __init__(self, fps=30, clock=current_time):
+        self.interval = 1.0 / fps
+        self.clock = clock
+        self.last_frame = None
+        self.pending = None
+
+    def request(self, old_row):
+        if self.pending is None:
+            self.pending = old_row
+
+    def discard(self):
+        self.pending = None
+
+    def ready(self, now=None):
+        now = self.clock() if now is None else now
+        return self.last_frame is None or now - self.last_frame >= self.interval
+
+    def mark(self, now=None):
+        self.last_frame = self.clock() if now is None else now
+
+    def flush(self, stdscr, current_row, lxc_info, now=None):
+        if self.pending is None:
+            return False
+        now = self.clock() if now is None else now
+        if not self.ready(now):
+            return False
+        update_highlighted_row(stdscr, self.pending, current_row, lxc_info)
+        self.pending = None
+        self.mark(now)
+        return True
+
+
+def apply_resize(stdscr, lxc_info, current_row, show_stopped, plugins, context=None):
+    lines, cols = stdscr.getmaxyx()
+    curses.resize_term(lines, cols)
+    log_debug(f"Terminal resized to: LINES={curses.LINES}, COLS={curses.COLS}")
+    clear_screen(stdscr)
+    display_container_list(stdscr, lxc_info, current_row)
+    update_navigation_bar(stdscr, show_stopped, plugins, force=True)
+    if context is not None and context.panes is not None:
+        context.panes.invalidate()
 
 
 def update_highlighted_row(stdscr, old_row, new_row, lxc_info):
+    if group_view.mode or low_bandwidth:
+        display_container_list(stdscr, lxc_info, new_row)
+        return
     lines, cols = stdscr.getmaxyx()
     log_debug(
         f"Updating highlight: old_row={old_row}, new_row={new_row}, lxc_info length={len(lxc_info)}"
     )
 
-    id_width = 5
-    hostname_width = 20
-    state_width = 10
-    unprivileged_width = len("UNPRIVILEGED")
-    fixed_width = id_width + hostname_width + state_width + unprivileged_width + 4
-    max_ip_width = max(50, curses.COLS - fixed_width - 1)
+    column_layout = get_column_layout(list_width(curses.COLS))
 
     if 0 <= old_row < len(lxc_info):
-        lxc_id, hostname, status, ip_addresses, unprivileged = lxc_info[old_row]
-        if len(ip_addresses) > max_ip_width:
-            ip_addresses = ip_addresses[: max_ip_width - 3] + "..."
-        line = f"{lxc_id:<5} {hostname:<20} {status:<10} {ip_addresses:<{max_ip_width}} {unprivileged}"
+        status = lxc_info[old_row][2]
+        line = column_layout.format(lxc_info[old_row])
         color = curses.color_pair(1) if status == "RUNNING" else curses.color_pair(2)
         safe_addstr(stdscr, old_row + 1, 0, line, color)
         log_debug(f"Reset old row {old_row} to color {color}")
 
     if 0 <= new_row < len(lxc_info):
-        lxc_id, hostname, status, ip_addresses, unprivileged = lxc_info[new_row]
-        if len(ip_addresses) > max_ip_width:
-            ip_addresses = ip_addresses[: max_ip_width - 3] + "..."
-        line = f"{lxc_id:<5} {hostname:<20} {status:<10} {ip_addresses:<{max_ip_width}} {unprivileged}"
+        line = column_layout.format(lxc_info[new_row])
         stdscr.attron(curses.color_pair(3))
         safe_addstr(stdscr, new_row + 1, 0, line)
         stdscr.attroff(curses.color_pair(3))
@@ -120,20 +328,19 @@ def update_highlighted_row(stdscr, old_row, new_row, lxc_info):
     log_debug("Highlight update complete")
 
 
-def show_panel(stdscr, lines, color_pair, pause_event):
-    try:
-        panel_height = len(lines) + 4
-        panel_width = max(len(line) for line in lines) + 4
+def draw_panel(stdscr, lines, color_pair, min_width=0):
+    _rows_drawn.clear()
+    panel_height = len(lines) + 4
+    panel_width = max([min_width] + [len(line) for line in lines]) + 4
 
-        if panel_width > curses.COLS or panel_height > curses.LINES:
-            panel_width = min(panel_width, curses.COLS - 4)
-            panel_height = min(panel_height, curses.LINES - 4)
+    if panel_width > curses.COLS or panel_height > curses.LINES:
+        panel_width = min(panel_width, curses.COLS - 4)
+        panel_height = min(panel_height, curses.LINES - 4)
 
-        start_y = max(0, (curses.LINES - panel_height) // 2)
-        start_x = max(0, (curses.COLS - panel_width) // 2)
-
-        pause_event.set()
+    start_y = max(0, (curses.LINES - panel_height) // 2)
+    start_x = max(0, (curses.COLS - panel_width) // 2)
 
+    try:
         stdscr.attron(color_pair)
         safe_addstr(stdscr, start_y, start_x, f'┌{"─" * (panel_width - 2)}┐')
         for y in range(1, panel_height - 1):
@@ -149,19 +356,24 @@ def show_panel(stdscr, lines, color_pair, pause_event):
                     stdscr,
                     start_y + 1 + idx,
                     start_x + 2,
-                    line[: curses.COLS - start_x - 2],
+                    line[: min(curses.COLS - start_x - 2, panel_width - 4)],
                 )
 
         stdscr.refresh()
+    except curses.error as e:
+        log_debug(
+            f"Error in draw_panel: {e}, LINES={curses.LINES}, COLS={curses.COLS}, panel_width={panel_width}, panel_height={panel_height}"
+        )
+
+
+def show_panel(stdscr, lines, color_pair, pause_event):
+    try:
+        pause_event.set()
+        draw_panel(stdscr, lines, color_pair)
 
         stdscr.nodelay(False)
         stdscr.getch()
         stdscr.nodelay(True)
-
-    except curses.error as e:
-        log_debug(
-            f"Error in show_panel: {e}, LINES={curses.LINES}, COLS={curses.COLS}, panel_width={panel_width}, panel_height={panel_height}"
-        )
     finally:
         pause_event.clear()
 
@@ -179,6 +391,16 @@ def show_help(stdscr, show_stopped, pause_event, plugins):
         f"  - s: {'Show' if not show_stopped else 'Hide'} Stopped containers",
         "  - q: Quit the TUI",
         "  - h: Show this help window",
+        "  - H: Show state changes from the last hour",
+        "  - v: Cycle split view (list, details, metrics, log)",
+        "  - g: Group by tag, pool, state or privilege",
+        "  - z: Collapse/expand the selected group",
+        "  - m: Show message history",
+        "  - a: Show the audit log of lifecycle actions",
+        "  - /: Search all container logs (regex), Enter opens the match",
+        "  - t: Live merged tail of container logs (ids, ranges, tag:..., all)",
+        "  - c: Query container configs (nesting=1, mp*=/mnt/backup*, diff 101 205)",
+        "  - :: Command palette (stop 101-120; snapshot tag:web; start state:STOPPED)",
     ]
     plugin_help = [
         f"  - {chr(plugin.key)}: {plugin.description}"
@@ -191,6 +413,11 @@ def show_help(stdscr, show_stopped, pause_event, plugins):
         help_lines.append("Plugins:")
         help_lines.extend(plugin_help)
     help_lines.append("")
+    help_lines.append(
+        f"Screen output: {output_bytes.recent() / 1024:.1f} KiB in the last minute, "
+        f"{output_bytes.total / 1024:.1f} KiB total"
+    )
+    help_lines.append("")
     help_lines.append("Press any key to return...")
     show_panel(stdscr, help_lines, curses.color_pair(4), pause_event)
 
@@ -210,18 +437,270 @@ def show_info(stdscr, lxc_id, pause_event):
     show_panel(stdscr, info_lines, curses.color_pair(4), pause_event)
 
 
+def show_history(stdscr, history, pause_event, window=3600):
+    events = history.query(clock.now() - window)
+    max_lines = max(1, curses.LINES - 9)
+    history_lines = [
+        f"Changes in the last {window // 60} minutes ({len(events)} events)",
+        "-" * 50,
+    ]
+    if events:
+        history_lines.extend(format_event(event) for event in events[-max_lines:])
+    else:
+        history_lines.append("No state or IP changes recorded")
+    show_panel(stdscr, history_lines, curses.color_pair(4), pause_event)
+
+
+def read_line(stdscr, prompt, history=None):
+    """Edit one line on the status row; returns the text, or None on Esc."""
+    history = history if history is not None else []
+    text = ""
+    position = len(history)
+    invalidate_status_line()
+    stdscr.nodelay(False)
+    curses.curs_set(1)
+    try:
+        while True:
+            line = f"{prompt}{text}"[-(curses.COLS - 1):]
+            safe_addstr(stdscr, curses.LINES - 2, 0, " " * (curses.COLS - 1), curses.color_pair(0))
+            safe_addstr(stdscr, curses.LINES - 2, 0, line, curses.A_BOLD)
+            stdscr.refresh()
+            key = stdscr.getch()
+            if key in (curses.KEY_ENTER, 10, 13):
+                break
+            if key == 27:
+                return None
+            if key in (curses.KEY_BACKSPACE, 127, 8):
+                text = text[:-1]
+            elif key == curses.KEY_UP and position > 0:
+                position -= 1
+                text = history[position]
+            elif key == curses.KEY_DOWN and position < len(history):
+                position += 1
+                text = history[position] if position < len(history) else ""
+            elif 32 <= key < 127:
+                text += chr(key)
+    finally:
+        curses.curs_set(0)
+        stdscr.nodelay(True)
+    text = text.strip()
+    if text and (not history or history[-1] != text):
+        history.append(text)
+    return text
+
+
+def show_scroll_panel(stdscr, title, entries, pause_event, min_width=60):
+    page = max(1, curses.LINES - 10)
+    offset = 0
+    pause_event.set()
+    stdscr.nodelay(False)
+    try:
+        while True:
+            visible = entries[offset: offset + page]
+            lines = [title, "-" * min_width] + visible + [""] * (page - len(visible))
+            lines += ["", "Up/Down/PgUp/PgDn - Scroll | any other key - Back"]
+            draw_panel(stdscr, lines, curses.color_pair(4), min_width)
+            key = stdscr.getch()
+            last = max(0, len(entries) - page)
+            if key == curses.KEY_UP:
+                offset = max(0, offset - 1)
+            elif key == curses.KEY_DOWN:
+                offset = min(last, offset + 1)
+            elif key == curses.KEY_PPAGE:
+                offset = max(0, offset - page)
+            elif key == curses.KEY_NPAGE:
+                offset = min(last, offset + page)
+            else:
+                break
+    finally:
+        stdscr.nodelay(True)
+        pause_event.clear()
+
+
+def show_notifications(stdscr, pause_event):
+    entries = [n.describe() for n in reversed(notifications.queue.recent())] or ["No messages"]
+    show_scroll_panel(stdscr, f"Messages ({len(entries)}, newest first)", entries, pause_event)
+
+
+def show_audit(stdscr, path, pause_event):
+    entries = [format_entry(entry) for entry in reversed(read_audit(path))]
+    title = f"Audit log ({len(entries)} most recent actions, newest first)"
+    show_scroll_panel(stdscr, title, entries or ["No actions recorded"], pause_event, 70)
+
+
+search_history = []
+
+
+def show_log_pager(stdscr, path, offset, pause_event):
+    """Page through path starting at a byte offset, reading only what is shown."""
+    page = max(1, curses.LINES - 8)
+    top = offset
+    while True:
+        lines = read_lines_at(path, top, page)
+        body = [text for _, text in lines] + [""] * (page - len(lines))
+        header = f"{path} @ byte {top}"
+        footer = "Up/Down/PgUp/PgDn - Scroll | Home - Match | any other key - Back"
+        draw_panel(stdscr, [header, "-" * 76] + body + ["", footer], curses.color_pair(4), 76)
+        key = stdscr.getch()
+        if key == -1:
+            continue
+        if key == curses.KEY_DOWN and len(lines) > 1:
+            top = lines[1][0]
+        elif key == curses.KEY_NPAGE and len(lines) == page:
+            following = read_lines_at(path, lines[-1][0], 2)
+            top = following[1][0] if len(following) > 1 else top
+        elif key == curses.KEY_UP:
+            top = previous_line_offset(path, top)
+        elif key == curses.KEY_PPAGE:
+            top = previous_line_offset(path, top, page)
+        elif key == curses.KEY_HOME:
+            top = offset
+        else:
+            break
+
+
+def show_log_search(stdscr, pause_event, paths=None):
+    """Search all container logs, listing matches as each file finishes."""
+    text = read_line(stdscr, "Search logs (regex): ", search_history)
+    if not text:
+        return
+    try:
+        pattern = compile_query(text)
+    except ValueError as e:
+        notifications.notify(str(e), notifications.ERROR)
+        return
+    paths = log_files() if paths is None else paths
+    search = LogSearch(pattern, paths)
+    matches = []
+    selected = 0
+    offset = 0
+    page = max(1, curses.LINES - 10)
+    pause_event.set()
+    stdscr.timeout(100)
+    try:
+        while True:
+            matches += search.drain()
+            state = "done" if search.done else f"searching {search.finished}/{len(paths)} files"
+            title = f"/{text}/: {len(matches)} match(es), {state}"
+            selected = max(0, min(selected, len(matches) - 1))
+            offset = min(max(offset, selected - page + 1), selected)
+            visible = [
+                f"{'>' if offset + idx == selected else ' '} {match.describe()}"
+                for idx, match in enumerate(matches[offset: offset + page])
+            ]
+            footer = "Up/Down - Select | Enter - Open at match | q - Back"
+            lines = [title, "-" * 76] + visible + [""] * (page - len(visible)) + ["", footer]
+            draw_panel(stdscr, lines, curses.color_pair(4), 76)
+            key = stdscr.getch()
+            if key == -1:
+                continue
+            if key == curses.KEY_UP:
+                selected -= 1
+            elif key == curses.KEY_DOWN:
+                selected += 1
+            elif key == curses.KEY_NPAGE:
+                selected += page
+            elif key == curses.KEY_PPAGE:
+                selected -= page
+            elif key in (curses.KEY_ENTER, 10, 13) and matches:
+                match = matches[selected]
+                clear_screen(stdscr)
+                show_log_pager(stdscr, match.path, match.offset, pause_event)
+                clear_screen(stdscr)
+            elif key in (ord("q"), 27):
+                break
+    finally:
+        search.cancel()
+        stdscr.nodelay(True)
+        pause_event.clear()
+
+
+TAIL_COLOR_BASE = 20
+
+
+def tail_colors(lxc_ids):
+    """A colour pair per container, cycling through the basic curses colours."""
+    if low_bandwidth:
+        return {lxc_id: 0 for lxc_id in lxc_ids}
+    palette = [
+        curses.COLOR_GREEN,
+        curses.COLOR_CYAN,
+        curses.COLOR_YELLOW,
+        curses.COLOR_MAGENTA,
+        curses.COLOR_BLUE,
+        curses.COLOR_RED,
+        curses.COLOR_WHITE,
+    ]
+    for idx, color in enumerate(palette):
+        curses.init_pair(TAIL_COLOR_BASE + idx, color, curses.COLOR_BLACK)
+    return {
+        lxc_id: curses.color_pair(TAIL_COLOR_BASE + idx % len(palette))
+        for idx, lxc_id in enumerate(lxc_ids)
+    }
+
+
+def show_log_tail(stdscr, lxc_ids, pause_event, tail=None):
+    """Merged live tail of the containers' logs until q/Esc; space freezes the view."""
+    tail = MultiTail(container_logs(lxc_ids)) if tail is None else tail
+    colors = tail_colors(lxc_ids)
+    width = max(len(lxc_id) for lxc_id in lxc_ids)
+    frozen = False
+    drawn = None
+    pause_event.set()
+    stdscr.timeout(100)
+    tail.start()
+    clear_screen(stdscr)
+    try:
+        while True:
+            state = (tail.version, frozen, curses.LINES, curses.COLS)
+            if state != drawn and not (frozen and drawn is not None and drawn[1]):
+                drawn = state
+                height = max(1, curses.LINES - 2)
+                dropped = tail.dropped()
+                skipped = sum(source.skipped_bytes for source in tail.sources)
+                header = f"Tail {' '.join(lxc_ids)}"
+                if dropped:
+                    header += " | dropped " + ", ".join(f"{i}: {n}" for i, n in sorted(dropped.items()))
+                if skipped:
+                    header += f" | skipped {format_bytes(skipped)}"
+                safe_addstr(stdscr, 0, 0, header.ljust(curses.COLS - 1), curses.A_REVERSE)
+                entries = tail.snapshot(height)
+                for row in range(height):
+                    if row < len(entries):
+                        stamp, seq, lxc_id, text = entries[row]
+                        prefix = f"{lxc_id:>{width}} "
+                        safe_addstr(stdscr, row + 1, 0, prefix, colors.get(lxc_id, 0) | curses.A_BOLD)
+                        safe_addstr(stdscr, row + 1, len(prefix), text.ljust(curses.COLS - 1 - len(prefix)))
+                    else:
+                        safe_addstr(stdscr, row + 1, 0, " " * (curses.COLS - 1))
+                footer = "FROZEN - space to follow" if frozen else "space - Freeze | q - Back"
+                safe_addstr(stdscr, curses.LINES - 1, 0, footer.ljust(curses.COLS - 1), curses.A_REVERSE)
+                with screen_lock:
+                    stdscr.refresh()
+            key = stdscr.getch()
+            if key in (ord("q"), 27):
+                break
+            if key == ord(" "):
+                frozen = not frozen
+                drawn = None
+    finally:
+        tail.stop()
+        stdscr.nodelay(True)
+        pause_event.clear()
+
+
 def animate_indicator(stdscr, operation_done_event):
     indicator_chars = ["|", "/", "-", "\\"]
     i = 0
     while not operation_done_event.is_set():
+        safe_addstr(
+            stdscr,
+            curses.LINES - 2,
+            0,
+            indicator_chars[i % len(indicator_chars)],
+            curses.A_BOLD,
+        )
         with screen_lock:
-            safe_addstr(
-                stdscr,
-                curses.LINES - 2,
-                0,
-                indicator_chars[i % len(indicator_chars)],
-                curses.A_BOLD,
-            )
             stdscr.refresh()
         i += 1
-        time.sleep(0.05)
+        clock.wait(operation_done_event, 0.05)
@@ -0,0 +1,60 @@
+"""Stand-in for the python3-lxc bindings used by backend tests."""
+
+containers = {}
+
+
+class FakeContainerState:
+    def __init__(self, state="STOPPED", ipv4=(), ipv6=(), idmap=(), fail=False):
+        self.state = state
+        self.ipv4 = list(ipv4)
+        self.ipv6 = list(ipv6)
+        self.idmap = list(idmap)
+        self.fail = fail
+        self.calls = []
+
+
+def reset(**states):
+    containers.clear()
+    containers.update(states)
+
+
+def list_containers():
+    return tuple(sorted(containers))
+
+
+class Container:
+    def __init__(self, name):
+        self.name = name
+        self._data = containers[name]
+
+    @property
+    def state(self):
+        return self._data.state
+
+    @property
+    def running(self):
+        return self._data.state == "RUNNING"
+
+    def get_ips(self, interface=None, family=None, scope=None):
+        if family == "inet6":
+            return tuple(self._data.ipv6)
+        return tuple(self._data.ipv4)
+
+    def get_config_item(self, key):
+        if key == "lxc.idmap":
+            return list(self._data.idmap)
+        return ""
+
+    def start(self):
+        self._data.calls.append("start")
+        if self._data.fail:
+            return False
+        self._data.state = "RUNNING"
+        return True
+
+    def stop(self):
+        self._data.calls.append("stop")
+        if self._data.fail:
+            return False
+        self._data.state = "STOPPED"
+        return True
@@ -0,0 +1,53 @@
+import subprocess
+import pytest
+from lxc_tui.attach import AttachManager, detect_multiplexer
+
+
+def completed(returncode=0, stdout=""):
+    return subprocess.CompletedProcess([], returncode, stdout=stdout)
+
+
+def test_detect_multiplexer():
+    which = lambda name: f"/usr/bin/{name}"
+    assert detect_multiplexer({"TMUX": "/tmp/tmux-0/default"}, which) == "tmux"
+    assert detect_multiplexer({"STY": "123.pts-0"}, which) == "screen"
+    assert detect_multiplexer({}, which) is None
+    assert detect_multiplexer({}, which, detached=True) == "tmux-detached"
+    assert detect_multiplexer({}, lambda name: None) is None
+
+
+def test_attach_opens_tmux_window(mocker):
+    run = mocker.Mock(return_value=completed())
+    manager = AttachManager("tmux", run=run)
+    assert manager.attach("101")
+    run.assert_called_once_with(["tmux", "new-window", "-n", "lxc-101", "lxc-attach", "-n", "101"])
+
+
+def test_detached_tmux_creates_session_once(mocker):
+    run = mocker.Mock(side_effect=[completed(1), completed(), completed(0), completed()])
+    manager = AttachManager("tmux-detached", run=run)
+    manager.attach("101")
+    manager.attach("102")
+    assert run.call_args_list[1].args[0][:3] == ["tmux", "new-session", "-d"]
+    assert run.call_args_list[3].args[0][:3] == ["tmux", "new-window", "-d"]
+
+
+def test_sessions_are_cached_and_refreshed_in_the_background(mocker):
+    run = mocker.Mock(return_value=completed(stdout="lxc-tui\nlxc-101\nbash\nlxc-205\n"))
+    manager = AttachManager("tmux", run=run, ttl=2.0)
+    assert manager.sessions(now=10.0) == frozenset()
+    manager.refresher.join(5)
+    assert manager.sessions(now=11.0) == {"101", "205"}
+    assert run.call_count == 1
+    manager.sessions(now=12.5)
+    manager.refresher.join(5)
+    assert run.call_count == 2
+
+
+def test_no_multiplexer_falls_back(mocker):
+    run = mocker.Mock()
+    manager = AttachManager("", run=run)
+    assert not manager.available
+    assert not manager.attach("101")
+    assert manager.sessions() == frozenset()
+    run.assert_not_called()
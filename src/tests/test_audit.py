@@ -0,0 +1,66 @@
+import json
+import os
+from lxc_tui import audit
+from lxc_tui.audit import AuditLog, command_target, format_entry, read_audit
+
+
+def test_command_target_handles_lxc_tools_and_pct():
+    assert command_target(["lxc-stop", "-n", "101"]) == "101"
+    assert command_target(["pct", "snapshot", "102", "snap1"]) == "102"
+    assert command_target(["true"]) is None
+
+
+def test_bulk_records_are_batched_into_few_fsyncs(tmp_path, mocker):
+    fsync = mocker.spy(os, "fsync")
+    path = tmp_path / "audit.ndjson"
+    log = AuditLog(str(path), flush_interval=0.5)
+    for i in range(200):
+        log.record(["lxc-stop", "-n", str(100 + i)], 0, 1000.0 + i, 0.25, action="stop")
+    log.close()
+
+    entries = [json.loads(line) for line in path.read_text().splitlines()]
+    assert len(entries) == 200
+    assert entries[0]["id"] == "100" and entries[0]["rc"] == 0 and entries[0]["action"] == "stop"
+    assert entries[0]["user"]
+    assert fsync.call_count <= 3
+
+
+def test_run_command_is_audited_with_exit_code(tmp_path, mocker):
+    from lxc_tui.commands import run_command
+
+    proc = mocker.Mock(returncode=3)
+    mocker.patch("lxc_tui.commands.lxc_utils.spawn_command", return_value=proc)
+    log = AuditLog(str(tmp_path / "audit.ndjson"))
+    audit.set_audit_log(log)
+    try:
+        assert not run_command(["lxc-start", "-n", "101"], lxc_id="101", label="start")
+    finally:
+        audit.set_audit_log(None)
+        log.close()
+
+    entries = read_audit(str(tmp_path / "audit.ndjson"))
+    assert [(e["id"], e["action"], e["rc"]) for e in entries] == [("101", "start", 3)]
+    assert "rc=3" in format_entry(entries[0])
+
+
+def test_commands_that_fail_to_start_are_audited(tmp_path, mocker):
+    from lxc_tui.commands import run_command
+    from lxc_tui.jobs import JobManager
+
+    mocker.patch("lxc_tui.lxc_utils.spawn_command", side_effect=FileNotFoundError("no lxc-start"))
+    log = AuditLog(str(tmp_path / "audit.ndjson"))
+    audit.set_audit_log(log)
+    try:
+        assert not run_command(["lxc-start", "-n", "101"], lxc_id="101", label="start")
+        job = JobManager().submit("create 103:snap1", ["pct", "snapshot", "103", "snap1"])
+        assert job.done.wait(2)
+    finally:
+        audit.set_audit_log(None)
+        log.close()
+
+    entries = read_audit(str(tmp_path / "audit.ndjson"))
+    assert [(e["id"], e["rc"], e["error"]) for e in entries] == [
+        ("101", None, "no lxc-start"),
+        ("103", None, "no lxc-start"),
+    ]
+    assert "error" in format_entry(entries[0]) and "no lxc-start" in format_entry(entries[0])
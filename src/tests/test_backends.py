@@ -0,0 +1,58 @@
+import pytest
+from lxc_tui import lxc_utils
+from lxc_tui.backends import LiblxcBackend, SubprocessBackend, select_backend
+from lxc_tui.commands import run_command
+from tests import fake_lxc
+
+
+@pytest.fixture
+def backend(mocker):
+    fake_lxc.reset(
+        **{
+            "101": fake_lxc.FakeContainerState(
+                "RUNNING", ipv4=["10.0.0.1"], ipv6=["fd00::1"], idmap=["u 0 100000 65536"]
+            ),
+            "102": fake_lxc.FakeContainerState("STOPPED"),
+        }
+    )
+    mocker.patch("lxc_tui.lxc_utils.read_hostname", side_effect=lambda lxc_id: f"host{lxc_id}")
+    backend = LiblxcBackend(fake_lxc)
+    lxc_utils.set_backend(backend)
+    yield backend
+    lxc_utils.set_backend(None)
+
+
+def test_liblxc_backend_lists_containers(backend):
+    assert lxc_utils.get_lxc_info(include_stopped=True) == [
+        ("101", "host101", "RUNNING", "10.0.0.1, fd00::1", "true"),
+        ("102", "host102", "STOPPED", "", "false"),
+    ]
+    assert lxc_utils.get_lxc_info() == [
+        ("101", "host101", "RUNNING", "10.0.0.1, fd00::1", "true"),
+    ]
+
+
+def test_liblxc_backend_runs_commands_in_process(backend, mocker):
+    popen = mocker.patch("subprocess.Popen")
+
+    assert run_command(["lxc-start", "-n", "102"])
+    assert fake_lxc.containers["102"].state == "RUNNING"
+    popen.assert_not_called()
+
+    fake_lxc.containers["101"].fail = True
+    assert not run_command(["lxc-stop", "-n", "101"])
+    assert fake_lxc.containers["101"].calls == ["stop"]
+
+
+def test_liblxc_backend_falls_back_for_unknown_commands(backend, mocker):
+    popen = mocker.patch("subprocess.Popen")
+    backend.spawn(["lxc-freeze", "-n", "101"])
+    popen.assert_called_once()
+
+
+def test_select_backend(mocker):
+    assert isinstance(select_backend("subprocess"), SubprocessBackend)
+    mocker.patch.dict("sys.modules", {"lxc": fake_lxc})
+    assert isinstance(select_backend(), LiblxcBackend)
+    mocker.patch.dict("sys.modules", {"lxc": None})
+    assert type(select_backend()) is SubprocessBackend
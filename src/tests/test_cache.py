@@ -0,0 +1,45 @@
+import pytest
+from lxc_tui.cache import InventoryCache, load_snapshot, save_snapshot
+
+
+def test_save_and_load_snapshot_round_trip(tmp_path):
+    path = str(tmp_path / "lxc-tui" / "inventory.json")
+    lxc_info = [
+        ("101", "web", "RUNNING", "10.0.0.1", "true"),
+        ("102", "db", "STOPPED", "", "false"),
+    ]
+    assert save_snapshot(path, lxc_info, True, saved_at=42.0)
+
+    assert load_snapshot(path, True) == (lxc_info, 42.0)
+    assert load_snapshot(path, False) == ([lxc_info[0]], 42.0)
+
+
+def test_empty_refresh_does_not_clobber_cache(tmp_path):
+    path = str(tmp_path / "inventory.json")
+    cache = InventoryCache(path)
+    cache.listener([("101", "web", "RUNNING", "", "true")], False)
+    cache.listener([], False)
+
+    lxc_info, saved_at = cache.load(False)
+    assert lxc_info == [("101", "web", "RUNNING", "", "true")]
+    assert saved_at is not None
+
+
+def test_load_snapshot_missing_or_corrupt(tmp_path):
+    path = tmp_path / "inventory.json"
+    assert load_snapshot(str(path), False) == ([], None)
+    path.write_text("{not json")
+    assert load_snapshot(str(path), False) == ([], None)
+
+
+def test_cache_keeps_last_known_ips_while_lookups_are_pending(tmp_path):
+    path = str(tmp_path / "inventory.json")
+    cache = InventoryCache(path)
+    cache.listener([("101", "web", "RUNNING", "10.0.0.1", "true")], False)
+    cache.listener([("101", "web", "RUNNING", "", "true"), ("102", "db", "RUNNING", "?", "true")], False)
+
+    lxc_info, _ = load_snapshot(path, False)
+    assert lxc_info == [("101", "web", "RUNNING", "10.0.0.1", "true"), ("102", "db", "RUNNING", "", "true")]
+
+    cache.listener([("101", "web", "STOPPED", "", "true")], True)
+    assert load_snapshot(path, True)[0] == [("101", "web", "STOPPED", "", "true")]
@@ -0,0 +1,97 @@
+import threading
+import time
+import pytest
+from lxc_tui import clock, lxc_utils
+from lxc_tui.clock import FakeClock, set_clock
+from lxc_tui.core import AppContext
+from lxc_tui.lxc_utils import refresh_lxc_info
+from lxc_tui.ui_components import animate_indicator
+
+
+@pytest.fixture
+def fake_clock():
+    fake = FakeClock()
+    set_clock(fake)
+    yield fake
+    set_clock(clock.SystemClock())
+
+
+def test_fake_clock_runs_timers_in_order_while_sleeping(fake_clock):
+    fired = []
+    fake_clock.call_at(2.0, lambda: fired.append(("b", fake_clock.time())))
+    fake_clock.call_at(1.0, lambda: fired.append(("a", fake_clock.time())))
+    fake_clock.sleep(1.5)
+    assert fired == [("a", 1.0)]
+    assert clock.now() == 1.5
+    event = threading.Event()
+    fake_clock.call_later(10, event.set)
+    assert not clock.wait(event, 5)
+    assert clock.wait(event, 60)
+    assert clock.now() == 11.5
+    assert fired[-1] == ("b", 2.0)
+
+
+def test_wait_without_timeout_or_timers_refuses_to_hang(fake_clock):
+    with pytest.raises(RuntimeError):
+        clock.wait(threading.Event())
+
+
+def test_an_hour_of_refreshes_runs_exactly_every_half_second(fake_clock, mocker):
+    snapshots = iter(range(1_000_000))
+    get_info = mocker.patch.object(
+        lxc_utils, "get_lxc_info", side_effect=lambda show: [(str(next(snapshots)), "h", "RUNNING", "", "true")]
+    )
+    context = AppContext()
+    listener = mocker.Mock()
+    context.listeners.append(listener)
+    stop_event = threading.Event()
+    pause_event = threading.Event()
+    fake_clock.call_at(1800, pause_event.set)
+    fake_clock.call_at(2700, pause_event.clear)
+    fake_clock.call_at(3600, stop_event.set)
+
+    refresh_lxc_info([], stop_event, pause_event, False, context)
+
+    # 3600s at 0.5s, minus the 900s paused: 5400 refreshes, all of them changes
+    assert get_info.call_count == 5400
+    assert listener.call_count == 5400
+    assert context.last_refresh == 3599.5
+    assert clock.now() == 3600
+
+
+def test_indicator_animates_until_the_operation_finishes(fake_clock, mocker):
+    curses_mock = mocker.patch("lxc_tui.ui_components.curses")
+    mocker.patch("lxc_tui.core.curses", curses_mock)
+    curses_mock.LINES, curses_mock.COLS = 24, 80
+    done = threading.Event()
+    # Finish between two frames so float drift in the 0.05s steps cannot matter
+    fake_clock.call_at(59.975, done.set)
+    stdscr = mocker.Mock()
+
+    animate_indicator(stdscr, done)
+
+    assert stdscr.refresh.call_count == 1200
+    assert clock.now() == 59.975
+
+
+def test_background_threads_wait_for_the_driving_thread(fake_clock):
+    woke = []
+    stop = threading.Event()
+
+    def loop():
+        while not clock.wait(stop, 5):
+            woke.append(clock.now())
+
+    thread = threading.Thread(target=loop, daemon=True)
+    thread.start()
+    time.sleep(0.1)
+    assert woke == []
+    fake_clock.advance(5)
+    for _ in range(100):
+        if woke:
+            break
+        time.sleep(0.01)
+    assert woke == [5.0]
+    stop.set()
+    thread.join(1)
+    assert not thread.is_alive()
@@ -0,0 +1,96 @@
+import subprocess
+import threading
+import pytest
+from lxc_tui.commands import CommandService, run_command, update_container_record
+
+
+class FakeProc:
+    def __init__(self, release, returncode=0):
+        self.release = release
+        self.returncode = None
+        self._returncode = returncode
+
+    def wait(self, timeout=None):
+        self.release.wait(timeout)
+        self.returncode = self._returncode
+        return self.returncode
+
+    def kill(self):
+        pass
+
+
+def test_duplicate_submissions_are_coalesced(mocker):
+    release = threading.Event()
+    spawn = mocker.patch(
+        "lxc_tui.commands.lxc_utils.spawn_command", side_effect=lambda command: FakeProc(release)
+    )
+    state = mocker.patch("lxc_tui.commands.lxc_utils.lookup_state", return_value="RUNNING")
+    service = CommandService()
+
+    first = service.submit("101", [["lxc-start", "-n", "101"]], "start")
+    second = service.submit("101", [["lxc-start", "-n", "101"]], "start")
+    other = service.submit("102", [["lxc-start", "-n", "102"]], "start")
+    assert first is second
+    assert other is not first
+    release.set()
+
+    assert first.result(1).ok
+    other.result(1)
+    assert spawn.call_count == 2
+    assert sorted(call.args[0] for call in state.call_args_list) == ["101", "102"]
+    service.shutdown()
+
+
+def test_apply_updates_only_affected_record(mocker):
+    release = threading.Event()
+    release.set()
+    mocker.patch("lxc_tui.commands.lxc_utils.spawn_command", side_effect=lambda command: FakeProc(release))
+    mocker.patch("lxc_tui.commands.lxc_utils.lookup_state", return_value="STOPPED")
+    get_info = mocker.patch("lxc_tui.lxc_utils.get_lxc_info")
+    service = CommandService()
+    lxc_info = [
+        ("101", "web", "RUNNING", "10.0.0.1", "true"),
+        ("102", "db", "RUNNING", "10.0.0.2", "true"),
+    ]
+
+    service.submit("101", [["lxc-stop", "-n", "101"]], "stop").result(1)
+    results = service.apply(lxc_info, show_stopped=True)
+
+    assert [(r.lxc_id, r.ok, r.state) for r in results] == [("101", True, "STOPPED")]
+    assert lxc_info == [
+        ("101", "web", "STOPPED", "", "true"),
+        ("102", "db", "RUNNING", "10.0.0.2", "true"),
+    ]
+    get_info.assert_not_called()
+    service.shutdown()
+
+
+def test_failed_command_stops_sequence(mocker):
+    release = threading.Event()
+    release.set()
+    spawn = mocker.patch(
+        "lxc_tui.commands.lxc_utils.spawn_command", side_effect=lambda command: FakeProc(release, 1)
+    )
+    mocker.patch("lxc_tui.commands.lxc_utils.lookup_state", return_value="RUNNING")
+    service = CommandService()
+    result = service.submit(
+        "101", [["lxc-stop", "-n", "101"], ["lxc-start", "-n", "101"]], "restart"
+    ).result(1)
+    assert not result.ok
+    assert spawn.call_count == 1
+    service.shutdown()
+
+
+def test_run_command_kills_commands_that_time_out(mocker):
+    proc = mocker.Mock()
+    proc.wait.side_effect = subprocess.TimeoutExpired(["lxc-stop"], 0.01)
+    mocker.patch("lxc_tui.commands.lxc_utils.spawn_command", return_value=proc)
+    assert not run_command(["lxc-stop", "-n", "101"], timeout=0.01)
+    proc.kill.assert_called_once()
+
+
+def test_update_container_record_hides_stopped():
+    lxc_info = [("101", "web", "RUNNING", "10.0.0.1", "true")]
+    assert update_container_record(lxc_info, "101", "STOPPED", False)
+    assert lxc_info == []
+    assert not update_container_record(lxc_info, "999", "RUNNING", False)
@@ -0,0 +1,90 @@
+import io
+import os
+from lxc_tui.configindex import ConfigIndex, config_terms, parse_config_text, run_report
+
+WEB = """arch: amd64
+hostname: web
+features: nesting=1,keyctl=1
+memory: 1024
+mp0: /mnt/backup,mp=/backup
+net0: name=eth0,bridge=vmbr0,hwaddr=AA:00:00:00:00:01
+
+[snap1]
+memory: 512
+"""
+DB = """arch: amd64
+hostname: db
+memory: 4096
+net0: name=eth0,bridge=vmbr0,hwaddr=AA:00:00:00:00:02
+"""
+CACHE = """arch: amd64
+hostname: cache
+features: nesting=1
+memory: 1024
+net0: name=eth0,bridge=vmbr1,hwaddr=AA:00:00:00:00:03
+"""
+
+
+def write_configs(tmp_path, configs):
+    for lxc_id, text in configs.items():
+        (tmp_path / f"{lxc_id}.conf").write_text(text)
+
+
+def test_option_lists_are_split_into_terms():
+    terms = config_terms(parse_config_text(WEB))
+    assert ("memory", "1024") in terms
+    assert ("features.nesting", "1") in terms and ("nesting", "1") in terms
+    assert ("mp0", "/mnt/backup") in terms and ("mp0.mp", "/backup") in terms
+    assert ("memory", "512") not in terms
+
+
+def test_queries_diff_and_drift(tmp_path):
+    write_configs(tmp_path, {"101": WEB, "102": DB, "205": CACHE})
+    index = ConfigIndex(str(tmp_path))
+    assert index.refresh() == 3
+
+    assert index.query("nesting=1") == ["101", "205"]
+    assert index.query("mp*=/mnt/backup*") == ["101"]
+    assert index.query("nesting=1 bridge=vmbr0") == ["101"]
+    assert index.query("memory!=1024") == ["102"]
+    assert index.query("features") == ["101", "205"]
+    assert ("features", "nesting=1,keyctl=1", "nesting=1") in index.diff("101", "205")
+    assert ("mp0", "/mnt/backup,mp=/backup", None) in index.diff("101", "205")
+
+    drift = index.drift()
+    assert drift["memory"] == {"1024": ["101", "205"], "4096": ["102"]}
+    assert "hostname" not in drift and "arch" not in drift
+
+
+def test_refresh_only_rereads_changed_files(tmp_path):
+    write_configs(tmp_path, {"101": WEB, "102": DB})
+    reads = []
+    index = ConfigIndex(str(tmp_path))
+    index.read = lambda lxc_id: reads.append(lxc_id) or index.read_file(lxc_id)
+    index.refresh()
+    assert sorted(reads) == ["101", "102"]
+
+    reads.clear()
+    assert index.refresh() == 0
+    (tmp_path / "102.conf").write_text(DB.replace("4096", "8192"))
+    os.utime(tmp_path / "102.conf", ns=(1, 1))
+    os.remove(tmp_path / "101.conf")
+    assert index.refresh() == 1
+    assert reads == ["102"]
+    assert index.query("memory=4096") == []
+    assert index.query("memory=8192") == ["102"]
+    assert index.query("nesting=1") == []
+
+
+def test_headless_report(tmp_path):
+    write_configs(tmp_path, {"101": WEB, "102": DB, "205": CACHE})
+    out = io.StringIO()
+    assert run_report(["nesting=1", "diff 101 102"], str(tmp_path), out) == 0
+    text = out.getvalue()
+    assert "2 container(s) match nesting=1" in text
+    assert "101    web" in text and "difference(s) between 101 and 102" in text
+
+    out = io.StringIO()
+    assert run_report([], str(tmp_path), out) == 0
+    assert "memory:" in out.getvalue()
+    assert run_report(["diff 101 999"], str(tmp_path), io.StringIO()) == 1
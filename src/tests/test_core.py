@@ -27,4 +27,14 @@ def test_log_debug(mocker):
 
     log_debug("Test message")
     mock_open.assert_called_once_with("debug_log.txt", "a")
-    mock_open().write.assert_called_once()
\ No newline at end of file
+    mock_open().write.assert_called_once()
+
+def test_byte_counter_keeps_a_sliding_minute():
+    from lxc_tui.core import ByteCounter
+
+    counter = ByteCounter(window=60)
+    counter.add(100, now=0)
+    counter.add(50, now=30.5)
+    assert counter.recent(now=59) == 150
+    assert counter.recent(now=61) == 50
+    assert counter.total == 150
@@ -0,0 +1,83 @@
+import os
+import shutil
+from lxc_tui.diskusage import DirectoryCache, DiskScanner, resolve_rootfs
+
+
+def make_tree(root):
+    (root / "etc").mkdir(parents=True)
+    (root / "var" / "log").mkdir(parents=True)
+    (root / "etc" / "hostname").write_bytes(b"x" * 5000)
+    (root / "var" / "log" / "syslog").write_bytes(b"x" * 20000)
+
+
+def test_resolve_rootfs_prefers_config_path(tmp_path):
+    rootfs = tmp_path / "custom"
+    rootfs.mkdir()
+    config_dir = tmp_path / "pve"
+    config_dir.mkdir()
+    (config_dir / "101.conf").write_text(f"lxc.rootfs.path = dir:{rootfs}\n")
+    lxc_root = tmp_path / "lxc"
+    (lxc_root / "102" / "rootfs").mkdir(parents=True)
+
+    assert resolve_rootfs("101", str(config_dir), str(lxc_root)) == str(rootfs)
+    assert resolve_rootfs("102", str(config_dir), str(lxc_root)) == str(lxc_root / "102" / "rootfs")
+    assert resolve_rootfs("103", str(config_dir), str(lxc_root)) is None
+
+    # /etc/pve configs carry raw keys in the colon form
+    (config_dir / "102.conf").write_text(f"lxc.rootfs.path: {rootfs}\n")
+    assert resolve_rootfs("102", str(config_dir), str(lxc_root)) == str(rootfs)
+
+
+def test_rescan_only_lists_directories_whose_mtime_changed(tmp_path, mocker):
+    root = tmp_path / "rootfs"
+    make_tree(root)
+    cache = DirectoryCache()
+    first = cache.total(str(root))
+    assert first >= 25000
+
+    scandir = mocker.spy(os, "scandir")
+    assert cache.total(str(root)) == first
+    assert scandir.call_count == 0
+
+    (root / "var" / "log" / "new.log").write_bytes(b"x" * 8192)
+    second = cache.total(str(root))
+    assert second >= first + 8192
+    assert [call.args[0] for call in scandir.call_args_list] == [str(root / "var" / "log")]
+
+    (root / "var" / "log" / "syslog").unlink()
+    (root / "var" / "log" / "new.log").unlink()
+    os.rmdir(root / "var" / "log")
+    assert cache.total(str(root)) < first
+    assert str(root / "var" / "log") not in cache.entries
+
+
+def test_scanner_publishes_each_container_as_it_finishes(tmp_path):
+    lxc_root = tmp_path / "lxc"
+    make_tree(lxc_root / "101" / "rootfs")
+    scanner = DiskScanner(config_dir=str(tmp_path), lxc_root=str(lxc_root))
+    scanner.listener([("101", "a", "RUNNING", "", "true"), ("102", "b", "STOPPED", "", "true")], True)
+    assert scanner.get("101") == "..."
+
+    scanner.scan_once()
+
+    assert scanner.get("101").endswith("K")
+    assert scanner.get("102") == ""
+    assert scanner.version == 2
+
+
+def test_scanner_bumps_version_only_on_change_and_prunes_caches(tmp_path):
+    lxc_root = tmp_path / "lxc"
+    make_tree(lxc_root / "101" / "rootfs")
+    scanner = DiskScanner(config_dir=str(tmp_path), lxc_root=str(lxc_root))
+    scanner.listener([("101", "a", "RUNNING", "", "true")], True)
+    scanner.scan_once()
+    version = scanner.version
+    scanner.scan_once()
+    assert scanner.version == version
+    assert list(scanner.caches) == [str(lxc_root / "101" / "rootfs")]
+
+    shutil.rmtree(lxc_root / "101")
+    scanner.scan_once()
+    assert scanner.get("101") == ""
+    assert scanner.version == version + 1
+    assert scanner.caches == {}
@@ -1,3 +1,4 @@
+import threading
 import pytest
 from lxc_tui.event_handler import handle_events
 
@@ -17,5 +18,203 @@ def test_handle_events_navigation(mocker):
 
     mocker.patch('lxc_tui.ui_components.update_highlighted_row')
 
-    current_row, _, _, _ = handle_events(stdscr, lxc_info, 1, False, mocker.Mock(), mocker.Mock(), mocker.Mock(), [])
-    assert current_row == 0
\ No newline at end of file
+    current_row, _, _ = handle_events(stdscr, lxc_info, 1, False, mocker.Mock(), mocker.Mock(), mocker.Mock(), [])
+    assert current_row == 0
+
+def test_resize_events_are_deferred_to_debouncer(mocker):
+    from lxc_tui.core import AppContext
+
+    stdscr = mocker.Mock()
+    stdscr.getch.side_effect = [410, -1]  # one curses.KEY_RESIZE, then an empty queue
+    curses_mock = mocker.MagicMock()
+    curses_mock.KEY_RESIZE = 410
+    mocker.patch('lxc_tui.event_handler.curses', curses_mock)
+    display = mocker.patch('lxc_tui.event_handler.display_container_list')
+    context = AppContext()
+    context.resize = mocker.Mock()
+
+    handle_events(stdscr, [], 0, False, mocker.Mock(), mocker.Mock(), mocker.Mock(), [], context=context)
+
+    context.resize.note.assert_called_once()
+    display.assert_not_called()
+    curses_mock.resize_term.assert_not_called()
+
+
+def make_curses(mocker, modules):
+    curses_mock = mocker.MagicMock()
+    curses_mock.LINES = 60
+    curses_mock.COLS = 80
+    curses_mock.KEY_UP = 259
+    curses_mock.KEY_DOWN = 258
+    curses_mock.KEY_RESIZE = 410
+    curses_mock.color_pair = lambda x: x
+    for module in modules:
+        mocker.patch(f'lxc_tui.{module}.curses', curses_mock)
+    return curses_mock
+
+
+def test_thousand_keypresses_are_folded_into_one_repaint(mocker):
+    from lxc_tui.core import AppContext
+    from lxc_tui.ui_components import FrameLimiter
+
+    make_curses(mocker, ['event_handler', 'ui_components', 'core'])
+    lxc_info = [(str(100 + i), f"host{i}", "RUNNING", "", "true") for i in range(50)]
+    stdscr = mocker.Mock()
+    stdscr.getmaxyx.return_value = (60, 80)
+    stdscr.getch.side_effect = [258] * 960 + [259] * 40 + [-1]
+    pause_event = mocker.Mock()
+    context = AppContext()
+    context.frames = FrameLimiter(fps=30, clock=lambda: 0.0)
+
+    current_row, _, _ = handle_events(
+        stdscr, lxc_info, 0, False, pause_event, mocker.Mock(), mocker.Mock(), [], context=context
+    )
+
+    assert current_row == 9
+    assert stdscr.refresh.call_count == 1
+    pause_event.set.assert_not_called()
+
+
+def test_keys_spread_over_ticks_repaint_at_most_once_per_frame(mocker):
+    from lxc_tui.core import AppContext
+    from lxc_tui.ui_components import FrameLimiter
+
+    make_curses(mocker, ['event_handler', 'ui_components', 'core'])
+    lxc_info = [(str(100 + i), f"host{i}", "RUNNING", "", "true") for i in range(50)]
+    stdscr = mocker.Mock()
+    stdscr.getmaxyx.return_value = (60, 80)
+    keys = []
+    for tick in range(100):
+        keys += [258 if tick % 20 < 10 else 259] * 10 + [-1]
+    stdscr.getch.side_effect = keys
+    now = [0.0]
+    context = AppContext()
+    context.frames = FrameLimiter(fps=30, clock=lambda: now[0])
+
+    current_row = 0
+    for tick in range(100):
+        now[0] = tick * 0.01
+        current_row, _, _ = handle_events(
+            stdscr, lxc_info, current_row, False, mocker.Mock(), mocker.Mock(), mocker.Mock(), [],
+            context=context,
+        )
+        context.frames.flush(stdscr, current_row, lxc_info)
+
+    assert stdscr.getch.call_count == len(keys)
+    assert stdscr.refresh.call_count <= 31
+
+def test_isolated_plugin_key_goes_to_the_plugin_host(mocker):
+    from lxc_tui.core import AppContext, IsolatedPlugin
+    from lxc_tui.event_handler import apply_plugin_command
+
+    plugin = IsolatedPlugin()
+    plugin.key = ord("T")
+    plugin.description = "Tidy"
+    plugin.execute = mocker.Mock()
+    stdscr = mocker.Mock()
+    stdscr.getch.side_effect = [ord("T"), -1]
+    make_curses(mocker, ['event_handler', 'ui_components', 'core'])
+    mocker.patch('lxc_tui.event_handler.update_navigation_bar')
+    context = AppContext()
+    context.plugin_host = mocker.Mock()
+    lxc_info = [["101", "web", "RUNNING", "", "true"]]
+
+    handle_events(stdscr, lxc_info, 0, False, mocker.Mock(), mocker.Mock(), mocker.Mock(), [plugin], context=context)
+
+    plugin.execute.assert_not_called()
+    submitted_plugin, snapshot = context.plugin_host.submit.call_args[0]
+    assert submitted_plugin is plugin
+    assert snapshot.containers == (("101", "web", "RUNNING", "", "true"),)
+
+    run_action = mocker.patch('lxc_tui.event_handler.run_action')
+    mocker.patch('lxc_tui.event_handler.confirm_action', return_value=False)
+    apply_plugin_command(stdscr, plugin, ("action", "stop", "101"), lxc_info, 0, False, None, None, context)
+    run_action.assert_not_called()
+
+
+def test_palette_targets_include_hidden_stopped_containers(mocker):
+    from lxc_tui.core import AppContext
+    from lxc_tui.event_handler import run_palette
+
+    visible = [("101", "web", "RUNNING", "10.0.0.1", "true")]
+    everything = visible + [("102", "db", "STOPPED", "", "true")]
+    mocker.patch('lxc_tui.event_handler.curses')
+    mocker.patch('lxc_tui.event_handler.read_line', return_value="start state:STOPPED")
+    mocker.patch('lxc_tui.event_handler.draw_panel')
+    mocker.patch('lxc_tui.event_handler.notify')
+    listing = mocker.patch('lxc_tui.event_handler.get_lxc_info', return_value=everything)
+    run_plan = mocker.patch('lxc_tui.palette.run_plan')
+    stdscr = mocker.Mock()
+    stdscr.getch.return_value = ord("y")
+    context = AppContext()
+    context.commands = mocker.Mock()
+
+    run_palette(stdscr, visible, context)
+
+    listing.assert_called_once_with(include_stopped=True)
+    plan = run_plan.call_args[0][0]
+    assert [(step.action, step.lxc_ids) for step in plan] == [("start", ["102"])]
+
+
+def test_log_tail_targets_include_hidden_stopped_containers(mocker):
+    from lxc_tui.event_handler import run_log_tail
+
+    visible = [("101", "web", "RUNNING", "10.0.0.1", "true")]
+    everything = visible + [("102", "db", "STOPPED", "", "true")]
+    mocker.patch('lxc_tui.event_handler.read_line', return_value="102")
+    mocker.patch('lxc_tui.event_handler.get_lxc_info', return_value=everything)
+    show = mocker.patch('lxc_tui.event_handler.show_log_tail')
+
+    run_log_tail(mocker.Mock(), visible, 0, mocker.Mock())
+
+    assert show.call_args[0][1] == ["102"]
+
+
+def test_third_party_in_process_plugins_need_trust(mocker):
+    from lxc_tui import plugin_host
+    from lxc_tui.core import Plugin
+
+    seen = []
+
+    class Legacy(Plugin):
+        def __init__(self):
+            super().__init__()
+            self.key = ord("L")
+            self.description = "Legacy"
+
+        def execute(self, stdscr, lxc_info, current_row, *args):
+            seen.append(lxc_info)
+            lxc_info.clear()
+            return 5
+
+    make_curses(mocker, ['event_handler', 'ui_components', 'core'])
+    mocker.patch('lxc_tui.event_handler.update_navigation_bar')
+    notify = mocker.patch('lxc_tui.event_handler.notify')
+    lxc_info = [("101", "web", "RUNNING", "", "true"), ("102", "db", "RUNNING", "", "true")]
+    stdscr = mocker.Mock()
+
+    mocker.patch.object(plugin_host, "trusted", False)
+    stdscr.getch.side_effect = [ord("L"), -1]
+    handle_events(stdscr, lxc_info, 0, False, mocker.Mock(), mocker.Mock(), mocker.Mock(), [Legacy()])
+    assert seen == []
+    assert "--trusted-plugins" in notify.call_args[0][0]
+
+    mocker.patch.object(plugin_host, "trusted", True)
+    stdscr.getch.side_effect = [ord("L"), -1]
+    current_row, _, _ = handle_events(stdscr, lxc_info, 0, False, mocker.Mock(), mocker.Mock(), mocker.Mock(), [Legacy()])
+    assert len(seen) == 1 and seen[0] is not lxc_info
+    assert len(lxc_info) == 2
+    assert current_row == 1
+
+
+def test_actions_without_the_command_service_do_not_block(mocker):
+    from lxc_tui.event_handler import run_action
+
+    spawn = mocker.patch('lxc_tui.lxc_utils.spawn_command')
+    notify = mocker.patch('lxc_tui.event_handler.notify')
+    lxc_info = [("101", "web", "RUNNING", "", "true")]
+
+    run_action(mocker.Mock(), lxc_info, 0, False, "101", "stop", threading.Event(), None)
+
+    spawn.assert_not_called()
+    assert "command service" in notify.call_args[0][0]
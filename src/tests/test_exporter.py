@@ -0,0 +1,71 @@
+import threading
+import urllib.request
+import pytest
+from http.server import ThreadingHTTPServer
+from lxc_tui.exporter import (
+    IPv6HTTPServer,
+    MetricsCollector,
+    make_handler,
+    parse_listen_address,
+    render_metrics,
+    server_class,
+)
+
+
+def test_parse_listen_address():
+    assert parse_listen_address(":9101") == ("", 9101)
+    assert parse_listen_address("127.0.0.1:9101") == ("127.0.0.1", 9101)
+    assert parse_listen_address("[::1]:9101") == ("::1", 9101)
+    with pytest.raises(ValueError):
+        parse_listen_address("9101x")
+
+
+def test_render_metrics():
+    lxc_info = [("101", 'we"b', "RUNNING", "10.0.0.1, fd00::1", "true")]
+    text = render_metrics(lxc_info, {"101": {"memory_bytes": 2048, "cpu_usage_usec": 1500000}}, 1.0, 0.5, 3).decode()
+
+    assert 'lxc_container_info{id="101",hostname="we\\"b"} 1' in text
+    assert 'lxc_container_state{id="101",state="RUNNING"} 1' in text
+    assert 'lxc_container_state{id="101",state="STOPPED"} 0' in text
+    assert 'lxc_container_unprivileged{id="101"} 1' in text
+    assert 'lxc_container_ip_info{id="101",family="ipv6",address="fd00::1"} 1' in text
+    assert 'lxc_container_memory_bytes{id="101"} 2048' in text
+    assert 'lxc_container_cpu_usage_seconds_total{id="101"} 1.5' in text
+    assert "lxc_exporter_collections_total 3" in text
+
+
+def test_large_values_keep_every_digit():
+    metrics = {"101": {"memory_bytes": 1234567890123, "cpu_usage_usec": 1234567890123}}
+    text = render_metrics([], metrics, 1.0, 0.5, 1).decode()
+
+    assert 'lxc_container_memory_bytes{id="101"} 1234567890123\n' in text
+    assert 'lxc_container_cpu_usage_seconds_total{id="101"} 1234567.890123\n' in text
+
+
+def test_ipv6_listen_addresses_get_an_ipv6_server():
+    assert server_class("::1") is IPv6HTTPServer
+    assert server_class("127.0.0.1") is ThreadingHTTPServer
+    assert server_class("") is ThreadingHTTPServer
+
+
+def test_scrapes_are_served_from_cached_snapshot(mocker):
+    get_info = mocker.patch(
+        "lxc_tui.exporter.get_lxc_info",
+        return_value=[("101", "web", "STOPPED", "", "false")],
+    )
+    collector = MetricsCollector(cgroup_root="/nonexistent")
+    collector.collect()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(collector))
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        url = f"http://127.0.0.1:{server.server_address[1]}/metrics"
+        for _ in range(5):
+            body = urllib.request.urlopen(url).read().decode()
+    finally:
+        server.shutdown()
+        server.server_close()
+
+    assert 'lxc_container_state{id="101",state="STOPPED"} 1' in body
+    assert get_info.call_count == 1
@@ -0,0 +1,103 @@
+import pytest
+from lxc_tui.groups import GroupIndex, GroupView, parse_pools
+
+
+@pytest.fixture
+def config_dir(tmp_path):
+    (tmp_path / "101.conf").write_text("hostname: web1\ntags: web;prod\n[snap]\ntags: old\n")
+    (tmp_path / "102.conf").write_text("hostname: web2\ntags: web\n")
+    (tmp_path / "103.conf").write_text("hostname: db\n")
+    (tmp_path / "user.cfg").write_text("pool:backend:Backend pool:103,102:\n")
+    return tmp_path
+
+
+LXC_INFO = [
+    ("101", "web1", "RUNNING", "", "true"),
+    ("102", "web2", "STOPPED", "", "true"),
+    ("103", "db", "RUNNING", "", "false"),
+]
+
+
+def test_parse_pools(config_dir):
+    assert parse_pools(str(config_dir / "user.cfg")) == {"103": "backend", "102": "backend"}
+
+
+def test_counts_update_incrementally(config_dir, mocker):
+    index = GroupIndex("tag", config_dir=str(config_dir), pool_config=str(config_dir / "user.cfg"))
+    group_of = mocker.spy(index, "group_of")
+    assert index.update(LXC_INFO) == 3
+    assert index.group_counts("prod") == {"RUNNING": 1}
+    assert index.group_counts("web") == {"STOPPED": 1}
+    assert index.group_counts("untagged") == {"RUNNING": 1}
+
+    changed = [LXC_INFO[0], ("102", "web2", "RUNNING", "", "true"), LXC_INFO[2]]
+    group_of.reset_mock()
+    assert index.update(changed) == 1
+    assert group_of.call_count == 1
+    assert index.group_counts("web") == {"RUNNING": 1}
+
+    assert index.update(changed[:1]) == 2
+    assert index.counts.keys() == {"prod"}
+
+
+def test_group_by_pool_and_privilege(config_dir):
+    index = GroupIndex("pool", config_dir=str(config_dir), pool_config=str(config_dir / "user.cfg"))
+    index.update(LXC_INFO)
+    assert index.group_counts("backend") == {"STOPPED": 1, "RUNNING": 1}
+    index.set_mode("privilege")
+    index.update(LXC_INFO)
+    assert index.group_counts("privileged") == {"RUNNING": 1}
+
+
+def test_view_rows_collapse_and_navigation(config_dir):
+    view = GroupView(GroupIndex("state"))
+    assert view.rows(LXC_INFO) == [
+        ("group", "RUNNING", [0, 2]),
+        ("container", 0),
+        ("container", 2),
+        ("group", "STOPPED", [1]),
+        ("container", 1),
+    ]
+    assert view.move(LXC_INFO, 0, 1) == 2
+    assert view.move(LXC_INFO, 2, 1) == 1
+
+    assert view.toggle(LXC_INFO, 2) == 0
+    assert view.rows(LXC_INFO)[:2] == [("group", "RUNNING", [0, 2]), ("group", "STOPPED", [1])]
+    assert view.move(LXC_INFO, 0, 1) == 1
+    assert view.header("RUNNING", [0, 2]) == "+ state: RUNNING (2 running, 0 stopped)"
+
+
+def test_edited_tags_and_pools_regroup_without_a_state_change(config_dir, mocker):
+    import os
+    from lxc_tui import clock
+
+    fake = clock.FakeClock(100.0)
+    mocker.patch.object(clock, "current", fake)
+    index = GroupIndex("tag", config_dir=str(config_dir), pool_config=str(config_dir / "user.cfg"))
+    index.update(LXC_INFO)
+    assert index.group_counts("untagged") == {"RUNNING": 1}
+
+    config = config_dir / "103.conf"
+    config.write_text("hostname: db\ntags: db\n")
+    os.utime(config, ns=(1, 1))
+    assert index.update(LXC_INFO) == 0
+    fake.advance(2.0)
+    assert index.update(LXC_INFO) == 1
+    assert index.group_counts("db") == {"RUNNING": 1}
+    assert index.group_counts("untagged") == {}
+
+    index.set_mode("pool")
+    index.update(LXC_INFO)
+    pools = config_dir / "user.cfg"
+    pools.write_text("pool:backend:Backend pool:102:\npool:data::103:\n")
+    os.utime(pools, ns=(1, 1))
+    fake.advance(2.0)
+    assert index.update(LXC_INFO) == 3
+    assert index.group_counts("data") == {"RUNNING": 1}
+    assert index.group_counts("backend") == {"STOPPED": 1}
+
+
+def test_tag_groups_are_labelled_as_primary_tags(config_dir):
+    view = GroupView(GroupIndex("tag", config_dir=str(config_dir), pool_config=str(config_dir / "user.cfg")))
+    view.rows(LXC_INFO)
+    assert view.header("prod", [0]) == "- primary tag: prod (1 running, 0 stopped)"
@@ -0,0 +1,154 @@
+import socket
+import threading
+import time
+from lxc_tui.health import (
+    HealthCheck,
+    HealthMonitor,
+    first_ip,
+    load_health_config,
+    run_check,
+    tcp_probe,
+    HEALTHY,
+    UNHEALTHY,
+    PENDING,
+    TIMED_OUT,
+)
+
+
+def wait_for(predicate, timeout=2):
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+def test_load_health_config_reads_id_tag_and_default_sections(tmp_path):
+    path = tmp_path / "health.ini"
+    path.write_text(
+        "[101]\ntcp = 22, 80\n\n"
+        "[tag:web]\ncommand = systemctl is-active nginx\ninterval = 10\ntimeout = 1\n\n"
+        "[*]\ntcp = 22\n\n"
+        "[broken]\ntcp = http\n"
+    )
+    checks = load_health_config(str(path))
+
+    assert checks["101"].ports == (22, 80)
+    assert checks["tag:web"].command == "systemctl is-active nginx"
+    assert checks["tag:web"].interval == 10.0
+    assert "*" in checks
+    assert "broken" not in checks
+
+
+def test_check_for_prefers_id_then_tag_then_default(tmp_path):
+    (tmp_path / "102.conf").write_text("tags: db;web\n")
+    checks = {"101": HealthCheck([22]), "tag:web": HealthCheck([80]), "*": HealthCheck([443])}
+    monitor = HealthMonitor(checks, config_dir=str(tmp_path))
+
+    assert monitor.check_for("101").ports == (22,)
+    assert monitor.check_for("102").ports == (80,)
+    assert monitor.check_for("103").ports == (443,)
+    monitor.shutdown()
+
+
+def test_tcp_probe_against_local_listener():
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen(1)
+    port = server.getsockname()[1]
+    try:
+        assert tcp_probe("127.0.0.1", port, 1)
+    finally:
+        server.close()
+    assert not tcp_probe("127.0.0.1", port, 1)
+
+
+def test_run_check_needs_an_ipv4_for_tcp():
+    container = ("101", "web", "RUNNING", "", "true")
+    assert run_check(container, HealthCheck([80]), tcp=lambda *args: True, lookup=lambda lxc_id: "") is None
+    assert run_check(
+        container,
+        HealthCheck([80]),
+        tcp=lambda host, port, timeout: host == "10.0.0.9",
+        lookup=lambda lxc_id: "10.0.0.9",
+    )
+    container = ("101", "web", "RUNNING", "10.0.0.5, fe80::1", "true")
+    assert run_check(
+        container,
+        HealthCheck([80], "true"),
+        tcp=lambda host, port, timeout: host == "10.0.0.5",
+        command=lambda lxc_id, command, timeout: True,
+    )
+
+
+def test_first_ip_skips_placeholders_and_ipv6():
+    assert first_ip("?") is None
+    assert first_ip("") is None
+    assert first_ip("fe80::1, 10.0.0.5") == "10.0.0.5"
+
+
+def test_get_does_not_resolve_checks_on_the_render_path(mocker):
+    monitor = HealthMonitor({"*": HealthCheck([22])}, probe=lambda container, check: True)
+    running = ("101", "web", "RUNNING", "10.0.0.1", "true")
+    monitor.listener([running], False)
+    check_for = mocker.patch.object(monitor, "check_for")
+    assert monitor.get(running) == PENDING
+    assert monitor.get(("102", "db", "RUNNING", "10.0.0.2", "true")) == ""
+    check_for.assert_not_called()
+    monitor.shutdown()
+
+
+def test_slow_probe_does_not_hold_up_other_containers():
+    release = threading.Event()
+
+    def probe(container, check):
+        if container[0] == "wedged":
+            release.wait(2)
+        return container[0] != "down"
+
+    checks = {"*": HealthCheck([22], timeout=0.05)}
+    monitor = HealthMonitor(checks, workers=3, probe=probe)
+    wedged = ("wedged", "a", "RUNNING", "10.0.0.1", "true")
+    up = ("up", "b", "RUNNING", "10.0.0.2", "true")
+    down = ("down", "c", "RUNNING", "10.0.0.3", "true")
+
+    monitor.listener([wedged, up, down], False)
+    assert [monitor.get(c) for c in (wedged, up, down)] == [PENDING] * 3
+    monitor.schedule()
+    assert wait_for(lambda: monitor.get(up) == HEALTHY and monitor.get(down) == UNHEALTHY)
+    assert wait_for(lambda: monitor.get(wedged) == TIMED_OUT)
+    assert monitor.get(("up", "b", "STOPPED", "", "true")) == ""
+    release.set()
+    monitor.shutdown()
+
+
+def test_scheduler_probes_rows_that_are_never_rendered():
+    probed = []
+
+    def probe(container, check):
+        probed.append(container[0])
+        return None if container[0] == "noip" else True
+
+    checks = {"*": HealthCheck([22], interval=30.0)}
+    monitor = HealthMonitor(checks, jitter=0, probe=probe, tick=0.01, retry=0.05)
+    offscreen = ("offscreen", "a", "RUNNING", "", "true")
+    noip = ("noip", "b", "RUNNING", "", "true")
+    monitor.listener([offscreen, noip, ("down", "c", "STOPPED", "", "true")], False)
+    monitor.start()
+    try:
+        assert wait_for(lambda: monitor.results.get("offscreen") == HEALTHY)
+        assert wait_for(lambda: probed.count("noip") >= 2)
+        assert monitor.get(noip) == PENDING
+        assert probed.count("offscreen") == 1
+        assert "down" not in probed
+    finally:
+        monitor.shutdown()
+
+
+def test_next_due_is_jittered_within_bounds():
+    monitor = HealthMonitor({}, jitter=0.2)
+    dues = {monitor.next_due(100.0, 10.0) for _ in range(50)}
+    assert all(108.0 <= due <= 112.0 for due in dues)
+    assert len(dues) > 1
+    monitor.shutdown()
@@ -0,0 +1,54 @@
+import pytest
+from lxc_tui.history import EventLog, diff_snapshots
+
+
+def test_diff_snapshots_records_state_and_ip_changes():
+    known = {"101": ("RUNNING", "10.0.0.1"), "102": ("RUNNING", "")}
+    lxc_info = [("101", "web", "RUNNING", "10.0.0.2", "true")]
+
+    events, new_known = diff_snapshots(known, lxc_info, False, 100.0)
+
+    assert [(e["id"], e["k"], e.get("n")) for e in events] == [
+        ("101", "ip", "10.0.0.2"),
+        ("102", "state", "STOPPED"),
+    ]
+    assert new_known["102"] == ("STOPPED", "")
+
+
+def test_diff_snapshots_reports_removed_when_showing_stopped():
+    events, new_known = diff_snapshots({"101": ("STOPPED", "")}, [], True, 1.0)
+    assert events == [{"t": 1.0, "id": "101", "k": "removed", "o": "STOPPED"}]
+    assert new_known == {}
+
+
+def test_event_log_query_window_and_restore(tmp_path):
+    path = str(tmp_path / "history.ndjson")
+    log = EventLog(path, checkpoint_interval=2)
+    log.observe([("101", "web", "RUNNING", "", "true")], True, timestamp=10.0)
+    log.observe([("101", "web", "STOPPED", "", "true")], True, timestamp=20.0)
+    log.observe([("101", "web", "RUNNING", "10.0.0.1", "true")], True, timestamp=30.0)
+    # Unchanged snapshots do not grow the log
+    assert log.observe([("101", "web", "RUNNING", "10.0.0.1", "true")], True, timestamp=40.0) == []
+
+    recent = log.query(25.0)
+    assert [(e["k"], e["n"]) for e in recent] == [("state", "RUNNING"), ("ip", "10.0.0.1")]
+    assert len(log.index) == 2
+
+    reopened = EventLog(path, checkpoint_interval=2)
+    assert reopened.known == {"101": ("RUNNING", "10.0.0.1")}
+    assert reopened.observe([("101", "web", "RUNNING", "10.0.0.1", "true")], True, timestamp=50.0) == []
+
+
+def test_diff_snapshots_ignores_ip_lookup_placeholders():
+    known = {"101": ("RUNNING", "10.0.0.1")}
+    lxc_info = [
+        ("101", "web", "RUNNING", "?", "true"),
+        ("102", "db", "RUNNING", "", "true"),
+    ]
+
+    events, new_known = diff_snapshots(known, lxc_info, False, 1.0)
+
+    assert [(e["id"], e["k"]) for e in events] == [("102", "added")]
+    assert new_known == {"101": ("RUNNING", "10.0.0.1"), "102": ("RUNNING", "")}
+    events, _ = diff_snapshots(new_known, [("101", "web", "RUNNING", "10.0.0.1", "true")], False, 2.0)
+    assert [(e["id"], e["k"], e.get("n")) for e in events] == [("102", "state", "STOPPED")]
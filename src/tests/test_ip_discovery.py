@@ -0,0 +1,69 @@
+import threading
+import pytest
+from lxc_tui import lxc_utils
+from lxc_tui.ip_discovery import IpResolver, TIMED_OUT
+
+
+def test_resolver_returns_immediately_and_fills_in(mocker):
+    release = threading.Event()
+
+    def lookup(lxc_id):
+        release.wait(1)
+        return f"10.0.0.{lxc_id[-1]}"
+
+    resolver = IpResolver(lookup, workers=2, timeout=5)
+    assert resolver.get("101") == ""
+    release.set()
+    assert resolver.wait(1)
+    assert resolver.get("101") == "10.0.0.1"
+    resolver.shutdown()
+
+
+def test_slow_lookup_does_not_block_others():
+    release = threading.Event()
+
+    def lookup(lxc_id):
+        if lxc_id == "wedged":
+            release.wait(2)
+        return "10.0.0.9"
+
+    resolver = IpResolver(lookup, workers=4, timeout=0.05)
+    resolver.get("wedged")
+    resolver.get("fast")
+    threading.Event().wait(0.1)
+    assert resolver.get("fast") == "10.0.0.9"
+    assert resolver.get("wedged") == TIMED_OUT
+    release.set()
+    resolver.shutdown()
+
+
+def test_cached_result_respects_ttl(mocker):
+    lookup = mocker.Mock(return_value="10.0.0.1")
+    resolver = IpResolver(lookup, ttl=60)
+    resolver.get("101")
+    resolver.wait(1)
+    resolver.get("101")
+    resolver.get("101")
+    assert lookup.call_count == 1
+    resolver.shutdown()
+
+
+def test_get_lxc_info_skips_ip_columns_with_resolver(mocker):
+    column = mocker.patch('lxc_tui.lxc_utils.get_lxc_column', side_effect=[
+        ["101", "102"], ["RUNNING", "STOPPED"], ["true", "false"]
+    ])
+    mocker.patch('lxc_tui.lxc_utils.read_hostname', return_value="host")
+    resolver = mocker.Mock()
+    resolver.get.return_value = "10.0.0.1"
+    lxc_utils.set_ip_resolver(resolver)
+    try:
+        result = lxc_utils.get_lxc_info(include_stopped=True)
+    finally:
+        lxc_utils.set_ip_resolver(None)
+
+    assert [call.args[0] for call in column.call_args_list] == ["NAME", "STATE", "UNPRIVILEGED"]
+    assert result == [
+        ("101", "host", "RUNNING", "10.0.0.1", "true"),
+        ("102", "host", "STOPPED", "", "false"),
+    ]
+    resolver.forget.assert_called_once_with("102")
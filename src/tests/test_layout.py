@@ -0,0 +1,52 @@
+import pytest
+from lxc_tui import layout
+from lxc_tui.layout import Column, compute_panes, get_column_layout
+
+
+@pytest.fixture(autouse=True)
+def reset_layout():
+    yield
+    layout.columns[:] = list(layout.BASE_COLUMNS)
+    layout._layout_cache.clear()
+    layout.set_split_mode("list")
+
+
+def test_column_layout_fits_width_and_aligns_header():
+    container = ("101", "web", "RUNNING", "10.0.0.1, fd00::1", "true")
+    for width in (60, 80, 140):
+        column_layout = get_column_layout(width)
+        assert len(column_layout.header) <= width
+        assert len(column_layout.format(container)) <= width
+        assert column_layout.header.index("STATE") == column_layout.format(container).index("RUNNING")
+
+
+def test_narrow_layout_drops_low_priority_columns():
+    keys = [column.key for column, _ in get_column_layout(50).placed]
+    assert "unprivileged" not in keys
+    assert keys[:3] == ["id", "hostname", "state"]
+
+
+def test_column_layout_is_cached_per_width(mocker):
+    compute = mocker.spy(layout, "compute_column_layout")
+    get_column_layout(120)
+    get_column_layout(120)
+    assert compute.call_count == 1
+    get_column_layout(100)
+    assert compute.call_count == 2
+
+
+def test_register_column_inserts_before_unprivileged():
+    layout.register_column(Column("health", "HEALTH", 8, value=lambda c: "ok"))
+    column_layout = get_column_layout(140)
+    keys = [column.key for column, _ in column_layout.placed]
+    assert keys[-2:] == ["health", "unprivileged"]
+    assert "ok" in column_layout.format(("101", "web", "RUNNING", "", "true"))
+
+
+def test_compute_panes_splits_list_and_side_pane():
+    assert list(compute_panes(30, 120, "list")) == ["list"]
+    panes = compute_panes(30, 120, "metrics")
+    assert panes["list"].width == 72
+    assert panes["metrics"].left == 73
+    assert panes["metrics"].width == 47
+    assert layout.cycle_split_mode() == "details"
@@ -0,0 +1,63 @@
+import time
+from lxc_tui.logsearch import (
+    LogSearch,
+    compile_query,
+    log_files,
+    previous_line_offset,
+    read_lines_at,
+    search_file,
+)
+
+
+def write_log(path, lines):
+    path.write_bytes("".join(line + "\n" for line in lines).encode())
+    return str(path)
+
+
+def test_search_file_reports_each_matching_line_with_its_offset(tmp_path):
+    path = write_log(tmp_path / "101.log", ["boot ok", "ERROR mount failed error", "fine", "error: no network"])
+    matches = search_file(path, compile_query("error"))
+    assert [m.text for m in matches] == ["ERROR mount failed error", "error: no network"]
+    assert matches[0].offset == len("boot ok\n")
+    assert read_lines_at(path, matches[1].offset, 1) == [(matches[1].offset, "error: no network")]
+    assert [m.text for m in search_file(path, compile_query("ERROR"))] == ["ERROR mount failed error"]
+    assert search_file(write_log(tmp_path / "empty.log", []), compile_query("x")) == []
+
+
+def test_search_streams_results_from_a_thread_pool(tmp_path):
+    paths = [
+        write_log(tmp_path / f"{lxc_id}.log", [f"{lxc_id} start", f"{lxc_id} failed to mount"])
+        for lxc_id in range(100, 120)
+    ]
+    search = LogSearch(compile_query(r"fail\w+"), paths, workers=4)
+    matches = []
+    deadline = time.time() + 10
+    while not search.done and time.time() < deadline:
+        matches += search.drain()
+        time.sleep(0.01)
+    matches += search.drain()
+    assert len(matches) == 20
+    assert {m.path for m in matches} == set(paths)
+
+
+def test_log_files_include_console_logs(tmp_path):
+    log_dir = tmp_path / "log"
+    log_dir.mkdir()
+    write_log(log_dir / "101.log", ["x"])
+    console = write_log(tmp_path / "console-101", ["login:"])
+    (tmp_path / "101.conf").write_text(f"hostname: web\nlxc.console.logfile = {console}\n")
+    assert log_files(str(log_dir), str(tmp_path)) == [str(log_dir / "101.log"), console]
+
+    # Proxmox writes raw keys with a colon
+    other = write_log(tmp_path / "console-102", ["login:"])
+    (tmp_path / "102.conf").write_text(f"hostname: db\nlxc.console.logfile: {other}\n")
+    assert set(log_files(str(log_dir), str(tmp_path))) == {str(log_dir / "101.log"), console, other}
+
+
+def test_paging_backwards_by_lines(tmp_path):
+    path = write_log(tmp_path / "big.log", [f"line {n}" for n in range(5000)])
+    offsets = [offset for offset, _ in read_lines_at(path, 0, 5000)]
+    assert previous_line_offset(path, offsets[4000]) == offsets[3999]
+    assert previous_line_offset(path, offsets[4000], 1000) == offsets[3000]
+    assert previous_line_offset(path, offsets[3], 10) == 0
+    assert previous_line_offset(path, 0) == 0
@@ -0,0 +1,65 @@
+import time
+from lxc_tui.logtail import MultiTail, RateLimiter, TailSource, parse_timestamp
+
+
+def wait_for(predicate, limit=5.0):
+    deadline = time.time() + limit
+    while not predicate() and time.time() < deadline:
+        time.sleep(0.01)
+    return predicate()
+
+
+def test_timestamps_of_lxc_and_iso_lines():
+    lxc = parse_timestamp(b"lxc-start 101 20241019061526.354 INFO     confile - parsed")
+    iso = parse_timestamp(b"2024-10-19 06:15:26.354 something")
+    assert lxc == iso
+    assert parse_timestamp(b"no timestamp here") is None
+
+
+def test_rate_limiter_refills_over_time():
+    limiter = RateLimiter(rate=10, burst=5)
+    assert [limiter.allow(0.0) for _ in range(6)] == [True] * 5 + [False]
+    assert limiter.allow(0.1) and not limiter.allow(0.1)
+
+
+def test_source_follows_truncation_and_rotation(tmp_path):
+    path = tmp_path / "101.log"
+    path.write_bytes(b"old\n")
+    source = TailSource("101", str(path), RateLimiter(100, 100))
+    source.open(at_end=True)
+    with open(path, "ab") as f:
+        f.write(b"one\ntw")
+    assert source.read_lines() == [b"one"]
+    with open(path, "ab") as f:
+        f.write(b"o\n")
+    assert source.read_lines() == [b"two"]
+    path.write_bytes(b"x\n")
+    assert source.read_lines() == [b"x"]
+    path.rename(tmp_path / "101.log.1")
+    path.write_bytes(b"fresh\n")
+    assert source.read_lines() == [b"fresh"]
+    source.close()
+
+
+def test_merged_tail_interleaves_by_timestamp_and_limits_floods(tmp_path):
+    quiet, noisy = tmp_path / "101.log", tmp_path / "102.log"
+    quiet.write_bytes(b"")
+    noisy.write_bytes(b"")
+    tail = MultiTail([("101", str(quiet)), ("102", str(noisy))], capacity=50, rate=1.0, burst=20, poll_interval=0.05)
+    tail.start()
+    try:
+        with open(noisy, "ab") as f:
+            f.write(b"".join(b"lxc 20241019061530.%03d flood %d\n" % (n, n) for n in range(500)))
+        with open(quiet, "ab") as f:
+            f.write(b"lxc 20241019061529.000 early\nlxc 20241019061531.000 late\n")
+        assert wait_for(lambda: "101" in {e[2] for e in tail.snapshot(50)} and tail.dropped())
+        assert wait_for(lambda: len([e for e in tail.snapshot(50) if e[2] == "101"]) == 2)
+    finally:
+        tail.stop()
+
+    entries = tail.snapshot(50)
+    stamps = [entry[0] for entry in entries]
+    assert stamps == sorted(stamps)
+    assert entries[0][3].endswith("early") and entries[-1][3].endswith("late")
+    assert len([e for e in entries if e[2] == "102"]) == 20
+    assert tail.dropped() == {"102": 480}
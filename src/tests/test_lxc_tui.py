@@ -13,7 +13,12 @@ def test_load_plugins(mocker):
     plugins = load_plugins()
     assert plugins == []
 
-def test_main_initialization(mocker):
+def test_main_initialization(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CONFIG_HOME", str(tmp_path))
+    monkeypatch.delenv("TMUX", raising=False)
+    monkeypatch.delenv("STY", raising=False)
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
     stdscr = mocker.Mock()
     stdscr.getmaxyx.return_value = (20, 80)
     stdscr.getch.return_value = -1
@@ -33,15 +38,10 @@ def test_main_initialization(mocker):
     mocker.patch('lxc_tui.lxc_tui.curses', curses_mock)
     mocker.patch('lxc_tui.core.curses', curses_mock)
     mocker.patch('lxc_tui.ui_components.curses', curses_mock)
-    mocker.patch('lxc_tui.lxc_utils.curses', curses_mock)
     mocker.patch('lxc_tui.event_handler.curses', curses_mock)
+    mocker.patch('lxc_tui.panes.curses', curses_mock)
 
-    # Mock threading.Thread with explicit behavior
-    thread_mock = mocker.Mock()
-    thread_mock.start = mocker.Mock(return_value=None)
-    thread_mock.join = mocker.Mock(return_value=None)
-    thread_mock.daemon = True
-    mocker.patch('threading.Thread', return_value=thread_mock)
+    mocker.patch('lxc_tui.lxc_tui.DiskScanner')
 
     # Mock dependencies
     mocker.patch('lxc_tui.lxc_utils.get_lxc_info', return_value=[])
@@ -50,13 +50,17 @@ def test_main_initialization(mocker):
     
     # Mock handle_events in the lxc_tui.lxc_tui namespace
     handle_events_mock = mocker.patch('lxc_tui.lxc_tui.handle_events')
-    handle_events_mock.return_value = (0, False, True, None)
+    handle_events_mock.return_value = (0, False, True)
     handle_events_mock.side_effect = lambda *args, **kwargs: (
         logger.debug("Mocked handle_events called"),
-        (0, False, True, None)
+        (0, False, True)
     )[1]
 
-    mocker.patch('time.time', return_value=0)
+    import threading
+    from lxc_tui.clock import FakeClock, SystemClock, set_clock
+    set_clock(FakeClock())
+    # The refresh thread really runs, on the fake clock driven by main()
+    started = mocker.spy(threading.Thread, "start")
 
     logger.debug("Starting main")
     try:
@@ -65,9 +69,40 @@ def test_main_initialization(mocker):
     except Exception as e:
         logger.debug(f"Main raised exception: {e}", exc_info=True)
         pytest.fail(f"Main failed with exception: {e}")
+    finally:
+        set_clock(SystemClock())
 
     logger.debug("Test assertions starting")
     stdscr.nodelay.assert_called_with(True)
-    thread_mock.start.assert_called_once()
-    thread_mock.join.assert_called_once()
-    handle_events_mock.assert_called()  # Ensure mock was called
\ No newline at end of file
+    refresh_threads = [call.args[0] for call in started.call_args_list if call.args[0].name != "audit-writer"]
+    assert refresh_threads and not any(thread.is_alive() for thread in refresh_threads)
+    handle_events_mock.assert_called()  # Ensure mock was called
+
+def test_main_draws_cached_inventory_before_live_refresh(mocker, monkeypatch, tmp_path):
+    monkeypatch.setenv("XDG_STATE_HOME", str(tmp_path))
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    from lxc_tui.cache import default_cache_path, save_snapshot
+
+    cached = [("101", "web", "RUNNING", "10.0.0.1", "true")]
+    save_snapshot(default_cache_path(), cached, False, saved_at=5.0)
+
+    stdscr = mocker.Mock()
+    curses_mock = mocker.MagicMock()
+    curses_mock.LINES = 20
+    curses_mock.COLS = 80
+    mocker.patch('lxc_tui.lxc_tui.curses', curses_mock)
+    mocker.patch('lxc_tui.core.curses', curses_mock)
+    mocker.patch('lxc_tui.panes.curses', curses_mock)
+    mocker.patch('threading.Thread', return_value=mocker.Mock())
+    get_info_mock = mocker.patch('lxc_tui.lxc_tui.get_lxc_info')
+    display_mock = mocker.patch('lxc_tui.lxc_tui.display_container_list')
+    mocker.patch('lxc_tui.lxc_tui.update_navigation_bar')
+    mocker.patch('lxc_tui.lxc_tui.handle_events', return_value=(0, False, True))
+
+    main(stdscr)
+
+    get_info_mock.assert_not_called()
+    display_mock.assert_any_call(stdscr, cached, 0)
+    from lxc_tui.notifications import queue
+    assert any(n.key == "stale" for n in queue.pending)
+    queue.dismiss("stale")
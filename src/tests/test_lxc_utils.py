@@ -18,4 +18,20 @@ def test_get_lxc_info(mocker):
     mocker.patch('builtins.open', mocker.mock_open(read_data="hostname: test-host\n"))
 
     result = get_lxc_info(include_stopped=True)
-    assert result == [("container1", "test-host", "RUNNING", "192.168.1.1", "true")]
\ No newline at end of file
+    assert result == [("container1", "test-host", "RUNNING", "192.168.1.1", "true")]
+
+def test_on_demand_mode_only_resolves_requested_containers(mocker):
+    from lxc_tui import lxc_utils
+
+    resolver = mocker.Mock()
+    resolver.get.return_value = "10.0.0.1"
+    resolver.peek.return_value = "10.0.0.2"
+    mocker.patch.object(lxc_utils, "ip_resolver", resolver)
+    mocker.patch.object(lxc_utils, "ips_on_demand", True)
+    lxc_utils.request_ips("101")
+    try:
+        assert lxc_utils.resolve_ips("101", "RUNNING") == "10.0.0.1"
+        assert lxc_utils.resolve_ips("102", "RUNNING") == "10.0.0.2"
+        resolver.get.assert_called_once_with("101")
+    finally:
+        lxc_utils.request_ips()
@@ -0,0 +1,85 @@
+from lxc_tui.netstats import CounterRing, NetStats, parse_veth_names
+
+
+def write_counters(root, veth, rx, tx):
+    statistics = root / veth / "statistics"
+    statistics.mkdir(parents=True, exist_ok=True)
+    (statistics / "rx_bytes").write_text(f"{rx}\n")
+    (statistics / "tx_bytes").write_text(f"{tx}\n")
+
+
+def test_parse_veth_names_uses_proxmox_naming_and_explicit_pairs(tmp_path):
+    config = tmp_path / "101.conf"
+    config.write_text(
+        "hostname: web\n"
+        "net1: name=eth1,bridge=vmbr1\n"
+        "net0: name=eth0,bridge=vmbr0,hwaddr=AA:BB\n"
+        "lxc.net.1.veth.pair = web-eth1\n"
+        "[snap1]\n"
+        "net2: name=eth2,bridge=vmbr2\n"
+    )
+    assert parse_veth_names(str(config), "101") == ["veth101i0", "web-eth1"]
+
+    # The form Proxmox itself writes raw keys in
+    config.write_text("net0: name=eth0\nnet1: name=eth1\nlxc.net.0.veth.pair: web-eth0\n")
+    assert parse_veth_names(str(config), "101") == ["web-eth0", "veth101i1"]
+
+
+def test_counter_ring_wraps_and_reports_rates():
+    ring = CounterRing(capacity=3)
+    assert ring.rate() is None
+    for second in range(5):
+        ring.append(float(second), second * 1000, second * 10)
+    assert ring.count == 3
+    assert ring.rate() == (1000.0, 10.0)
+    ring.append(5.0, 0, 0)  # counter reset
+    assert ring.rate() is None
+
+
+def test_sweep_sums_interfaces_from_the_container_point_of_view(tmp_path):
+    sysfs = tmp_path / "net"
+    config_dir = tmp_path / "lxc"
+    config_dir.mkdir()
+    (config_dir / "101.conf").write_text("net0: name=eth0\nnet1: name=eth1\n")
+    (config_dir / "102.conf").write_text("hostname: nonet\n")
+    lxc_info = [
+        ("101", "web", "RUNNING", "", "true"),
+        ("102", "nonet", "RUNNING", "", "true"),
+        ("103", "off", "STOPPED", "", "true"),
+    ]
+    stats = NetStats(str(sysfs), str(config_dir), interval=1.0)
+
+    write_counters(sysfs, "veth101i0", rx=100, tx=1000)
+    write_counters(sysfs, "veth101i1", rx=0, tx=0)
+    assert stats.tick(lxc_info, now=0.0)
+    assert not stats.tick(lxc_info, now=0.5)
+    write_counters(sysfs, "veth101i0", rx=300, tx=5000)
+    write_counters(sysfs, "veth101i1", rx=200, tx=0)
+    assert stats.tick(lxc_info, now=2.0)
+
+    assert stats.rate("101") == (2000.0, 200.0)
+    assert stats.rate_text("101", "tx") == "200B/s"
+    assert stats.rate("102") is None
+    assert stats.rate_text("103", "rx") == ""
+
+
+def test_version_only_changes_when_a_shown_rate_changes(tmp_path):
+    sysfs = tmp_path / "net"
+    config_dir = tmp_path / "lxc"
+    config_dir.mkdir()
+    (config_dir / "101.conf").write_text("net0: name=eth0\n")
+    lxc_info = [("101", "web", "RUNNING", "", "true")]
+    stats = NetStats(str(sysfs), str(config_dir), interval=1.0)
+
+    write_counters(sysfs, "veth101i0", rx=0, tx=0)
+    stats.sweep(lxc_info, now=0.0)
+    write_counters(sysfs, "veth101i0", rx=0, tx=1000)
+    stats.sweep(lxc_info, now=1.0)
+    version = stats.version
+    write_counters(sysfs, "veth101i0", rx=0, tx=2000)
+    stats.sweep(lxc_info, now=2.0)
+    assert stats.version == version
+    write_counters(sysfs, "veth101i0", rx=0, tx=10000)
+    stats.sweep(lxc_info, now=3.0)
+    assert stats.version == version + 1
+    assert stats.rate_text("101", "rx") == "7.8K/s"
@@ -0,0 +1,44 @@
+from lxc_tui.notifications import NotificationQueue, INFO, SUCCESS, ERROR
+
+
+def test_repeated_messages_collapse_into_a_counter():
+    queue = NotificationQueue()
+    for _ in range(3):
+        queue.post("Invalid Key", now=0)
+
+    shown = queue.select(now=0)
+    assert shown.label() == "Invalid Key (x3)"
+    assert len(queue.recent()) == 1
+
+
+def test_messages_expire_against_the_supplied_clock():
+    queue = NotificationQueue()
+    queue.post("Started 101", SUCCESS, ttl=2, now=0)
+
+    assert queue.select(now=1.9).text == "Started 101"
+    assert queue.select(now=2.0) is None
+
+
+def test_higher_priority_preempts_and_min_display_holds_equal_priority():
+    queue = NotificationQueue(min_display=1.0)
+    queue.post("first", now=0)
+    assert queue.select(now=0).text == "first"
+
+    queue.post("second", now=0.5)
+    assert queue.select(now=0.5).text == "first"
+    assert queue.select(now=1.0).text == "second"
+
+    queue.post("broken", ERROR, now=1.1)
+    assert queue.select(now=1.1).text == "broken"
+
+
+def test_keyed_messages_update_in_place_and_queue_stays_bounded():
+    queue = NotificationQueue(maxlen=3)
+    queue.post("Starting 101...", key="action 101", now=0)
+    queue.post("Started 101", SUCCESS, key="action 101", now=1)
+    assert [n.text for n in queue.pending] == ["Started 101"]
+
+    for i in range(5):
+        queue.post(f"note {i}", INFO, now=2 + i)
+    assert len(queue.pending) == 3
+    assert "Started 101" in [n.text for n in queue.pending]
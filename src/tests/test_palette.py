@@ -0,0 +1,119 @@
+import threading
+import pytest
+from lxc_tui.groups import GroupIndex
+from lxc_tui.palette import build_plan, describe_plan, execute_plan, parse_command
+
+LXC_INFO = [
+    ("101", "web-1", "RUNNING", "10.0.0.1", "true"),
+    ("102", "web-2", "RUNNING", "10.0.0.2", "true"),
+    ("103", "db", "STOPPED", "", "false"),
+    ("120", "cache", "RUNNING", "10.0.0.20", "true"),
+]
+
+
+@pytest.fixture
+def index(tmp_path):
+    (tmp_path / "101.conf").write_text("tags: web\n")
+    (tmp_path / "102.conf").write_text("tags: web;blue\n")
+    return GroupIndex(config_dir=str(tmp_path), pool_config=str(tmp_path / "user.cfg"))
+
+
+def test_parse_command_rejects_unknown_actions_and_missing_targets():
+    assert parse_command("stop 101; start 101") == [("stop", ["101"]), ("start", ["101"])]
+    with pytest.raises(ValueError):
+        parse_command("destroy 101")
+    with pytest.raises(ValueError):
+        parse_command("stop")
+
+
+def test_targets_resolve_ranges_tags_states_and_names(index):
+    plan = build_plan("stop 101-110", LXC_INFO, index)
+    assert [(s.action, s.lxc_ids, s.skipped) for s in plan] == [("stop", ["101", "102"], ["103"])]
+
+    plan = build_plan("start state:stopped", LXC_INFO, index)
+    assert plan[0].lxc_ids == ["103"]
+
+    plan = build_plan("snapshot tag:web name:cache", LXC_INFO, index)
+    assert plan[0].lxc_ids == ["101", "102", "120"]
+
+    plan = build_plan("stop all", LXC_INFO, index)
+    assert plan[0].skipped == ["103"]
+    with pytest.raises(ValueError):
+        build_plan("stop owner:bob", LXC_INFO, index)
+
+
+def test_restart_stops_everything_before_starting(index):
+    plan = build_plan("restart tag:web", LXC_INFO, index)
+    assert [(s.action, s.lxc_ids) for s in plan] == [
+        ("stop", ["101", "102"]),
+        ("start", ["101", "102"]),
+    ]
+    assert describe_plan(plan)[0] == "1. stop 101, 102"
+
+
+def test_later_steps_see_the_state_earlier_steps_leave_behind(index):
+    plan = build_plan("stop 101-103; snapshot 101-103; start 101-103", LXC_INFO, index)
+    assert [(s.action, s.lxc_ids, s.skipped) for s in plan] == [
+        ("stop", ["101", "102"], ["103"]),
+        ("snapshot", ["101", "102", "103"], []),
+        ("start", ["101", "102", "103"], []),
+    ]
+
+    plan = build_plan("start 103; stop 103", LXC_INFO, index)
+    assert [s.lxc_ids for s in plan] == [["103"], ["103"]]
+
+
+def test_execute_plan_runs_steps_in_order_and_each_step_in_parallel(index, mocker):
+    from concurrent.futures import ThreadPoolExecutor
+    from lxc_tui.commands import CommandResult
+
+    events = []
+    lock = threading.Lock()
+    both_stopping = threading.Barrier(2, timeout=2)
+
+    def run(lxc_id, commands, label):
+        with lock:
+            events.append((label, lxc_id))
+        if label == "stop":
+            both_stopping.wait()
+        return CommandResult(lxc_id, label, True, None, 0)
+
+    pool = ThreadPoolExecutor(max_workers=4)
+    service = mocker.Mock()
+    service.submit.side_effect = lambda lxc_id, commands, label: pool.submit(run, lxc_id, commands, label)
+    mocker.patch("lxc_tui.palette.notify")
+
+    failed = execute_plan(build_plan("restart 101 102", LXC_INFO, index), service)
+
+    assert failed == 0
+    assert {label for label, _ in events[:2]} == {"stop"}
+    assert {label for label, _ in events[2:]} == {"start"}
+    pool.shutdown()
+
+
+def test_snapshot_steps_run_as_snapshot_jobs_without_a_command_timeout(index, mocker):
+    from lxc_tui.jobs import JobManager
+    from lxc_tui.snapshots import SnapshotStore
+
+    spawned = []
+
+    def spawn(command, output=False):
+        spawned.append(command)
+        proc = mocker.Mock(stdout=[])
+        proc.wait.return_value = 0
+        return proc
+
+    mocker.patch("lxc_tui.jobs.lxc_utils.spawn_command", side_effect=spawn)
+    mocker.patch("lxc_tui.palette.notify")
+    store = SnapshotStore(JobManager(), tool="pct")
+    store.cache["101"] = ([], 0.0)
+    service = mocker.Mock()
+
+    failed = execute_plan(build_plan("snapshot 101 102", LXC_INFO, index), service, store)
+
+    assert failed == 0
+    service.submit.assert_not_called()
+    assert sorted(command[2] for command in spawned) == ["101", "102"]
+    assert all(command[:2] == ["pct", "snapshot"] for command in spawned)
+    assert [job.state for job in store.jobs.recent()] == ["done", "done"]
+    assert "101" not in store.cache
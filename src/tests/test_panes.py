@@ -0,0 +1,63 @@
+import pytest
+from lxc_tui import layout
+from lxc_tui.panes import Pane, PaneManager, tail_file
+
+
+class CountingPane(Pane):
+    title = "Test"
+    interval = 1.0
+
+    def __init__(self):
+        self.content = ["a"]
+        self.calls = 0
+
+    def lines(self, lxc_id, height):
+        self.calls += 1
+        return list(self.content)
+
+
+@pytest.fixture
+def curses_mock(mocker):
+    curses_mock = mocker.MagicMock()
+    curses_mock.LINES = 20
+    curses_mock.COLS = 120
+    mocker.patch('lxc_tui.panes.curses', curses_mock)
+    mocker.patch('lxc_tui.core.curses', curses_mock)
+    layout.set_split_mode("metrics")
+    yield curses_mock
+    layout.set_split_mode("list")
+
+
+def test_pane_redraws_only_when_content_changes(mocker, curses_mock):
+    stdscr = mocker.Mock()
+    pane = CountingPane()
+    manager = PaneManager({"metrics": pane})
+
+    assert manager.tick(stdscr, "101", now=0.0)
+    # Within the pane interval nothing is polled or drawn
+    assert not manager.tick(stdscr, "101", now=0.5)
+    assert pane.calls == 1
+    # Polled again but unchanged: no redraw
+    assert not manager.tick(stdscr, "101", now=1.5)
+    assert stdscr.refresh.call_count == 1
+
+    pane.content = ["b"]
+    assert manager.tick(stdscr, "101", now=3.0)
+    # Changing the selection polls immediately
+    assert manager.tick(stdscr, "102", now=3.1)
+    assert pane.calls == 4
+
+
+def test_list_only_mode_draws_no_panes(mocker, curses_mock):
+    layout.set_split_mode("list")
+    stdscr = mocker.Mock()
+    pane = CountingPane()
+    assert not PaneManager({"metrics": pane}).tick(stdscr, "101")
+    assert pane.calls == 0
+
+
+def test_tail_file_reads_last_lines(tmp_path):
+    path = tmp_path / "101.log"
+    path.write_text("".join(f"line {i}\n" for i in range(1000)))
+    assert tail_file(str(path), 3, block_size=16) == ["line 997", "line 998", "line 999"]
+    assert tail_file(str(tmp_path / "missing.log"), 3) == []
@@ -0,0 +1,107 @@
+import time
+import pytest
+from lxc_tui.core import IsolatedPlugin
+from lxc_tui.plugin_host import PluginHost, make_snapshot, validate_command
+
+LXC_INFO = [
+    ["101", "web", "RUNNING", "10.0.0.1", "true"],
+    ["102", "db", "STOPPED", "", "true"],
+]
+
+
+class StopStopped(IsolatedPlugin):
+    description = "Tidy"
+
+    def run(self, snapshot):
+        yield ("notify", f"{len(snapshot.containers)} containers")
+        for lxc_id, hostname, status, ip_addresses, unprivileged in snapshot.containers:
+            if status == "RUNNING":
+                yield ("action", "stop", lxc_id)
+        yield ("select", "102")
+
+
+class Sleeper(IsolatedPlugin):
+    description = "Sleeper"
+    budget = 0.5
+
+    def run(self, snapshot):
+        time.sleep(60)
+        return []
+
+
+class Meddler(IsolatedPlugin):
+    description = "Meddler"
+
+    def run(self, snapshot):
+        snapshot.containers[0][2] = "STOPPED"
+        return [("action", "destroy", "101")]
+
+
+def collect_until(host, count, limit=20.0):
+    collected = []
+    deadline = time.time() + limit
+    while len(collected) < count and time.time() < deadline:
+        collected += host.collect()
+        time.sleep(0.02)
+    return collected
+
+
+def test_worker_process_streams_back_commands():
+    host = PluginHost()
+    plugin = StopStopped()
+    host.submit(plugin, make_snapshot(LXC_INFO, 0, True))
+    with pytest.raises(RuntimeError):
+        host.submit(plugin, make_snapshot(LXC_INFO, 0, True))
+
+    commands = [command for _, command in collect_until(host, 3)]
+
+    assert commands == [("notify", "2 containers"), ("action", "stop", "101"), ("select", "102")]
+    assert host.running() == []
+
+
+def test_worker_over_budget_is_killed():
+    host = PluginHost()
+    host.submit(Sleeper(), make_snapshot(LXC_INFO, 0, True))
+    process = host.runs[0].process
+
+    (plugin, command), = collect_until(host, 1)
+
+    assert command[0] == "error" and "budget" in command[1]
+    process.join(2)
+    assert not process.is_alive()
+    host.collect()
+    assert host.exiting == []
+
+
+def test_finished_workers_are_reaped_without_blocking(mocker):
+    host = PluginHost()
+    process = mocker.Mock()
+    process.is_alive.side_effect = [True, False]
+    run = mocker.Mock(process=process)
+    host.runs.append(run)
+
+    host._finish(run)
+    assert host.exiting == [process]
+    host.collect()
+    assert host.exiting == []
+    process.join.assert_not_called()
+
+
+def test_in_process_mode_cannot_touch_live_state():
+    host = PluginHost(in_process=True)
+    host.submit(Meddler(), make_snapshot(LXC_INFO, 0, True))
+
+    (plugin, command), = host.collect()
+
+    assert command[0] == "error" and "TypeError" in command[1]
+    assert LXC_INFO[0][2] == "RUNNING"
+
+
+def test_commands_are_validated_against_the_snapshot():
+    snapshot = make_snapshot(LXC_INFO, 0, True)
+    assert validate_command(("action", "start", "102"), snapshot) is None
+    assert "unknown container" in validate_command(("action", "start", "999"), snapshot)
+    assert "bad action" in validate_command(("action", "destroy", "101"), snapshot)
+    assert validate_command(("panel", "Report", ["a", "b"]), snapshot) is None
+    assert "strings" in validate_command(("panel", "Report", [1]), snapshot)
+    assert "unknown command" in validate_command(("exec", "rm -rf /"), snapshot)
@@ -0,0 +1,133 @@
+import subprocess
+import sys
+import threading
+import pytest
+from lxc_tui.jobs import CANCELLED, DONE, FAILED, JobManager
+from lxc_tui.snapshots import (
+    SnapshotStore,
+    parse_lxc_snapshots,
+    parse_pct_snapshots,
+    snapshot_command,
+)
+
+PCT_OUTPUT = """\
+`-> before-upgrade              2024-05-01 10:00:00     pre apt upgrade
+  `-> nightly                   2024-05-02 02:00:00     no-description
+    `-> current                                         You are here!
+"""
+
+
+def test_parse_snapshot_listings():
+    assert [s["name"] for s in parse_pct_snapshots(PCT_OUTPUT)] == ["before-upgrade", "nightly"]
+    assert parse_pct_snapshots(PCT_OUTPUT)[0]["description"] == "pre apt upgrade"
+    lxc = parse_lxc_snapshots("snap0 (/var/lib/lxc/101/snaps) 2024:05:01 10:00:00\n")
+    assert lxc == [{"name": "snap0", "created": "2024:05:01 10:00:00", "description": ""}]
+    assert parse_lxc_snapshots("No snapshots\n") == []
+
+
+def test_snapshot_commands():
+    assert snapshot_command("pct", "rollback", "101", "s1") == ["pct", "rollback", "101", "s1"]
+    assert snapshot_command("lxc-snapshot", "delete", "101", "s1") == [
+        "lxc-snapshot", "-n", "101", "-d", "s1"
+    ]
+
+
+def test_store_lists_lazily_and_caches(mocker):
+    release = threading.Event()
+
+    def run(command, **kwargs):
+        release.wait(1)
+        return subprocess.CompletedProcess(command, 0, stdout=PCT_OUTPUT)
+
+    run_mock = mocker.Mock(side_effect=run)
+    store = SnapshotStore(JobManager(), tool="pct", run=run_mock)
+    assert store.get("101") is None
+    release.set()
+    for _ in range(100):
+        if store.get("101") is not None:
+            break
+        threading.Event().wait(0.01)
+    assert [s["name"] for s in store.get("101")] == ["before-upgrade", "nightly"]
+    assert run_mock.call_count == 1
+
+
+def test_store_rejects_bad_names():
+    store = SnapshotStore(JobManager(), tool="pct")
+    with pytest.raises(ValueError):
+        store.create("101", "bad name; rm -rf /")
+
+
+def wait_for(job):
+    for _ in range(500):
+        if job.finished is not None:
+            return job
+        threading.Event().wait(0.01)
+    raise AssertionError("job did not finish")
+
+
+def test_jobs_track_progress_and_status():
+    manager = JobManager()
+    ok = manager.submit("ok", [sys.executable, "-c", "print('50%'); print('100%')"])
+    bad = manager.submit("bad", [sys.executable, "-c", "raise SystemExit(3)"])
+    assert wait_for(ok).state == DONE
+    assert ok.progress == "100%"
+    assert wait_for(bad).state == FAILED
+
+
+def test_jobs_can_be_cancelled():
+    manager = JobManager()
+    job = manager.submit("slow", [sys.executable, "-c", "import time; time.sleep(30)"])
+    assert manager.active() == [job]
+    assert manager.cancel(job.id)
+    assert wait_for(job).state == CANCELLED
+    assert manager.active() == []
+
+
+def test_jobs_run_through_the_backend(mocker, tmp_path):
+    from lxc_tui import lxc_utils
+    from lxc_tui.tracing import ReplayBackend
+
+    trace = tmp_path / "trace.ndjson"
+    trace.write_text('{"t":0,"op":"spawn","args":[["pct","rollback","101","snap1"]],"dur":0,"rc":5}\n')
+    mocker.patch.object(lxc_utils, "backend", ReplayBackend(str(trace), speed=0))
+    job = JobManager().submit("rollback 101", ["pct", "rollback", "101", "snap1"])
+    assert wait_for(job).state == FAILED
+
+
+def test_snapshot_plugin_reports_jobs_that_fail_to_start(mocker):
+    from lxc_tui.plugins.snapshots import SnapshotPlugin
+
+    notify = mocker.patch("lxc_tui.plugins.snapshots.notify")
+    plugin = SnapshotPlugin()
+    plugin.store = mocker.Mock()
+    plugin.store.create.side_effect = RuntimeError("no snapshot tool found")
+    plugin.start("create", "101", "snap1")
+    assert "no snapshot tool found" in notify.call_args[0][0]
+
+
+def test_snapshot_plugin_cancels_only_the_selected_job(mocker):
+    from lxc_tui.plugins.snapshots import SnapshotPlugin
+
+    mocker.patch("lxc_tui.plugins.snapshots.draw_panel")
+    mocker.patch("lxc_tui.plugins.snapshots.clear_screen")
+    mocker.patch("lxc_tui.plugins.snapshots.display_container_list")
+    mocker.patch("lxc_tui.plugins.snapshots.curses.color_pair", return_value=0)
+    plugin = SnapshotPlugin()
+    plugin.store = mocker.Mock()
+    plugin.store.get.return_value = []
+    plugin.jobs = JobManager()
+    first = plugin.jobs.submit("create 101", [sys.executable, "-c", "import time; time.sleep(30)"])
+    second = plugin.jobs.submit("create 102", [sys.executable, "-c", "import time; time.sleep(30)"])
+    try:
+        assert plugin.selected_job() is second
+        assert any(line.startswith("* ") and "create 102" in line for line in plugin.panel_lines("101", 0))
+        stdscr = mocker.Mock()
+        stdscr.getch.side_effect = [ord("j"), ord("k"), ord("q")]
+        container = ("101", "web", "RUNNING", "10.0.0.1", "true")
+        plugin.execute(stdscr, [container], 0, False, threading.Event(), threading.Event())
+        assert wait_for(first).state == CANCELLED
+        assert second.finished is None
+        assert plugin.selected_job() is second
+    finally:
+        plugin.jobs.cancel(second.id)
+        wait_for(second)
@@ -0,0 +1,100 @@
+import subprocess
+import sys
+import pytest
+from lxc_tui import lxc_utils, tracing
+from lxc_tui.backends import SubprocessBackend
+from lxc_tui.tracing import RecordingBackend, ReplayBackend, ReplayHandle, load_trace
+
+
+class SlowBackend(SubprocessBackend):
+    name = "slow"
+
+    def get_lxc_info(self, include_stopped=False):
+        return [("101", "web", "RUNNING", "10.0.0.1", "true")]
+
+    def read_config(self, lxc_id):
+        return "hostname: web\nmemory: 512\n"
+
+
+def test_recording_then_replay_reproduces_answers_and_timings(tmp_path, mocker):
+    trace = tmp_path / "trace.ndjson"
+    recorder = RecordingBackend(SlowBackend(), str(trace))
+    assert recorder.get_lxc_info(False) == [("101", "web", "RUNNING", "10.0.0.1", "true")]
+    assert recorder.read_config("101").startswith("hostname")
+    proc = recorder.spawn([sys.executable, "-c", "raise SystemExit(3)"])
+    assert proc.wait(timeout=10) == 3
+    recorder.close()
+
+    events = load_trace(str(trace))
+    assert [e["op"] for e in events] == ["get_lxc_info", "read_config", "spawn"]
+    assert events[2]["rc"] == 3
+
+    delays = []
+    replay = ReplayBackend(str(trace), speed=2.0, sleep=delays.append)
+    mocker.patch.object(lxc_utils, "backend", replay)
+    assert lxc_utils.get_lxc_info(False) == [("101", "web", "RUNNING", "10.0.0.1", "true")]
+    assert lxc_utils.get_lxc_config("101") == {"hostname": " web", "memory": " 512"}
+    assert lxc_utils.read_hostname("101") == "web"
+    assert delays and delays[0] == pytest.approx(events[0]["dur"] / 2)
+
+    handle = lxc_utils.spawn_command([sys.executable, "-c", "raise SystemExit(3)"])
+    assert handle.wait(timeout=10) == 3
+
+
+def test_nested_calls_are_not_recorded(tmp_path, mocker):
+    class ListingBackend(SlowBackend):
+        def get_lxc_info(self, include_stopped=False):
+            lxc_utils.read_config("101")
+            return super().get_lxc_info(include_stopped)
+
+    trace = tmp_path / "trace.ndjson"
+    recorder = RecordingBackend(ListingBackend(), str(trace))
+    mocker.patch.object(lxc_utils, "backend", recorder)
+    lxc_utils.get_lxc_info(False)
+    lxc_utils.read_config("101")
+    recorder.close()
+    assert [e["op"] for e in load_trace(str(trace))] == ["get_lxc_info", "read_config"]
+
+
+def test_replay_without_delay_and_with_exhausted_answers(tmp_path):
+    trace = tmp_path / "trace.ndjson"
+    trace.write_text(
+        '{"t":0,"op":"get_state","args":["101"],"dur":5,"result":"RUNNING"}\n'
+        '{"t":1,"op":"get_state","args":["101"],"dur":5,"result":"STOPPED"}\n'
+    )
+    replay = ReplayBackend(str(trace), speed=0, sleep=lambda d: pytest.fail("slept"))
+    assert [replay.get_state("101") for _ in range(3)] == ["RUNNING", "STOPPED", "STOPPED"]
+    assert replay.get_state("999") is None
+
+
+def test_replay_handle_times_out_like_a_process():
+    now = [0.0]
+    handle = ReplayHandle(["lxc-stop", "-n", "101"], 0, 20.0, clock=lambda: now[0])
+    assert handle.poll() is None
+    with pytest.raises(subprocess.TimeoutExpired):
+        handle.wait(timeout=0)
+    now[0] = 20.0
+    assert handle.poll() == 0
+
+
+def test_replayed_processes_wait_with_the_injected_sleep(tmp_path, mocker):
+    trace = tmp_path / "trace.ndjson"
+    trace.write_text('{"t":0,"op":"spawn","args":[["lxc-stop","-n","101"]],"dur":4,"rc":0}\n')
+    delays = []
+    mocker.patch("lxc_tui.tracing.time.sleep", side_effect=AssertionError("real sleep"))
+    handle = ReplayBackend(str(trace), speed=2.0, sleep=delays.append).spawn(["lxc-stop", "-n", "101"])
+    with pytest.raises(subprocess.TimeoutExpired):
+        handle.wait(timeout=0.5)
+    assert handle.wait() == 0
+    assert delays == [0.5, pytest.approx(2.0, abs=0.1)]
+
+
+def test_attach_is_refused_while_replaying(mocker):
+    from lxc_tui.event_handler import attach_to_container
+
+    mocker.patch.object(tracing, "replaying", True)
+    run = mocker.patch("lxc_tui.event_handler.subprocess.run")
+    notify = mocker.patch("lxc_tui.event_handler.notify")
+    attach_to_container(mocker.Mock(), "101")
+    run.assert_not_called()
+    assert "replaying" in notify.call_args[0][0]
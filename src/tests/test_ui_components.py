@@ -31,4 +31,99 @@ def test_update_navigation_bar(mocker):
     mocker.patch('lxc_tui.core.curses', curses_mock)
 
     update_navigation_bar(stdscr, False, [], force=True)
-    stdscr.addstr.assert_called()
\ No newline at end of file
+    stdscr.addstr.assert_called()
+
+def test_update_navigation_bar_tracks_state_in_memory(mocker):
+    stdscr = mocker.Mock()
+    curses_mock = mocker.MagicMock()
+    curses_mock.LINES = 20
+    curses_mock.COLS = 100
+    mocker.patch('lxc_tui.ui_components.curses', curses_mock)
+    mocker.patch('lxc_tui.core.curses', curses_mock)
+
+    update_navigation_bar(stdscr, False, [], force=True)
+    stdscr.reset_mock()
+    update_navigation_bar(stdscr, False, [])
+    stdscr.addstr.assert_not_called()
+    stdscr.instr.assert_not_called()
+
+    curses_mock.COLS = 140
+    update_navigation_bar(stdscr, False, [])
+    stdscr.addstr.assert_called()
+
+
+def test_resize_debouncer_waits_for_burst_to_settle():
+    from lxc_tui.ui_components import ResizeDebouncer
+
+    debouncer = ResizeDebouncer(delay=0.1)
+    assert not debouncer.due(now=0.0)
+    for t in (0.0, 0.03, 0.06, 0.09):
+        debouncer.note(now=t)
+        assert not debouncer.due(now=t + 0.02)
+    assert debouncer.due(now=0.2)
+    debouncer.clear()
+    assert not debouncer.due(now=1.0)
+
+
+def test_low_bandwidth_redraw_skips_ip_only_changes(mocker):
+    from lxc_tui import ui_components
+
+    stdscr = mocker.Mock()
+    stdscr.getmaxyx.return_value = (20, 80)
+    curses_mock = mocker.MagicMock()
+    curses_mock.LINES = 20
+    curses_mock.COLS = 80
+    curses_mock.A_REVERSE = 1
+    curses_mock.A_BOLD = 2
+    mocker.patch('lxc_tui.ui_components.curses', curses_mock)
+    mocker.patch('lxc_tui.core.curses', curses_mock)
+    ui_components.set_low_bandwidth(True)
+    try:
+        lxc_info = [
+            ("101", "web", "RUNNING", "10.0.0.1", "true"),
+            ("102", "db", "RUNNING", "10.0.0.2", "true"),
+        ]
+        display_container_list(stdscr, lxc_info, 0)
+        assert stdscr.addstr.call_count > 3
+
+        stdscr.reset_mock()
+        lxc_info[1] = ("102", "db", "RUNNING", "10.0.0.99", "true")
+        display_container_list(stdscr, lxc_info, 0)
+        assert stdscr.addstr.call_count == 0
+
+        display_container_list(stdscr, lxc_info, 1)
+        rows = sorted(call.args[0] for call in stdscr.addstr.call_args_list)
+        assert rows == [1, 2]
+        attrs = {call.args[0]: call.args[3] for call in stdscr.addstr.call_args_list}
+        assert attrs == {1: 0, 2: 1}
+    finally:
+        ui_components.set_low_bandwidth(False)
+
+
+def test_changed_rows_repaint_the_selected_row_when_its_ip_arrives(mocker):
+    from lxc_tui import ui_components
+    from lxc_tui.layout import compute_column_layout
+
+    curses_mock = mocker.MagicMock()
+    curses_mock.LINES = 20
+    curses_mock.COLS = 100
+    mocker.patch('lxc_tui.ui_components.curses', curses_mock)
+    mocker.patch('lxc_tui.core.curses', curses_mock)
+    mocker.patch.dict(ui_components._rows_drawn, clear=True)
+    stdscr = mocker.Mock()
+    column_layout = compute_column_layout(100)
+    lxc_info = [
+        ("101", "web", "RUNNING", "", "true"),
+        ("102", "db", "RUNNING", "", "true"),
+    ]
+    ui_components.display_changed_rows(stdscr, lxc_info, 0, column_layout, 5)
+
+    stdscr.addstr.reset_mock()
+    lxc_info[1] = ("102", "db", "RUNNING", "10.0.0.6", "true")
+    ui_components.display_changed_rows(stdscr, lxc_info, 0, column_layout, 5)
+    stdscr.addstr.assert_not_called()
+
+    lxc_info[0] = ("101", "web", "RUNNING", "10.0.0.5", "true")
+    ui_components.display_changed_rows(stdscr, lxc_info, 0, column_layout, 5)
+    assert stdscr.addstr.call_count == 1
+    assert "10.0.0.5" in stdscr.addstr.call_args[0][2]